@@ -0,0 +1,97 @@
+"""Benchmark meeting list projections: payload size and latency per page.
+
+Loads --rows synthetic meetings into a scratch schema (as
+search_benchmark.py does) and times a page of ``get_meetings`` for each
+projection: every column (the old ``SELECT *`` listing), the summary
+projection list endpoints now use, and the fields the meeting cards
+request. Each run covers the query plus building the response the way
+the route does (validating through the response model and serializing
+to JSON); the median of --runs and the response size are reported.
+
+    cd backend
+    python benchmarks/list_projection_benchmark.py --rows 2000 --transcript-kb 60
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import asyncpg  # noqa: E402
+
+from db import database  # noqa: E402
+from models.schemas import MeetingResponse, MeetingSummaryResponse  # noqa: E402
+from precompression_benchmark import DEFAULT_FIXTURES, load_fixtures  # noqa: E402
+from search_benchmark import synthetic_meetings  # noqa: E402
+
+SCHEMA = "list_projection_benchmark"
+PROJECTIONS = [
+    ("all columns", database.MEETING_COLUMNS, MeetingResponse),
+    ("summary", database.MEETING_SUMMARY_COLUMNS, MeetingSummaryResponse),
+    ("card fields", ("id", "created_at", "title", "summary", "action_items", "participants", "duration"), MeetingSummaryResponse),
+]
+
+
+async def time_page(columns, model, page_size: int, runs: int):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # get_meetings logs every query
+            rows = await database.get_meetings(limit=page_size, columns=columns)
+        payload = json.dumps(
+            [model(**row).dict(exclude_unset=True) for row in rows], default=str
+        ).encode("utf-8")
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), len(payload)
+
+
+async def run(rows: int, runs: int, page_size: int, transcript_kb: int, keep: bool):
+    fixtures = load_fixtures(DEFAULT_FIXTURES)
+    admin = await asyncpg.connect(database.POSTGRES_URL)
+    await admin.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA}")
+    try:
+        database.pool = await asyncpg.create_pool(
+            dsn=database.POSTGRES_URL, min_size=1, max_size=2, server_settings={"search_path": SCHEMA}
+        )
+        await database.init_database()
+        async with database.pool.acquire() as conn:
+            await conn.copy_records_to_table(
+                "meetings",
+                records=synthetic_meetings(fixtures, rows, transcript_kb),
+                columns=["title", "summary", "transcript", "action_items", "objections", "crm_notes"],
+            )
+            await conn.execute("ANALYZE meetings")
+        print(f"Loaded {rows} meetings (~{transcript_kb} KB transcripts); page size {page_size}")
+
+        print(f"{'projection':<14}{'median ms':>11}{'payload KB':>12}")
+        for name, columns, model in PROJECTIONS:
+            median_ms, size = await time_page(columns, model, page_size, runs)
+            print(f"{name:<14}{median_ms:>11.1f}{size / 1024:>12.1f}")
+    finally:
+        if database.pool is not None:
+            await database.close_db_pool()
+        if not keep:
+            await admin.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await admin.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--page-size", type=int, default=50, help="Meetings per listing, as GET /meetings/?limit=")
+    parser.add_argument("--transcript-kb", type=int, default=60, help="Approximate transcript size per meeting")
+    parser.add_argument("--keep", action="store_true", help=f"Keep the {SCHEMA} schema for inspection")
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.runs, args.page_size, args.transcript_kb, args.keep))
+
+
+if __name__ == "__main__":
+    main()
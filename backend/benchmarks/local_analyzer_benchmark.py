@@ -0,0 +1,112 @@
+"""Benchmark the local extractive analyzer: latency and action-item/objection recall.
+
+Each fixture is analyzed --runs times; the median time and the keyword
+recall against the fixture's expected action items and objections are
+reported. A synthetic long meeting (all fixtures repeated --long-repeat
+times) shows how latency grows with transcript length.
+
+With --llm the same fixtures are also analyzed by the configured model
+backend (e.g. LLM_BACKEND=stub with stub_llm_server.py running) for a
+side-by-side comparison.
+
+    cd backend
+    python benchmarks/local_analyzer_benchmark.py --runs 20
+    LLM_BACKEND=stub python benchmarks/local_analyzer_benchmark.py --llm
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from utils.local_analyzer import analyze_locally  # noqa: E402
+from precompression_benchmark import DEFAULT_FIXTURES, keyword_recall, load_fixtures  # noqa: E402
+
+
+def recall(fixture, analysis):
+    tasks = [str(item.get("task", "")) for item in analysis.get("action_items", [])]
+    concerns = [str(item.get("concern", "")) for item in analysis.get("objections", [])]
+    return (
+        keyword_recall(fixture.get("expected_action_items", []), tasks),
+        keyword_recall(fixture.get("expected_objections", []), concerns),
+    )
+
+
+def time_local(transcript: str, runs: int):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        analysis = analyze_locally(transcript)
+        timings.append((time.perf_counter() - start) * 1000)
+    return analysis, statistics.median(timings)
+
+
+def bench_local(fixtures, runs: int, long_repeat: int):
+    print(f"{'fixture':<20}{'chars':>8}{'ms':>9}{'items':>7}{'objs':>6}{'act rec':>9}{'obj rec':>9}")
+    action_recalls, objection_recalls = [], []
+    for fixture in fixtures:
+        analysis, median_ms = time_local(fixture["transcript"], runs)
+        action_recall, objection_recall = recall(fixture, analysis)
+        action_recalls.append(action_recall)
+        objection_recalls.append(objection_recall)
+        print(
+            f"{fixture['name']:<20}{len(fixture['transcript']):>8}{median_ms:>9.2f}"
+            f"{len(analysis['action_items']):>7}{len(analysis['objections']):>6}"
+            f"{action_recall * 100:>8.0f}%{objection_recall * 100:>8.0f}%"
+        )
+    print(f"{'mean':<20}{'':>8}{'':>9}{'':>7}{'':>6}"
+          f"{statistics.mean(action_recalls) * 100:>8.0f}%{statistics.mean(objection_recalls) * 100:>8.0f}%")
+
+    if long_repeat > 1:
+        long_transcript = " ".join(fixture["transcript"] for fixture in fixtures) * long_repeat
+        _, median_ms = time_local(long_transcript, max(1, runs // 5))
+        print(f"{'long':<20}{len(long_transcript):>8}{median_ms:>9.2f}")
+
+
+async def bench_llm(fixtures):
+    from services.llm_service import LLMService
+
+    llm_service = LLMService()
+    rows = []
+    try:
+        for fixture in fixtures:
+            start = time.perf_counter()
+            analysis = await llm_service.analyze_transcript(fixture["transcript"], bypass_cache=True)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            action_recall, objection_recall = recall(fixture, analysis)
+            rows.append({
+                "fixture": fixture["name"],
+                "llm_ms": round(elapsed_ms, 1),
+                "fallback": bool(analysis.get("is_fallback")),
+                "action_item_recall": round(action_recall, 3),
+                "objection_recall": round(objection_recall, 3),
+            })
+    finally:
+        await llm_service.close()
+    print(json.dumps(rows, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    parser.add_argument("--runs", type=int, default=10, help="Timed analyses per fixture")
+    parser.add_argument("--long-repeat", type=int, default=20, help="Repetitions of the combined fixtures for the long meeting (1 disables)")
+    parser.add_argument("--llm", action="store_true", help="Also analyze the fixtures with the configured model backend")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        sys.exit(f"No fixtures found in {args.fixtures}")
+    bench_local(fixtures, args.runs, args.long_repeat)
+    if args.llm:
+        os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+        asyncio.run(bench_llm(fixtures))
+
+
+if __name__ == "__main__":
+    main()
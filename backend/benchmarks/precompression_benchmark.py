@@ -0,0 +1,119 @@
+"""Benchmark transcript pre-compression: token savings, latency and quality.
+
+Without --llm only the compression step runs (no API key needed): token
+counts before/after, compression time, and how many of each fixture's
+expected action-item/objection keywords survive compression.
+
+With --llm every fixture is analyzed with pre-compression off and on,
+using whatever backend the environment selects (e.g. LLM_BACKEND=stub with
+stub_llm_server.py running), and end-to-end latency plus action-item /
+objection recall against the fixture expectations are compared.
+
+    cd backend
+    python benchmarks/precompression_benchmark.py
+    LLM_BACKEND=stub python benchmarks/precompression_benchmark.py --llm --runs 3
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from utils.transcript_compressor import compress_transcript  # noqa: E402
+
+DEFAULT_FIXTURES = os.path.join(BACKEND_DIR, "benchmarks", "fixtures", "transcripts")
+
+
+def load_fixtures(directory: str):
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        with open(path, "r", encoding="utf-8") as fixture_file:
+            fixtures.append(json.load(fixture_file))
+    return fixtures
+
+
+def keyword_recall(expected, texts) -> float:
+    """Share of expected keyword groups fully present in at least one of ``texts``"""
+    if not expected:
+        return 1.0
+    lowered = [text.lower() for text in texts]
+    found = sum(1 for keywords in expected if any(all(k in text for k in keywords) for text in lowered))
+    return found / len(expected)
+
+
+def bench_compression(fixtures):
+    print(f"{'fixture':<20}{'tokens':>8}{'->':>4}{'after':>7}{'saved':>8}{'ms':>8}{'kw kept':>9}")
+    totals_before = totals_after = 0
+    for fixture in fixtures:
+        transcript = fixture["transcript"]
+        start = time.perf_counter()
+        compressed, stats = compress_transcript(transcript)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        expected = fixture.get("expected_action_items", []) + fixture.get("expected_objections", [])
+        kept = keyword_recall(expected, [compressed])
+        totals_before += stats["tokens_before"]
+        totals_after += stats["tokens_after"]
+        print(
+            f"{fixture['name']:<20}{stats['tokens_before']:>8}{'':>4}{stats['tokens_after']:>7}"
+            f"{stats['reduction'] * 100:>7.1f}%{elapsed_ms:>8.2f}{kept * 100:>8.0f}%"
+        )
+    if totals_before:
+        print(f"{'total':<20}{totals_before:>8}{'':>4}{totals_after:>7}{(1 - totals_after / totals_before) * 100:>7.1f}%")
+
+
+async def bench_llm(fixtures, runs: int):
+    from services.llm_service import LLMService
+
+    llm_service = LLMService()
+    results = {}
+    try:
+        for enabled in (False, True):
+            llm_service.precompress["enabled"] = enabled
+            latencies, action_recall, objection_recall = [], [], []
+            for fixture in fixtures:
+                for _ in range(runs):
+                    start = time.perf_counter()
+                    analysis = await llm_service.analyze_transcript(fixture["transcript"], bypass_cache=True)
+                    latencies.append(time.perf_counter() - start)
+                    tasks = [str(item.get("task", "")) for item in analysis.get("action_items", [])]
+                    concerns = [str(item.get("concern", "")) for item in analysis.get("objections", [])]
+                    action_recall.append(keyword_recall(fixture.get("expected_action_items", []), tasks))
+                    objection_recall.append(keyword_recall(fixture.get("expected_objections", []), concerns))
+            results["on" if enabled else "off"] = {
+                "median_latency_s": round(statistics.median(latencies), 3),
+                "mean_latency_s": round(statistics.mean(latencies), 3),
+                "action_item_recall": round(statistics.mean(action_recall), 3),
+                "objection_recall": round(statistics.mean(objection_recall), 3),
+            }
+        results["compression"] = llm_service.compression_stats()
+    finally:
+        await llm_service.close()
+
+    print(json.dumps(results, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    parser.add_argument("--llm", action="store_true", help="Also run full analyses with the stage off and on")
+    parser.add_argument("--runs", type=int, default=1, help="Analyses per fixture and setting (with --llm)")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        sys.exit(f"No fixtures found in {args.fixtures}")
+    bench_compression(fixtures)
+    if args.llm:
+        # Keep cached results from hiding the latency difference
+        os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+        asyncio.run(bench_llm(fixtures, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark meeting search: ILIKE substring scan vs the GIN-indexed tsvector.
+
+Creates a scratch schema in the database POSTGRES_URL points at, fills it
+with --rows synthetic meetings built from the transcript fixtures, and
+times each search mode of ``get_meetings`` for a few terms (median of
+--runs). The plan's scan nodes show whether the index was used. The
+schema is dropped afterwards unless --keep is given.
+
+    cd backend
+    python benchmarks/search_benchmark.py --rows 20000 --runs 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import asyncpg  # noqa: E402
+
+from db import database  # noqa: E402
+from precompression_benchmark import DEFAULT_FIXTURES, load_fixtures  # noqa: E402
+
+SCHEMA = "search_benchmark"
+TERMS = ["pricing", "onboarding", "migration", "rate limits", "globex"]
+FILLER_WORDS = (
+    "quarter roadmap customer pipeline forecast budget design review hiring contract support renewal "
+    "integration dashboard report analytics security compliance training launch feedback timeline"
+).split()
+
+
+def synthetic_meetings(fixtures, rows: int, transcript_kb: int):
+    rng = random.Random(42)
+    sentences = [s for fixture in fixtures for s in fixture["transcript"].split(". ") if s]
+    for index in range(rows):
+        body = []
+        while sum(len(s) for s in body) < transcript_kb * 1024:
+            body.append(rng.choice(sentences) if rng.random() < 0.3 else " ".join(rng.choices(FILLER_WORDS, k=12)))
+        # A rare term, to show selective lookups
+        if index % 500 == 0:
+            body.insert(rng.randrange(len(body)), "Globex asked about the export limits")
+        transcript = ". ".join(body)
+        yield (
+            f"Meeting {index}: {' '.join(rng.choices(FILLER_WORDS, k=3))}",
+            " ".join(rng.choices(sentences, k=2))[:300],
+            transcript,
+            "[]",
+            "[]",
+            " ".join(rng.choices(FILLER_WORDS, k=20)),
+        )
+
+
+async def scan_nodes(conn, query: str, values) -> str:
+    """The scans in the plan, e.g. "Bitmap Index Scan (idx_meetings_search_vector)" """
+    plan = await conn.fetchval(f"EXPLAIN (FORMAT JSON) {query}", *values)
+    scans = []
+    pending = [json.loads(plan)[0]["Plan"]]
+    while pending:
+        node = pending.pop(0)
+        if node["Node Type"].endswith("Scan") and node["Node Type"] != "CTE Scan":
+            label = f"{node['Node Type']} ({node.get('Index Name') or node.get('Relation Name')})"
+            if label not in scans:
+                scans.append(label)
+        pending.extend(node.get("Plans", []))
+    return ", ".join(scans)
+
+
+async def run(rows: int, runs: int, transcript_kb: int, keep: bool):
+    fixtures = load_fixtures(DEFAULT_FIXTURES)
+    admin = await asyncpg.connect(database.POSTGRES_URL)
+    await admin.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA}")
+    try:
+        database.pool = await asyncpg.create_pool(
+            dsn=database.POSTGRES_URL, min_size=1, max_size=2, server_settings={"search_path": SCHEMA}
+        )
+        await database.init_database()
+        async with database.pool.acquire() as conn:
+            start = time.perf_counter()
+            await conn.copy_records_to_table(
+                "meetings",
+                records=synthetic_meetings(fixtures, rows, transcript_kb),
+                columns=["title", "summary", "transcript", "action_items", "objections", "crm_notes"],
+            )
+            await conn.execute("ANALYZE meetings")
+            print(f"Loaded {rows} meetings (~{transcript_kb} KB transcripts) in {time.perf_counter() - start:.1f}s")
+
+            print(f"{'term':<14}{'mode':<10}{'median ms':>11}{'rows':>9}  scan")
+            for term in TERMS:
+                for mode in ("ilike", "fulltext", "ranked"):
+                    query, values = database.build_meetings_query(limit=50, search=term, search_mode=mode)
+                    timings = []
+                    for _ in range(runs):
+                        start = time.perf_counter()
+                        found = await conn.fetch(query, *values)
+                        timings.append((time.perf_counter() - start) * 1000)
+                    scans = await scan_nodes(conn, query, values)
+                    print(f"{term:<14}{mode:<10}{statistics.median(timings):>11.1f}{len(found):>9}  {scans}")
+    finally:
+        if database.pool is not None:
+            await database.close_db_pool()
+        if not keep:
+            await admin.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await admin.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--transcript-kb", type=int, default=20, help="Approximate transcript size per meeting")
+    parser.add_argument("--keep", action="store_true", help=f"Keep the {SCHEMA} schema for inspection")
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.runs, args.transcript_kb, args.keep))
+
+
+if __name__ == "__main__":
+    main()
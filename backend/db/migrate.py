@@ -0,0 +1,129 @@
+import os
+import re
+from typing import List, NamedTuple
+
+# Ordered schema changes: NNNN_description.sql, applied once each by version
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+MIGRATION_FILE_RE = re.compile(r"^(\d+)_(\w+)\.sql$")
+# First line of a migration that must run outside a transaction (CREATE INDEX CONCURRENTLY)
+NO_TRANSACTION_MARKER = "-- migrate: no-transaction"
+# Session advisory lock held while migrating, so only one instance applies migrations at startup
+MIGRATION_LOCK_ID = 4_212_608_117
+
+CONCURRENT_INDEX_RE = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)", re.IGNORECASE
+)
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    sql: str
+    transactional: bool
+
+
+def load_migrations(directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    migrations = []
+    for filename in sorted(os.listdir(directory)):
+        match = MIGRATION_FILE_RE.match(filename)
+        if not match:
+            continue
+        with open(os.path.join(directory, filename), encoding="utf-8") as f:
+            sql = f.read()
+        migrations.append(Migration(
+            version=int(match.group(1)),
+            name=match.group(2),
+            sql=sql,
+            transactional=not sql.lstrip().startswith(NO_TRANSACTION_MARKER),
+        ))
+    migrations.sort(key=lambda migration: migration.version)
+    versions = [migration.version for migration in migrations]
+    if len(set(versions)) != len(versions):
+        raise ValueError(f"Duplicate migration versions in {directory}")
+    return migrations
+
+
+def split_statements(sql: str) -> List[str]:
+    """Statements of a migration that ends each one with ";" at the end of a line.
+
+    Postgres runs a multi-statement string as one implicit transaction,
+    which CREATE INDEX CONCURRENTLY (and COMMIT inside a DO block) refuses,
+    so these are sent one by one. A ";" inside a $$-quoted body does not
+    end the statement.
+    """
+    statements = []
+    current: List[str] = []
+    in_dollar_quote = False
+    for line in sql.splitlines():
+        if not in_dollar_quote and line.strip().startswith("--"):
+            continue
+        current.append(line)
+        if line.count("$$") % 2:
+            in_dollar_quote = not in_dollar_quote
+        if not in_dollar_quote and re.search(r";[ \t]*$", line):
+            statements.append("\n".join(current).strip())
+            current = []
+    if "\n".join(current).strip():
+        statements.append("\n".join(current).strip())
+    return statements
+
+
+async def _drop_invalid_indexes(conn, sql: str, timeout: float):
+    """Drop indexes a failed concurrent build left behind as INVALID, so IF NOT EXISTS retries them"""
+    names = CONCURRENT_INDEX_RE.findall(sql)
+    if not names:
+        return
+    rows = await conn.fetch("""
+        SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE NOT i.indisvalid AND c.relname = ANY($1::text[]) AND pg_table_is_visible(c.oid)
+    """, names)
+    for row in rows:
+        print(f"⚠️ Dropping invalid index {row['relname']} from an interrupted migration")
+        await conn.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{row["relname"]}"', timeout=timeout)
+
+
+async def apply_migrations(conn) -> List[int]:
+    """Apply pending migrations in version order; returns the versions applied.
+
+    Holds an advisory lock for the duration, so instances starting
+    together wait for the first one instead of racing it. Each migration
+    and its schema_migrations row commit together; no-transaction
+    migrations are recorded after their last statement succeeds, and
+    their statements must be safe to re-run (IF NOT EXISTS).
+    """
+    # Per statement; concurrent index builds on a large table outlast the pool's command_timeout
+    timeout = float(os.getenv("DB_MIGRATION_TIMEOUT_SECONDS", "3600"))
+    await conn.execute("SELECT pg_advisory_lock($1)", MIGRATION_LOCK_ID, timeout=timeout)
+    try:
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMPTZ DEFAULT NOW()
+            );
+        """)
+        applied = {row["version"] for row in await conn.fetch("SELECT version FROM schema_migrations")}
+        newly_applied = []
+        for migration in load_migrations():
+            if migration.version in applied:
+                continue
+            print(f"🔧 Applying migration {migration.version:04d}_{migration.name}")
+            if migration.transactional:
+                async with conn.transaction():
+                    await conn.execute(migration.sql, timeout=timeout)
+                    await conn.execute(
+                        "INSERT INTO schema_migrations (version, name) VALUES ($1, $2)",
+                        migration.version, migration.name
+                    )
+            else:
+                await _drop_invalid_indexes(conn, migration.sql, timeout)
+                for statement in split_statements(migration.sql):
+                    await conn.execute(statement, timeout=timeout)
+                await conn.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES ($1, $2)",
+                    migration.version, migration.name
+                )
+            newly_applied.append(migration.version)
+        return newly_applied
+    finally:
+        await conn.execute("SELECT pg_advisory_unlock($1)", MIGRATION_LOCK_ID)
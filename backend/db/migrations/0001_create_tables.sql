@@ -0,0 +1,39 @@
+-- Base tables (previously created by init_database)
+CREATE TABLE IF NOT EXISTS meetings (
+    id SERIAL PRIMARY KEY,
+    title TEXT NOT NULL,
+    summary TEXT,
+    transcript TEXT,
+    action_items JSONB,
+    objections JSONB,
+    crm_notes TEXT,
+    participants INTEGER,
+    duration TEXT,
+    client TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS action_items (
+    id SERIAL PRIMARY KEY,
+    meeting_id INTEGER REFERENCES meetings(id) ON DELETE CASCADE,
+    task TEXT NOT NULL,
+    assignee TEXT,
+    due_date TEXT,
+    priority TEXT DEFAULT 'medium',
+    completed BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS upload_jobs (
+    id TEXT PRIMARY KEY,
+    stage TEXT NOT NULL DEFAULT 'queued',
+    filename TEXT,
+    file_path TEXT,
+    file_size BIGINT,
+    audio_hash TEXT,
+    error TEXT,
+    timings JSONB,
+    result JSONB,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
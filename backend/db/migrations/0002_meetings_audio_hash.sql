@@ -0,0 +1,4 @@
+-- Audio content hash, used to skip re-processing identical uploads.
+-- Nullable columns without a default: a catalog change, no table rewrite.
+ALTER TABLE meetings ADD COLUMN IF NOT EXISTS audio_hash TEXT;
+ALTER TABLE meetings ADD COLUMN IF NOT EXISTS pipeline_version TEXT;
@@ -0,0 +1,3 @@
+-- migrate: no-transaction
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_meetings_audio_hash
+    ON meetings (audio_hash, pipeline_version) WHERE audio_hash IS NOT NULL;
@@ -0,0 +1,26 @@
+-- Full-text search: weighted title (A), summary (B), CRM notes (C) and transcript (D).
+-- A plain nullable column kept current by a trigger, rather than a STORED generated
+-- column, which would rewrite the whole table under an exclusive lock. Existing rows
+-- are filled by 0005 in batches; the GIN index is built concurrently by 0006.
+-- The text search configuration must match SEARCH_CONFIG in db/database.py.
+CREATE OR REPLACE FUNCTION meetings_search_vector(title TEXT, summary TEXT, crm_notes TEXT, transcript TEXT)
+RETURNS tsvector LANGUAGE sql IMMUTABLE AS $$
+    SELECT setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(crm_notes, '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(transcript, '')), 'D')
+$$;
+
+ALTER TABLE meetings ADD COLUMN IF NOT EXISTS search_vector tsvector;
+
+CREATE OR REPLACE FUNCTION meetings_search_vector_update() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := meetings_search_vector(NEW.title, NEW.summary, NEW.crm_notes, NEW.transcript);
+    RETURN NEW;
+END
+$$;
+
+DROP TRIGGER IF EXISTS meetings_search_vector_update ON meetings;
+CREATE TRIGGER meetings_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, summary, crm_notes, transcript ON meetings
+    FOR EACH ROW EXECUTE FUNCTION meetings_search_vector_update();
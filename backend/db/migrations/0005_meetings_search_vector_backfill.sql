@@ -0,0 +1,19 @@
+-- migrate: no-transaction
+-- Fill search_vector for rows that predate the trigger, committing every 500 ids so
+-- no long transaction holds row locks; new and updated rows are handled by the trigger.
+-- Safe to re-run: only rows still NULL are touched.
+DO $$
+DECLARE
+    last_id INTEGER := 0;
+    max_id INTEGER;
+BEGIN
+    SELECT coalesce(max(id), 0) INTO max_id FROM meetings;
+    WHILE last_id < max_id LOOP
+        UPDATE meetings
+        SET search_vector = meetings_search_vector(title, summary, crm_notes, transcript)
+        WHERE id > last_id AND id <= last_id + 500 AND search_vector IS NULL;
+        last_id := last_id + 500;
+        COMMIT;
+    END LOOP;
+END
+$$;
@@ -0,0 +1,3 @@
+-- migrate: no-transaction
+-- GIN index for @@ lookups
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_meetings_search_vector ON meetings USING GIN (search_vector);
@@ -0,0 +1,7 @@
+-- migrate: no-transaction
+-- Listings, /meetings/recent and cursor pagination walk these in (created_at, id) order;
+-- the completed variant serves the action item filter
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_meetings_created_at_id ON meetings (created_at DESC, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_action_items_created_at_id ON action_items (created_at DESC, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_action_items_completed_created_at_id
+    ON action_items (completed, created_at DESC, id DESC);
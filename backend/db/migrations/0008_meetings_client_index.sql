@@ -0,0 +1,4 @@
+-- migrate: no-transaction
+-- get_recent_clients: DISTINCT ON (client) ... ORDER BY client, created_at DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_meetings_client_created_at
+    ON meetings (client, created_at DESC) WHERE client IS NOT NULL AND client <> '';
@@ -0,0 +1,3 @@
+-- migrate: no-transaction
+-- Foreign key lookups: the action_items join and ON DELETE CASCADE from meetings
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_action_items_meeting_id ON action_items (meeting_id);
@@ -1,4 +1,4 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import APIRouter, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 import os
@@ -6,12 +6,17 @@ from datetime import datetime
 from contextlib import asynccontextmanager
 import logging
 import sys
+import asyncio
 
-from routes import upload, meetings, actions, export, email
-from db.database import init_database, close_db_pool
+# Nothing at import time may construct services: spawned worker processes
+# (long-audio transcription) re-import this module as __mp_main__. The app
+# and everything it wires up are built by create_app() in the server only.
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    from routes import upload
+    from db.database import init_database, close_db_pool
+
     # Setup logging for Render deployment
     setup_render_logging()
     
@@ -19,10 +24,21 @@ async def lifespan(app: FastAPI):
     print("🚀 Starting up the application...", flush=True)
     print("🚀 Starting up the application...", file=sys.stderr, flush=True)
     await init_database()
+    await upload.job_service.start()
+    
+    # Optionally load (and warm up) the Whisper model pool so the first upload doesn't pay for it
+    preload_task = None
+    if os.getenv("WHISPER_PRELOAD", "false").lower() == "true":
+        warmup = os.getenv("WHISPER_WARMUP", "true").lower() == "true"
+        preload_task = asyncio.create_task(asyncio.to_thread(upload.whisper_service.preload, warmup))
     yield
     # Shutdown
     print("🛑 Shutting down the application...", flush=True)
     print("🛑 Shutting down the application...", file=sys.stderr, flush=True)
+    if preload_task is not None and not preload_task.done():
+        preload_task.cancel()
+    await upload.job_service.stop()
+    await upload.llm_service.close()
     await close_db_pool()
 
 def setup_render_logging():
@@ -49,47 +65,15 @@ def setup_render_logging():
     print("📊 Logging configured for Render deployment", flush=True)
     print("📊 Logging configured for Render deployment", file=sys.stderr, flush=True)
 
-app = FastAPI(
-    title="AI Meeting Summary API",
-    description="Backend API for AI Meeting Summary + CRM Note Generator",
-    version="1.0.0",
-    lifespan=lifespan
-)
-
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",  # Local Vite dev server
-        "http://localhost:8000",  # Local backend
-        "http://localhost:4173",  # Local Vite preview
-        "http://localhost:5173",  # Local Vite dev server (alternative port)
-        "https://meetsnap.onrender.com",  # Your actual frontend URL
-        "https://ai-meeting-backend-api.onrender.com",  # Your actual backend URL
-        "https://*.onrender.com"  # Allow all Render domains
-    ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Initialize database
-# init_database()  # Remove this line since we're using lifespan now
+router = APIRouter()
 
-# Include routers
-app.include_router(upload.router, prefix="/upload", tags=["upload"])
-app.include_router(meetings.router, prefix="/meetings", tags=["meetings"])
-app.include_router(actions.router, prefix="/action-items", tags=["actions"])
-app.include_router(export.router, prefix="/export", tags=["export"])
-app.include_router(email.router, prefix="/email", tags=["email"])
-
-@app.get("/")
-@app.head("/")
+@router.get("/")
+@router.head("/")
 async def root():
     return {"message": "AI Meeting Summary API is running"}
 
-@app.get("/health")
-@app.head("/health")
+@router.get("/health")
+@router.head("/health")
 async def health_check():
     health_status = {
         "status": "healthy", 
@@ -100,10 +84,42 @@ async def health_check():
     # Check Whisper service
     try:
         from routes.upload import whisper_service
-        health_status["services"]["whisper"] = "ready" if whisper_service.model else "loading"
+        pool_status = whisper_service.model_pool.status()
+        # Models load on first use unless preloaded, so "not_loaded" is still a healthy state
+        health_status["services"]["whisper"] = pool_status["state"]
+        health_status["services"]["whisper_pool"] = {
+            "loaded": pool_status["loaded"],
+            "pool_size": pool_status["pool_size"],
+            "in_use": pool_status["in_use"],
+            "warmed_up": pool_status["warmed_up"]
+        }
     except Exception as e:
         health_status["services"]["whisper"] = f"error: {str(e)}"
     
+    # Check LLM backend (an open circuit means calls are failing fast)
+    try:
+        from routes.upload import llm_service
+        backend_stats = llm_service.backend_stats()
+        health_status["services"]["llm"] = {
+            "backend": backend_stats["backend"],
+            "circuit": backend_stats["circuit_breaker"]["state"]
+        }
+    except Exception as e:
+        health_status["services"]["llm"] = f"error: {str(e)}"
+    
+    # Check upload job workers
+    try:
+        from routes.upload import job_service, admission_controller
+        admission = admission_controller.stats()
+        health_status["services"]["jobs"] = {
+            "workers": len(job_service.workers),
+            "queue_depth": job_service.queue.qsize() if job_service.queue else 0,
+            "admission_queue_depth": admission["queue_depth"],
+            "avg_admission_wait_seconds": admission["avg_wait_seconds"]
+        }
+    except Exception as e:
+        health_status["services"]["jobs"] = f"error: {str(e)}"
+    
     # Check database
     try:
         from db.database import pool
@@ -113,7 +129,24 @@ async def health_check():
     
     return health_status
 
-@app.get("/debug/status")
+@router.get("/metrics")
+async def metrics():
+    """Counters for caches, deduplication and admission control"""
+    from routes.upload import whisper_service, llm_service, admission_controller, dedup_stats
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "audio_dedup": dedup_stats,
+        "admission": admission_controller.stats(),
+        "transcript_cache": whisper_service.transcript_cache.stats(),
+        "llm_cache": llm_service.cache_stats(),
+        "llm_backend": llm_service.backend_stats(),
+        "llm_precompression": llm_service.compression_stats(),
+        "llm_local": llm_service.local_stats(),
+        "llm_batching": llm_service.batch_stats(),
+        "llm_output": llm_service.output_stats()
+    }
+
+@router.get("/debug/status")
 async def debug_status():
     """Detailed debug status for troubleshooting"""
     debug_info = {
@@ -134,8 +167,10 @@ async def debug_status():
     try:
         from routes.upload import whisper_service
         debug_info["services"]["whisper"] = {
-            "model_loaded": whisper_service.model is not None,
+            "model_loaded": whisper_service.model_pool.status()["loaded"] > 0,
             "model_name": whisper_service.model_name,
+            "model_pool": whisper_service.model_pool.status(),
+            "transcript_cache": whisper_service.transcript_cache.stats(),
             "ffmpeg_available": whisper_service._verify_ffmpeg()
         }
     except Exception as e:
@@ -146,7 +181,11 @@ async def debug_status():
         from routes.upload import llm_service
         debug_info["services"]["llm"] = {
             "service_available": llm_service is not None,
-            "type": type(llm_service).__name__
+            "type": type(llm_service).__name__,
+            "backend": llm_service.backend_stats(),
+            "model_name": llm_service.model_name,
+            "prompt_version": llm_service.PROMPT_VERSION,
+            "cache": llm_service.cache_stats()
         }
     except Exception as e:
         debug_info["services"]["llm"]["error"] = str(e)
@@ -163,6 +202,44 @@ async def debug_status():
     
     return debug_info
 
+def create_app() -> FastAPI:
+    """Build the API with all routes; services are constructed when the routes are imported"""
+    from routes import upload, meetings, actions, export, email
+
+    app = FastAPI(
+        title="AI Meeting Summary API",
+        description="Backend API for AI Meeting Summary + CRM Note Generator",
+        version="1.0.0",
+        lifespan=lifespan
+    )
+
+    # CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[
+            "http://localhost:3000",  # Local Vite dev server
+            "http://localhost:8000",  # Local backend
+            "http://localhost:4173",  # Local Vite preview
+            "http://localhost:5173",  # Local Vite dev server (alternative port)
+            "https://meetsnap.onrender.com",  # Your actual frontend URL
+            "https://ai-meeting-backend-api.onrender.com",  # Your actual backend URL
+            "https://*.onrender.com"  # Allow all Render domains
+        ],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],  # Pagination cursor for list endpoints
+    )
+
+    # Include routers
+    app.include_router(upload.router, prefix="/upload", tags=["upload"])
+    app.include_router(meetings.router, prefix="/meetings", tags=["meetings"])
+    app.include_router(actions.router, prefix="/action-items", tags=["actions"])
+    app.include_router(export.router, prefix="/export", tags=["export"])
+    app.include_router(email.router, prefix="/email", tags=["email"])
+    app.include_router(router)
+    return app
+
 if __name__ == "__main__":
     # Memory optimization for 512MB limit
     import gc
@@ -179,7 +256,8 @@ if __name__ == "__main__":
     print(f"💾 Memory optimization enabled", flush=True)
     
     uvicorn.run(
-        "main:app",
+        "main:create_app",
+        factory=True,
         host="0.0.0.0",
         port=port,
         reload=False,  # Disable reload in production
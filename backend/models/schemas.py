@@ -1,9 +1,12 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from datetime import datetime
 
 class TextUploadRequest(BaseModel):
     content: str
+    bypass_cache: bool = False
+    # "local" skips the model and returns the extractive analysis immediately
+    analysis_mode: Literal["auto", "single", "passes", "map_reduce", "local"] = "auto"
 
 class ActionItem(BaseModel):
     task: str
@@ -23,6 +26,20 @@ class UploadResponse(BaseModel):
     objections: List[Objection]
     crm_notes: str
 
+class UploadJobResponse(BaseModel):
+    job_id: str
+    stage: str
+    filename: Optional[str] = None
+    error: Optional[str] = None
+    timings: Dict[str, float] = {}
+    result: Optional[UploadResponse] = None
+    # Fields and items streamed so far while the analysis is still running
+    partial: Optional[Dict[str, Any]] = None
+    # Local extractive analysis shown until the model's result is ready
+    provisional: Optional[Dict[str, Any]] = None
+    created_at: Optional[datetime] = None
+    queue_depth: int = 0
+
 class MeetingResponse(BaseModel):
     id: int
     title: str
@@ -35,12 +52,31 @@ class MeetingResponse(BaseModel):
     participants: Optional[int] = None
     duration: Optional[str] = None
     client: Optional[str] = None
+    # Set by ranked search only
+    rank: Optional[float] = None
+    snippet: Optional[str] = None
+
+class MeetingSummaryResponse(BaseModel):
+    """A meeting in list views: no transcript, and with ``?fields=`` only the selected fields"""
+    id: int
+    created_at: datetime
+    title: Optional[str] = None
+    summary: Optional[str] = None
+    action_items: Optional[List[ActionItem]] = None
+    objections: Optional[List[Objection]] = None
+    crm_notes: Optional[str] = None
+    participants: Optional[int] = None
+    duration: Optional[str] = None
+    client: Optional[str] = None
+    # Ranked search only
+    rank: Optional[float] = None
+    snippet: Optional[str] = None
 
 class MeetingListResponse(BaseModel):
-    meetings: List[MeetingResponse]
-    total: int
-    page: int
-    per_page: int
+    meetings: List[MeetingSummaryResponse]
+    # Pass back as ?cursor= for the next page; None on the last page
+    next_cursor: Optional[str] = None
+    limit: int
 
 class ActionItemResponse(BaseModel):
     id: int
@@ -53,6 +89,11 @@ class ActionItemResponse(BaseModel):
     meeting_title: str
     created_at: datetime
 
+class ActionItemListResponse(BaseModel):
+    action_items: List[ActionItemResponse]
+    next_cursor: Optional[str] = None
+    limit: int
+
 class ActionItemUpdate(BaseModel):
     completed: Optional[bool] = None
     assignee: Optional[str] = None
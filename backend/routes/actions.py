@@ -1,16 +1,37 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Response
+from typing import List, Optional, Union
 
-from models.schemas import ActionItemResponse, ActionItemUpdate
+from models.schemas import ActionItemResponse, ActionItemListResponse, ActionItemUpdate
 from db.database import get_action_items, update_action_item_status
+from utils.pagination import decode_cursor, next_page, InvalidCursorError
 
 router = APIRouter()
 
-@router.get("/", response_model=List[ActionItemResponse])
-async def get_all_action_items():
-    """Get all action items"""
+@router.get("/", response_model=Union[List[ActionItemResponse], ActionItemListResponse])
+async def get_all_action_items(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    completed: Optional[bool] = None,
+    cursor: Optional[str] = None,
+):
+    """Get action items, newest first.
+
+    The next page's cursor is in the ``X-Next-Cursor`` header; passing
+    ``cursor`` (empty for the first page) returns an
+    ``ActionItemListResponse`` with ``next_cursor`` instead of a bare list.
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     try:
-        action_items = await get_action_items()
+        rows = await get_action_items(completed=completed, limit=limit + 1, after=after)
+        action_items, next_cursor = next_page(rows, limit)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        if cursor is not None:
+            return ActionItemListResponse(action_items=action_items, next_cursor=next_cursor, limit=limit)
         return action_items
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -10,28 +10,54 @@ from utils.export_utils import format_meetings_for_csv, format_action_items_for_
 
 router = APIRouter()
 
+# Exports are streamed a page at a time, so memory stays bounded by one page however many rows there are
+EXPORT_PAGE_SIZE = 200
+
+async def _pages(fetch_page, first_page: list):
+    """Walk a keyset-paginated listing, starting from an already fetched first page"""
+    page = first_page
+    while True:
+        yield page
+        if len(page) < EXPORT_PAGE_SIZE:
+            return
+        page = await fetch_page(limit=EXPORT_PAGE_SIZE, after=(page[-1]["created_at"], page[-1]["id"]))
+
+async def _json_chunks(pages):
+    """A JSON array written one row at a time"""
+    first = True
+    yield "["
+    async for page in pages:
+        for row in page:
+            yield ("\n" if first else ",\n") + json.dumps(row, indent=2, default=str)
+            first = False
+    yield "]" if first else "\n]"
+
+async def _csv_chunks(pages, format_page):
+    first = True
+    async for page in pages:
+        yield format_page(page, include_header=first)
+        first = False
+
+async def _export(fetch_page, format: str, format_csv_page, filename: str) -> StreamingResponse:
+    # The first page is fetched before the response starts, so a database error is still a 500
+    pages = _pages(fetch_page, await fetch_page(limit=EXPORT_PAGE_SIZE))
+    if format == "json":
+        return StreamingResponse(
+            _json_chunks(pages),
+            media_type="application/json",
+            headers={"Content-Disposition": f"attachment; filename={filename}.json"}
+        )
+    return StreamingResponse(
+        _csv_chunks(pages, format_csv_page),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}.csv"}
+    )
+
 @router.get("/meetings")
 async def export_meetings(format: str = Query("json", regex="^(json|csv)$")):
     """Export meetings data in JSON or CSV format"""
     try:
-        meetings = await get_meetings(limit=1000)  # Get all meetings
-        
-        if format == "json":
-            json_data = json.dumps(meetings, indent=2, default=str)
-            return StreamingResponse(
-                io.StringIO(json_data),
-                media_type="application/json",
-                headers={"Content-Disposition": "attachment; filename=meetings.json"}
-            )
-        
-        elif format == "csv":
-            csv_data = format_meetings_for_csv(meetings)
-            return StreamingResponse(
-                io.StringIO(csv_data),
-                media_type="text/csv",
-                headers={"Content-Disposition": "attachment; filename=meetings.csv"}
-            )
-            
+        return await _export(get_meetings, format, format_meetings_for_csv, "meetings")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -69,23 +95,6 @@ async def export_meeting(meeting_id: int, format: str = Query("json", regex="^(j
 async def export_action_items(format: str = Query("json", regex="^(json|csv)$")):
     """Export action items data in JSON or CSV format"""
     try:
-        action_items = await get_action_items(limit=1000)  # Get all action items
-        
-        if format == "json":
-            json_data = json.dumps(action_items, indent=2, default=str)
-            return StreamingResponse(
-                io.StringIO(json_data),
-                media_type="application/json",
-                headers={"Content-Disposition": "attachment; filename=action_items.json"}
-            )
-        
-        elif format == "csv":
-            csv_data = format_action_items_for_csv(action_items)
-            return StreamingResponse(
-                io.StringIO(csv_data),
-                media_type="text/csv",
-                headers={"Content-Disposition": "attachment; filename=action_items.csv"}
-            )
-            
+        return await _export(get_action_items, format, format_action_items_for_csv, "action_items")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Response
+from typing import List, Literal, Optional, Union
 from datetime import datetime, timedelta
 
-from models.schemas import MeetingResponse
+from models.schemas import MeetingResponse, MeetingSummaryResponse, MeetingListResponse
+from utils.pagination import decode_cursor, next_page, InvalidCursorError
 from db.database import (
+    MEETING_SUMMARY_COLUMNS,
     get_meetings,
     get_meeting_by_id,
     delete_meeting_by_id,
@@ -12,29 +14,103 @@ from db.database import (
 
 router = APIRouter()
 
+# Computed by ranked search rather than read from a column
+SEARCH_FIELDS = ("rank", "snippet")
 
-@router.get("/", response_model=List[MeetingResponse])
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Columns for a ``?fields=title,summary`` selection; None selects the summary projection.
+
+    ``id`` and ``created_at`` are always included, as cursors are built from them.
+    """
+    if fields is None:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in MEETING_SUMMARY_COLUMNS + SEARCH_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(MEETING_SUMMARY_COLUMNS + SEARCH_FIELDS)}",
+        )
+    return ["id", "created_at"] + [field for field in requested if field not in ("id", "created_at")]
+
+
+def projection(fields: Optional[List[str]]) -> dict:
+    """``get_meetings`` arguments for a parsed field selection"""
+    if fields is None:
+        return {"columns": MEETING_SUMMARY_COLUMNS}
+    return {
+        "columns": [field for field in fields if field not in SEARCH_FIELDS],
+        "with_snippet": "snippet" in fields,
+    }
+
+
+@router.get(
+    "/",
+    response_model=Union[List[MeetingSummaryResponse], MeetingListResponse],
+    response_model_exclude_unset=True,
+)
 async def get_all_meetings(
+    response: Response,
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
     search: Optional[str] = None,
+    search_mode: Literal["fulltext", "ranked", "ilike"] = "fulltext",
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
 ):
-    """Get all meetings with optional search and pagination"""
+    """Get all meetings with optional search and pagination.
+
+    Transcripts are not included (fetch ``/meetings/{id}`` for those);
+    ``fields=id,title,summary`` narrows the response to just those fields.
+
+    Search matches title, summary, CRM notes and transcript by word prefix;
+    ``search_mode=ranked`` orders by relevance and adds ``rank`` and a
+    highlighted ``snippet``.
+
+    Pages are linked by cursor: the token for the next page is in the
+    ``X-Next-Cursor`` header. Passing ``cursor`` (empty for the first page)
+    returns a ``MeetingListResponse`` with ``next_cursor`` instead of a
+    bare list. Offsets still work for ranked search.
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    selected = parse_fields(fields)
+    if search_mode == "ranked" and search and after is not None:
+        raise HTTPException(status_code=400, detail="Ranked search pages by offset, not cursor")
+    
     try:
-        meetings = await get_meetings(limit=limit, offset=offset, search=search)
+        # One extra row tells whether another page exists
+        rows = await get_meetings(
+            limit=limit + 1, offset=offset, search=search, search_mode=search_mode, after=after,
+            **projection(selected)
+        )
+        meetings, next_cursor = next_page(rows, limit)
+        if selected is not None:
+            # Ranked search always returns rank; drop it unless asked for
+            meetings = [{field: row[field] for field in selected if field in row} for row in meetings]
+        if next_cursor and not (search_mode == "ranked" and search):
+            response.headers["X-Next-Cursor"] = next_cursor
+        else:
+            next_cursor = None
+        if cursor is not None:
+            return MeetingListResponse(meetings=meetings, next_cursor=next_cursor, limit=limit)
         return meetings
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/recent", response_model=List[MeetingResponse])
-async def get_recent_meetings(limit: int = Query(5, ge=1, le=20)):
-    """Get recent meetings"""
+@router.get("/recent", response_model=List[MeetingSummaryResponse], response_model_exclude_unset=True)
+async def get_recent_meetings(limit: int = Query(5, ge=1, le=20), fields: Optional[str] = None):
+    """Get recent meetings, without transcripts"""
+    selected = parse_fields(fields)
     try:
         # Get meetings from last 30 days
         cutoff_date = datetime.now() - timedelta(days=30)
         meetings = await get_meetings(
-            limit=limit, date_filter=cutoff_date, order_by="created_at DESC"
+            limit=limit, date_filter=cutoff_date, order_by="created_at DESC", **projection(selected)
         )
         return meetings
     except Exception as e:
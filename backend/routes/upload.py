@@ -1,5 +1,6 @@
 from fastapi import APIRouter, File, UploadFile, HTTPException
-from typing import Optional
+from fastapi.responses import StreamingResponse
+from typing import Awaitable, Callable, Dict, Optional
 import tempfile
 import os
 from datetime import datetime
@@ -14,8 +15,14 @@ import time
 
 from services.llm_service import LLMService
 from services.whisper_service import WhisperService
-from models.schemas import UploadResponse, TextUploadRequest
-from db.database import save_meeting
+from services.job_service import JobService, JobQueueFullError, TERMINAL_STAGES
+from services.progress_service import ProgressBroker, format_sse
+from services.admission_service import AdmissionController, AdmissionRejected
+from services.chunked_transcriber import probe_duration
+from services.pipelined_analyzer import PipelinedAnalyzer
+from models.schemas import UploadResponse, UploadJobResponse, TextUploadRequest
+from utils.upload_utils import spool_upload, UploadTooLargeError
+from db.database import save_meeting, find_meeting_by_audio_hash
 
 router = APIRouter()
 
@@ -58,6 +65,26 @@ upload_logger = setup_upload_logging()
 llm_service = LLMService()
 whisper_service = WhisperService()
 
+# Long recordings in long-audio mode may need more than the default 5 minutes
+TRANSCRIPTION_TIMEOUT = int(os.getenv("TRANSCRIPTION_TIMEOUT_SECONDS", "300"))
+
+# Backstop only: past its own deadline analyze_transcript returns the fallback analysis,
+# so this fires only if that deadline is disabled or the fallback itself hangs
+LLM_ANALYSIS_TIMEOUT = llm_service.analysis_deadline_seconds + 30 if llm_service.analysis_deadline_seconds else 120
+
+# Overlap LLM window analysis with transcription instead of waiting for the full transcript
+LLM_PIPELINED = os.getenv("LLM_PIPELINED", "false").lower() == "true"
+
+# Limits how many transcriptions run at once based on their estimated memory/CPU cost
+admission_controller = AdmissionController()
+
+# Hit/miss counters for audio content-hash deduplication
+dedup_stats = {"hits": 0, "misses": 0}
+
+def _pipeline_version() -> str:
+    """Identify the models and prompt that produced a transcript and analysis"""
+    return f"{whisper_service.model_name}|{llm_service.model_name}|prompt-v{llm_service.PROMPT_VERSION}"
+
 @router.get("/debug/ffmpeg")
 async def debug_ffmpeg():
     """Debug endpoint to check FFmpeg availability"""
@@ -79,6 +106,24 @@ async def debug_ffmpeg():
             "path_env": os.environ.get('PATH', '')[:500]
         }
 
+@router.get("/admission")
+async def get_admission_stats():
+    """Queue depth, wait times and reserved budget of the transcription admission controller"""
+    return {
+        **admission_controller.stats(),
+        "job_queue_depth": job_service.queue.qsize() if job_service.queue else 0
+    }
+
+@router.get("/dedup/stats")
+async def get_dedup_stats():
+    """Hit/miss counters for audio deduplication"""
+    lookups = dedup_stats["hits"] + dedup_stats["misses"]
+    return {
+        **dedup_stats,
+        "hit_rate": round(dedup_stats["hits"] / lookups, 3) if lookups else 0.0,
+        "pipeline_version": _pipeline_version()
+    }
+
 @router.post("/transcript", response_model=UploadResponse)
 async def upload_transcript(request: TextUploadRequest):
     """Upload and process text transcript"""
@@ -89,8 +134,10 @@ async def upload_transcript(request: TextUploadRequest):
         print("🤖 Starting LLM analysis...")
         try:
             analysis = await asyncio.wait_for(
-                llm_service.analyze_transcript(request.content), 
-                timeout=120  # 2 minute timeout
+                llm_service.analyze_transcript(
+                    request.content, mode=request.analysis_mode, bypass_cache=request.bypass_cache
+                ),
+                timeout=LLM_ANALYSIS_TIMEOUT
             )
             print(f"✅ LLM Analysis completed: {type(analysis)}")
         except asyncio.TimeoutError:
@@ -155,9 +202,9 @@ async def upload_transcript(request: TextUploadRequest):
         gc.collect()
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/audio", response_model=UploadResponse)
+@router.post("/audio", response_model=UploadJobResponse, status_code=202)
 async def upload_audio(file: UploadFile = File(...)):
-    """Upload and process audio file"""
+    """Upload an audio file and queue it for background processing"""
     temp_file_path = None
     request_id = str(uuid.uuid4())[:8]
     
@@ -175,6 +222,9 @@ async def upload_audio(file: UploadFile = File(...)):
         upload_logger.info(f"[{request_id}] File type validation passed: {file.content_type}")
         upload_logger.dual_print(f"[{request_id}] File type OK: {file.content_type}")
         
+        # Refuse before reading the body if the queue is full or memory is tight
+        admission_controller.check_capacity(queued=job_service.queue.qsize() if job_service.queue else 0)
+        
         # Create tmp directory if it doesn't exist (use absolute path)
         backend_dir = os.path.dirname(os.path.dirname(__file__))  # Go up from routes to backend
         tmp_dir = os.path.join(backend_dir, "tmp")
@@ -188,17 +238,102 @@ async def upload_audio(file: UploadFile = File(...)):
         upload_logger.info(f"[{request_id}] Temp file path: {temp_file_path}")
         upload_logger.dual_print(f"[{request_id}] SAVING TO: {temp_file_path}")
         
-        # Save uploaded file
+        # Stream uploaded file to disk in chunks (never holds the whole file in memory)
         file_save_start = time.time()
-        content = await file.read()
-        with open(temp_file_path, "wb") as temp_file:
-            temp_file.write(content)
+        spooled = await spool_upload(file, temp_file_path)
         file_save_time = time.time() - file_save_start
         
-        file_size = os.path.getsize(temp_file_path)
-        upload_logger.info(f"[{request_id}] File saved successfully - Size: {file_size} bytes in {file_save_time:.2f}s")
+        file_size = spooled["size"]
+        upload_logger.info(f"[{request_id}] File saved successfully - Size: {file_size} bytes in {file_save_time:.2f}s - sha256: {spooled['sha256'][:12]}")
         upload_logger.dual_print(f"[{request_id}] FILE SAVED - {file_size} bytes - {file_save_time:.2f}s")
         
+        # Hand the file over to the background workers - they own it from here
+        cost = await _estimate_job_cost(temp_file_path, file_size)
+        job = await job_service.submit(
+            temp_file_path, file.filename, file_size=file_size, audio_hash=spooled["sha256"], cost=cost
+        )
+        upload_logger.info(f"[{request_id}] Queued as job {job['job_id']}")
+        upload_logger.dual_print(f"[{request_id}] JOB QUEUED - {job['job_id']}")
+        temp_file_path = None
+        return job
+            
+    except HTTPException:
+        # Re-raise HTTP exceptions without modification
+        raise
+    except UploadTooLargeError as e:
+        upload_logger.warning(f"[{request_id}] {e}")
+        upload_logger.dual_print(f"[{request_id}] FILE TOO LARGE", "WARNING")
+        raise HTTPException(status_code=413, detail=str(e))
+    except AdmissionRejected as e:
+        upload_logger.warning(f"[{request_id}] {e}")
+        upload_logger.dual_print(f"[{request_id}] ADMISSION REJECTED ({e.status_code})", "WARNING")
+        raise HTTPException(status_code=e.status_code, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except JobQueueFullError as e:
+        upload_logger.warning(f"[{request_id}] {e}")
+        upload_logger.dual_print(f"[{request_id}] QUEUE FULL", "WARNING")
+        retry_after = admission_controller.retry_after(job_service.queue.qsize())
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(retry_after)})
+    except Exception as e:
+        error_msg = f"Audio upload error: {e}"
+        upload_logger.error(f"[{request_id}] {error_msg}")
+        upload_logger.dual_print(f"[{request_id}] GENERAL ERROR: {e}", "ERROR")
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        # Only clean up here if the file never made it into the queue
+        _cleanup_temp_file(temp_file_path, request_id)
+        gc.collect()
+
+@router.get("/jobs/{job_id}", response_model=UploadJobResponse)
+async def get_upload_job_status(job_id: str):
+    """Get the stage, timings and result of an audio upload job"""
+    job = await job_service.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@router.get("/jobs/{job_id}/events")
+async def stream_upload_job_events(job_id: str):
+    """Stream stage transitions and transcribed segments as Server-Sent Events"""
+    job = await job_service.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    async def event_stream():
+        # Finished before this process saw it (e.g. after a restart) - send the outcome only
+        if job["stage"] in TERMINAL_STAGES and not progress_broker.has_job(job_id):
+            yield format_sse({
+                "event": job["stage"],
+                "data": {"result": job["result"], "error": job["error"], "timings": job["timings"]},
+                "time": time.time()
+            })
+            return
+        async for message in progress_broker.subscribe(job_id):
+            yield format_sse(message)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+async def _process_audio_job(job: Dict, set_stage: Callable[[str], Awaitable[None]]) -> Dict:
+    """Run transcription, analysis and saving for a queued audio upload"""
+    request_id = job["id"][:8]
+    temp_file_path = job["file_path"]
+    filename = job.get("filename")
+    pipeline_start = time.time()
+    audio_hash = job.get("audio_hash")
+    pipeline_version = _pipeline_version()
+    analyzer = None
+    keep_audio = False
+    
+    try:
+        # Identical audio already processed by the same pipeline - reuse it
+        if audio_hash:
+            duplicate = await _link_duplicate_meeting(audio_hash, pipeline_version, request_id, set_stage)
+            if duplicate is not None:
+                return duplicate
+        
         # Monitor memory usage
         try:
             process = psutil.Process()
@@ -212,17 +347,39 @@ async def upload_audio(file: UploadFile = File(...)):
         gc.collect()
         
         # Add timeout and better error handling for transcription
+        await set_stage("transcribing")
         upload_logger.info(f"[{request_id}] Starting audio transcription...")
         upload_logger.dual_print(f"[{request_id}] TRANSCRIPTION START")
         
+        cost = job.get("cost") or await _estimate_job_cost(temp_file_path, os.path.getsize(temp_file_path))
+        
+        # Pipelined mode: analyze transcript windows while the rest is still being transcribed
+        loop = asyncio.get_running_loop()
+        if LLM_PIPELINED:
+            analyzer = PipelinedAnalyzer(llm_service)
+        
+        def on_transcription_event(event: str, data: Dict):
+            # Called from the transcription thread
+            progress_broker.publish_threadsafe(job["id"], event, data)
+            if analyzer is not None and event == "segment":
+                loop.call_soon_threadsafe(analyzer.add_segment, data["text"])
+        
         try:
-            # Increase timeout for Render deployment - model loading + transcription
-            transcription_start = time.time()
-            transcript = await asyncio.wait_for(
-                whisper_service.transcribe(temp_file_path), 
-                timeout=300  # 5 minute timeout to account for model loading + processing
-            )
-            transcription_time = time.time() - transcription_start
+            # Wait until the estimated memory/CPU cost fits the admission budget
+            admission_start = time.time()
+            async with admission_controller.admit(cost):
+                admission_wait = time.time() - admission_start
+                upload_logger.dual_print(f"[{request_id}] ADMITTED after {admission_wait:.2f}s - est {cost['memory_mb']}MB / {cost['cpu']} cpu")
+                
+                # Increase timeout for Render deployment - model loading + transcription.
+                # On timeout transcribe() stops its executor work before returning, so the
+                # admission slot is only released once the CPU and memory are actually free
+                transcription_start = time.time()
+                transcript = await asyncio.wait_for(
+                    whisper_service.transcribe(temp_file_path, on_event=on_transcription_event, audio_hash=audio_hash), 
+                    timeout=TRANSCRIPTION_TIMEOUT  # Accounts for model loading + processing
+                )
+                transcription_time = time.time() - transcription_start
             upload_logger.info(f"[{request_id}] Transcription completed in {transcription_time:.2f}s - Length: {len(transcript)} characters")
             upload_logger.dual_print(f"[{request_id}] TRANSCRIPTION DONE - {transcription_time:.2f}s - {len(transcript)} chars")
         except asyncio.TimeoutError:
@@ -237,14 +394,38 @@ async def upload_audio(file: UploadFile = File(...)):
             raise HTTPException(status_code=500, detail=f"Transcription failed: {str(transcription_error)}")
         
         # Process with LLM
+        await set_stage("analyzing")
         upload_logger.info(f"[{request_id}] Starting LLM analysis...")
         upload_logger.dual_print(f"[{request_id}] LLM ANALYSIS START")
         
+        # Streamed fields and items are exposed on the job and its event stream before analysis ends
+        job["partial"] = {}
+        
+        def on_analysis_partial(kind: str, key: str, value):
+            if kind == "item":
+                job["partial"].setdefault(key, []).append(value)
+            else:
+                job["partial"][key] = value
+            progress_broker.publish(job["id"], "partial", {"kind": kind, "key": key, "value": value})
+        
+        # A local extractive result in milliseconds, replaced once the model answers
+        if llm_service.provisional_results:
+            try:
+                job["provisional"] = await asyncio.to_thread(llm_service.analyze_locally, transcript, request_id)
+                progress_broker.publish(job["id"], "provisional", job["provisional"])
+            except Exception as e:
+                upload_logger.warning(f"[{request_id}] Provisional analysis failed: {e}")
+        
         try:
             llm_start = time.time()
+            if analyzer is not None:
+                upload_logger.dual_print(f"[{request_id}] PIPELINED - {analyzer.windows_started} windows started during transcription")
+                analysis_coro = analyzer.finish(transcript, on_partial=on_analysis_partial)
+            else:
+                analysis_coro = llm_service.analyze_transcript(transcript, on_partial=on_analysis_partial)
             analysis = await asyncio.wait_for(
-                llm_service.analyze_transcript(transcript), 
-                timeout=120  # 2 minute timeout
+                analysis_coro, 
+                timeout=LLM_ANALYSIS_TIMEOUT
             )
             llm_time = time.time() - llm_start
             upload_logger.info(f"[{request_id}] LLM analysis completed in {llm_time:.2f}s")
@@ -261,13 +442,14 @@ async def upload_audio(file: UploadFile = File(...)):
             raise HTTPException(status_code=500, detail=f"LLM analysis failed: {str(llm_error)}")
         
         # Store values before cleanup
-        title = analysis.get("title", file.filename or "Audio Meeting")
+        title = analysis.get("title", filename or "Audio Meeting")
         summary = analysis.get("summary", "")
         action_items = analysis.get("action_items", [])
         objections = analysis.get("objections", [])
         crm_notes = analysis.get("crm_notes", "")
         
         # Save to database
+        await set_stage("saving")
         upload_logger.info(f"[{request_id}] Saving to database...")
         upload_logger.dual_print(f"[{request_id}] DATABASE SAVE START")
         
@@ -278,7 +460,10 @@ async def upload_audio(file: UploadFile = File(...)):
             "summary": summary,
             "action_items": action_items,
             "objections": objections,
-            "crm_notes": crm_notes
+            "crm_notes": crm_notes,
+            # Degraded analyses must not be reused for later uploads of the same audio
+            "audio_hash": None if llm_service.is_degraded(analysis) else audio_hash,
+            "pipeline_version": pipeline_version
         })
         db_time = time.time() - db_start
         
@@ -289,7 +474,7 @@ async def upload_audio(file: UploadFile = File(...)):
         del analysis, transcript
         gc.collect()
         
-        total_time = time.time() - file_save_start
+        total_time = time.time() - pipeline_start
         upload_logger.info(f"[{request_id}] Audio processing completed successfully in {total_time:.2f}s total")
         upload_logger.dual_print(f"[{request_id}] COMPLETE SUCCESS - {total_time:.2f}s total")
         
@@ -300,28 +485,81 @@ async def upload_audio(file: UploadFile = File(...)):
             action_items=action_items,
             objections=objections,
             crm_notes=crm_notes
-        )
-            
-    except HTTPException:
-        # Re-raise HTTP exceptions without modification
+        ).dict()
+    except asyncio.CancelledError:
+        # Shutdown - keep the audio so the job is re-queued on next start; the rerun cleans it up
+        keep_audio = True
         raise
-    except Exception as e:
-        error_msg = f"Audio upload error: {e}"
-        upload_logger.error(f"[{request_id}] {error_msg}")
-        upload_logger.dual_print(f"[{request_id}] GENERAL ERROR: {e}", "ERROR")
-        # Force cleanup on error
-        gc.collect()
-        raise HTTPException(status_code=500, detail=str(e))
     finally:
-        # Clean up temp file only if it was created
-        if temp_file_path and os.path.exists(temp_file_path):
-            try:
-                os.unlink(temp_file_path)
-                upload_logger.info(f"[{request_id}] Cleaned up temp file: {temp_file_path}")
-                upload_logger.dual_print(f"[{request_id}] CLEANUP DONE")
-            except Exception as cleanup_error:
-                upload_logger.warning(f"[{request_id}] Failed to cleanup temp file: {cleanup_error}")
-                upload_logger.dual_print(f"[{request_id}] CLEANUP FAILED: {cleanup_error}", "WARNING")
+        if analyzer is not None:
+            analyzer.cancel()
+        if not keep_audio:
+            _cleanup_temp_file(temp_file_path, request_id)
         
         # Force garbage collection after processing
         gc.collect()
+
+async def _link_duplicate_meeting(audio_hash: str, pipeline_version: str, request_id: str, set_stage: Callable[[str], Awaitable[None]]) -> Optional[Dict]:
+    """Create a meeting from an earlier result for identical audio, without transcribing or analyzing"""
+    try:
+        previous = await find_meeting_by_audio_hash(audio_hash, pipeline_version)
+    except Exception as e:
+        upload_logger.warning(f"[{request_id}] Dedup lookup failed, processing normally: {e}")
+        return None
+    
+    if previous is None:
+        dedup_stats["misses"] += 1
+        upload_logger.dual_print(f"[{request_id}] DEDUP MISS - {audio_hash[:12]}")
+        return None
+    
+    dedup_stats["hits"] += 1
+    upload_logger.info(f"[{request_id}] Audio matches meeting {previous['id']} - reusing transcript and analysis")
+    upload_logger.dual_print(f"[{request_id}] DEDUP HIT - meeting {previous['id']}")
+    
+    await set_stage("saving")
+    meeting_id = await save_meeting({
+        "title": previous["title"],
+        "transcript": previous["transcript"],
+        "summary": previous["summary"],
+        "action_items": previous["action_items"],
+        "objections": previous["objections"],
+        "crm_notes": previous["crm_notes"],
+        "audio_hash": audio_hash,
+        "pipeline_version": pipeline_version
+    })
+    return UploadResponse(
+        id=meeting_id,
+        status="deduplicated",
+        summary=previous["summary"] or "",
+        action_items=previous["action_items"],
+        objections=previous["objections"],
+        crm_notes=previous["crm_notes"] or ""
+    ).dict()
+
+async def _estimate_job_cost(temp_file_path: str, file_size: int) -> Dict:
+    """Estimate the memory and CPU a transcription of this file will need"""
+    duration = await asyncio.to_thread(probe_duration, temp_file_path)
+    chunked = whisper_service.chunked_transcriber
+    if chunked.enabled and duration is not None and duration >= chunked.min_duration:
+        # Long-audio mode: worker processes each hold a model but only decode their own chunk
+        return {
+            "memory_mb": chunked.max_workers * chunked.worker_memory_mb,
+            "cpu": chunked.max_workers,
+            "duration": round(duration, 1)
+        }
+    return admission_controller.estimate(file_size, duration)
+
+def _cleanup_temp_file(temp_file_path: Optional[str], request_id: str):
+    """Remove an uploaded temp file if it still exists"""
+    if temp_file_path and os.path.exists(temp_file_path):
+        try:
+            os.unlink(temp_file_path)
+            upload_logger.info(f"[{request_id}] Cleaned up temp file: {temp_file_path}")
+            upload_logger.dual_print(f"[{request_id}] CLEANUP DONE")
+        except Exception as cleanup_error:
+            upload_logger.warning(f"[{request_id}] Failed to cleanup temp file: {cleanup_error}")
+            upload_logger.dual_print(f"[{request_id}] CLEANUP FAILED: {cleanup_error}", "WARNING")
+
+# Background workers that run the audio pipeline, publishing progress for streaming clients
+progress_broker = ProgressBroker()
+job_service = JobService(runner=_process_audio_job, broker=progress_broker)
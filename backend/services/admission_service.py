@@ -0,0 +1,153 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
+
+import psutil
+
+# faster-whisper decodes the whole file to 16kHz float32 before transcribing
+DECODED_MB_PER_SECOND = 16000 * 4 / 1024 / 1024
+# Used to guess duration from size when FFprobe is unavailable (~128kbps)
+FALLBACK_BYTES_PER_SECOND = 16000
+
+
+class AdmissionRejected(Exception):
+    """Raised when a job cannot be accepted right now"""
+
+    def __init__(self, message: str, status_code: int, retry_after: int):
+        self.status_code = status_code
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class AdmissionController:
+    """Memory- and CPU-aware admission for transcription work.
+
+    Each job reserves an estimated amount of memory and a number of CPU
+    slots for as long as it runs. Jobs that do not fit wait in FIFO order
+    until earlier jobs release their reservation; a job larger than the whole
+    budget is admitted only when nothing else is running.
+    """
+
+    def __init__(self):
+        self.memory_budget_mb = float(os.getenv("ADMISSION_MEMORY_BUDGET_MB", "250"))
+        self.cpu_slots = int(os.getenv("ADMISSION_CPU_SLOTS", str(os.cpu_count() or 1)))
+        self.job_base_mb = float(os.getenv("ADMISSION_JOB_BASE_MB", "60"))
+        self.max_queue = int(os.getenv("ADMISSION_MAX_QUEUE", "10"))
+        # Refuse new uploads outright when the process is already this large
+        self.critical_rss_mb = float(os.getenv("ADMISSION_CRITICAL_RSS_MB", "450"))
+
+        self.reserved_mb = 0.0
+        self.reserved_cpu = 0
+        self.running = 0
+        self.waiters: List[Tuple[Dict, asyncio.Future]] = []
+        self.admitted_total = 0
+        self.rejected_total = 0
+        self.total_wait_seconds = 0.0
+        self.avg_run_seconds = 60.0  # EWMA of how long admitted jobs hold their reservation
+
+    def estimate(self, file_size: int, duration: Optional[float] = None, cpu: int = 1) -> Dict:
+        """Estimate the memory (MB) and CPU slots a transcription job needs"""
+        if duration is None:
+            duration = file_size / FALLBACK_BYTES_PER_SECOND
+        memory_mb = self.job_base_mb + duration * DECODED_MB_PER_SECOND
+        return {"memory_mb": round(memory_mb, 1), "cpu": cpu, "duration": round(duration, 1)}
+
+    def retry_after(self, depth: Optional[int] = None) -> int:
+        """Seconds a client should wait before retrying, from queue depth and job run time"""
+        depth = len(self.waiters) if depth is None else depth
+        concurrency = max(1, self.running)
+        return int(min(600, max(5, self.avg_run_seconds * (depth + 1) / concurrency)))
+
+    def check_capacity(self, queued: int = 0):
+        """Reject new work when the queue is full or the process is near its memory limit"""
+        try:
+            rss_mb = psutil.Process().memory_info().rss / 1024 / 1024
+        except Exception:
+            rss_mb = 0.0
+        if rss_mb >= self.critical_rss_mb:
+            self.rejected_total += 1
+            raise AdmissionRejected(
+                f"Server is under memory pressure ({rss_mb:.0f}MB), please retry later",
+                status_code=503,
+                retry_after=self.retry_after(),
+            )
+        depth = queued + len(self.waiters)
+        if depth >= self.max_queue:
+            self.rejected_total += 1
+            raise AdmissionRejected(
+                "Too many uploads are waiting to be processed, please retry later",
+                status_code=429,
+                retry_after=self.retry_after(depth),
+            )
+
+    def _fits(self, cost: Dict) -> bool:
+        if self.running == 0:
+            return True
+        return (
+            self.reserved_mb + cost["memory_mb"] <= self.memory_budget_mb
+            and self.reserved_cpu + cost["cpu"] <= self.cpu_slots
+        )
+
+    def _reserve(self, cost: Dict):
+        self.reserved_mb += cost["memory_mb"]
+        self.reserved_cpu += cost["cpu"]
+        self.running += 1
+        self.admitted_total += 1
+
+    def _release(self, cost: Dict, run_seconds: float):
+        self.reserved_mb = max(0.0, self.reserved_mb - cost["memory_mb"])
+        self.reserved_cpu = max(0, self.reserved_cpu - cost["cpu"])
+        self.running -= 1
+        self.avg_run_seconds = 0.8 * self.avg_run_seconds + 0.2 * run_seconds
+        self._wake_waiters()
+
+    def _wake_waiters(self):
+        # Strict FIFO: a large job at the head is not overtaken by smaller ones
+        while self.waiters and self._fits(self.waiters[0][0]):
+            cost, future = self.waiters.pop(0)
+            if not future.done():
+                self._reserve(cost)
+                future.set_result(True)
+
+    @asynccontextmanager
+    async def admit(self, cost: Dict):
+        """Hold a reservation for ``cost`` while the body runs, waiting for room first"""
+        wait_start = time.time()
+        if not self.waiters and self._fits(cost):
+            self._reserve(cost)
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self.waiters.append((cost, future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Admitted just as we were cancelled - give the slot back
+                    self._release(cost, self.avg_run_seconds)
+                elif (cost, future) in self.waiters:
+                    self.waiters.remove((cost, future))
+                    self._wake_waiters()
+                raise
+        self.total_wait_seconds += time.time() - wait_start
+
+        run_start = time.time()
+        try:
+            yield
+        finally:
+            self._release(cost, time.time() - run_start)
+
+    def stats(self) -> Dict:
+        return {
+            "queue_depth": len(self.waiters),
+            "running": self.running,
+            "reserved_memory_mb": round(self.reserved_mb, 1),
+            "memory_budget_mb": self.memory_budget_mb,
+            "reserved_cpu": self.reserved_cpu,
+            "cpu_slots": self.cpu_slots,
+            "admitted_total": self.admitted_total,
+            "rejected_total": self.rejected_total,
+            "avg_wait_seconds": round(self.total_wait_seconds / self.admitted_total, 3) if self.admitted_total else 0.0,
+            "avg_run_seconds": round(self.avg_run_seconds, 1),
+        }
@@ -0,0 +1,182 @@
+import os
+import re
+import subprocess
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, Optional, Tuple
+
+import psutil
+
+from services.whisper_worker import init_worker, transcribe_chunk
+
+# How often a waiting transcription checks whether it was cancelled
+CANCEL_POLL_SECONDS = 0.5
+
+
+class TranscriptionCancelled(Exception):
+    """Raised inside the transcription when its caller stopped waiting for it"""
+
+
+_SILENCE_START_RE = re.compile(r"silence_start:\s*(-?[\d.]+)")
+_SILENCE_END_RE = re.compile(r"silence_end:\s*([\d.]+)")
+
+
+def probe_duration(audio_file_path: str) -> Optional[float]:
+    """Return the audio duration in seconds, or None if FFprobe cannot tell"""
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", audio_file_path],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        return float(result.stdout.strip())
+    except (ValueError, subprocess.SubprocessError, FileNotFoundError):
+        return None
+
+
+def detect_silences(audio_file_path: str, noise_db: int = -35, min_silence: float = 0.5) -> List[Tuple[float, float]]:
+    """Find silent stretches with FFmpeg's silencedetect filter.
+
+    FFmpeg streams the file, so memory use does not grow with its length.
+    """
+    result = subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-hide_banner", "-i", audio_file_path,
+            "-af", f"silencedetect=noise={noise_db}dB:d={min_silence}",
+            "-f", "null", "-",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    silences = []
+    silence_start = None
+    for line in result.stderr.splitlines():
+        start_match = _SILENCE_START_RE.search(line)
+        if start_match:
+            silence_start = max(0.0, float(start_match.group(1)))
+            continue
+        end_match = _SILENCE_END_RE.search(line)
+        if end_match and silence_start is not None:
+            silences.append((silence_start, float(end_match.group(1))))
+            silence_start = None
+    return silences
+
+
+def plan_chunks(
+    duration: float,
+    silences: List[Tuple[float, float]],
+    target_seconds: float,
+    max_seconds: float,
+) -> List[Tuple[float, float]]:
+    """Split [0, duration) into chunks that end in the middle of a silence.
+
+    Each cut is placed at the silence midpoint closest to ``target_seconds``
+    after the chunk start, without exceeding ``max_seconds``. If there is no
+    silence in range the chunk is cut hard at ``max_seconds``.
+    """
+    cut_points = [(start + end) / 2 for start, end in silences]
+    chunks = []
+    chunk_start = 0.0
+    while duration - chunk_start > max_seconds:
+        candidates = [
+            point for point in cut_points
+            if chunk_start + target_seconds / 2 <= point <= chunk_start + max_seconds
+        ]
+        if candidates:
+            cut = min(candidates, key=lambda point: abs(point - (chunk_start + target_seconds)))
+        else:
+            cut = chunk_start + max_seconds
+        chunks.append((chunk_start, cut))
+        chunk_start = cut
+    chunks.append((chunk_start, duration))
+    return chunks
+
+
+class ChunkedTranscriber:
+    """Long-audio mode: transcribe silence-delimited chunks in parallel processes.
+
+    The number of worker processes is bounded by the configured maximum, the
+    CPU count and the memory budget left after the current process RSS. The
+    pool only lives for the duration of one file so idle instances do not
+    keep several models resident.
+    """
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self.enabled = os.getenv("WHISPER_LONG_AUDIO_MODE", "false").lower() == "true"
+        self.min_duration = float(os.getenv("WHISPER_LONG_AUDIO_MIN_SECONDS", "600"))
+        self.chunk_seconds = float(os.getenv("WHISPER_CHUNK_SECONDS", "300"))
+        self.max_workers = int(os.getenv("WHISPER_MAX_WORKERS", "2"))
+        self.memory_budget_mb = float(os.getenv("WHISPER_MEMORY_BUDGET_MB", "480"))
+        self.worker_memory_mb = float(os.getenv("WHISPER_WORKER_MEMORY_MB", "150"))
+
+    def worker_count(self) -> int:
+        """Number of worker processes that fit in the memory budget right now"""
+        rss_mb = psutil.Process().memory_info().rss / 1024 / 1024
+        by_memory = int((self.memory_budget_mb - rss_mb) // self.worker_memory_mb)
+        return max(0, min(self.max_workers, os.cpu_count() or 1, by_memory))
+
+    def should_use(self, duration: Optional[float]) -> bool:
+        """Long-audio mode only pays off for long files and at least two workers"""
+        return (
+            self.enabled
+            and duration is not None
+            and duration >= self.min_duration
+            and self.worker_count() >= 2
+        )
+
+    def transcribe(
+        self,
+        audio_file_path: str,
+        duration: float,
+        params: Dict,
+        on_segment: Optional[Callable[[Dict], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Tuple[List[Dict], int, int]:
+        """Transcribe the file; returns (segments in order, chunk count, worker count).
+
+        ``on_segment`` receives segments in file order as soon as every
+        earlier chunk has finished. Setting ``cancel_event`` drops the chunks
+        not started yet and raises TranscriptionCancelled once the running
+        ones have finished and the pool is gone.
+        """
+        silences = detect_silences(audio_file_path)
+        chunks = plan_chunks(duration, silences, self.chunk_seconds, self.chunk_seconds * 1.5)
+        workers = min(self.worker_count(), len(chunks))
+        # Split the cores between workers so they do not oversubscribe the CPU
+        cpu_threads = max(1, (os.cpu_count() or 1) // max(workers, 1))
+
+        # spawn avoids forking the (large) parent process into every worker; the
+        # worker functions live in whisper_worker so a child imports only faster-whisper
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=max(workers, 1),
+            mp_context=context,
+            initializer=init_worker,
+            initargs=(self.model_name, cpu_threads),
+        ) as executor:
+            futures = [
+                executor.submit(transcribe_chunk, audio_file_path, start, end, params)
+                for start, end in chunks
+            ]
+            segments = []
+            for future in futures:
+                chunk_segments = self._wait(future, executor, cancel_event)
+                if on_segment:
+                    for segment in chunk_segments:
+                        on_segment(segment)
+                segments.extend(chunk_segments)
+        return segments, len(chunks), workers
+
+    @staticmethod
+    def _wait(future, executor: ProcessPoolExecutor, cancel_event: Optional[threading.Event]):
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise TranscriptionCancelled("Transcription cancelled")
+            try:
+                return future.result(timeout=CANCEL_POLL_SECONDS)
+            except FutureTimeoutError:
+                continue
@@ -0,0 +1,231 @@
+import asyncio
+import os
+import uuid
+import logging
+import sys
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from db.database import save_upload_job, get_upload_job, get_unfinished_upload_jobs
+from services.progress_service import ProgressBroker
+
+# Pipeline stages in the order a job moves through them
+JOB_STAGES = ("queued", "transcribing", "analyzing", "saving", "done", "failed")
+TERMINAL_STAGES = ("done", "failed")
+
+
+class JobQueueFullError(Exception):
+    """Raised when the upload job queue cannot accept another job"""
+
+
+class JobService:
+    """Bounded background worker pool for the audio upload pipeline.
+
+    Jobs are queued in memory and processed by a fixed number of worker
+    tasks. Every stage transition is written to the ``upload_jobs`` table so
+    status survives a restart; unfinished jobs are re-queued on startup when
+    their audio file is still on disk. Stage transitions are also published
+    to the progress broker for streaming clients.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[Dict, Callable[[str], Awaitable[None]]], Awaitable[Dict]],
+        max_workers: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        broker: Optional[ProgressBroker] = None,
+    ):
+        self.logger = self._setup_logging()
+        self.runner = runner
+        self.broker = broker or ProgressBroker()
+        # Single worker by default - one transcription at a time fits in 512MB
+        self.max_workers = max_workers or int(os.getenv("UPLOAD_JOB_WORKERS", "1"))
+        self.max_queue_size = max_queue_size or int(os.getenv("UPLOAD_JOB_QUEUE_SIZE", "20"))
+        self.queue: Optional[asyncio.Queue] = None
+        self.jobs: Dict[str, Dict] = {}
+        self.workers: List[asyncio.Task] = []
+
+    def _setup_logging(self):
+        """Setup logging that works for both local and Render deployment"""
+        logger = logging.getLogger(__name__)
+        logger.setLevel(logging.INFO)
+
+        # Clear any existing handlers
+        logger.handlers.clear()
+
+        # Create formatter
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+
+        # Console handler (works for both local and Render)
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
+
+        # Print to both stdout and stderr for maximum visibility on Render
+        def dual_print(message, level="INFO"):
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            formatted_msg = f"{timestamp} - JobService - {level} - {message}"
+            print(formatted_msg, flush=True)  # stdout
+            print(formatted_msg, file=sys.stderr, flush=True)  # stderr
+
+        logger.dual_print = dual_print
+        return logger
+
+    async def start(self):
+        """Start the worker tasks and recover jobs interrupted by a restart"""
+        if self.workers:
+            return
+        self.queue = asyncio.Queue(maxsize=self.max_queue_size)
+        for index in range(self.max_workers):
+            self.workers.append(asyncio.create_task(self._worker(index)))
+        self.logger.dual_print(f"Job workers started: {self.max_workers} (queue size {self.max_queue_size})")
+        await self._recover_jobs()
+
+    async def stop(self):
+        """Cancel the worker tasks; in-flight jobs keep their audio and are recovered on next start"""
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+        self.logger.dual_print("Job workers stopped")
+
+    async def _recover_jobs(self):
+        try:
+            unfinished = await get_unfinished_upload_jobs()
+        except Exception as e:
+            self.logger.warning(f"Could not load unfinished jobs: {e}")
+            return
+
+        for job in unfinished:
+            if job.get("file_path") and os.path.exists(job["file_path"]) and not self.queue.full():
+                job["stage"] = "queued"
+                job["stage_started"] = time.time()
+                self.jobs[job["id"]] = job
+                await self._persist(job)
+                self.queue.put_nowait(job["id"])
+                self.broker.publish(job["id"], "stage", {"stage": "queued"})
+                self.logger.dual_print(f"[{job['id'][:8]}] Re-queued after restart")
+            else:
+                audio_kept = bool(job.get("file_path")) and os.path.exists(job["file_path"])
+                job["stage"] = "failed"
+                job["error"] = (
+                    "Job was interrupted by a restart and the upload queue is full"
+                    if audio_kept
+                    else "Job was interrupted by a restart and its audio is no longer available"
+                )
+                await self._persist(job)
+                self.logger.dual_print(f"[{job['id'][:8]}] Marked failed after restart", "WARNING")
+                # The audio was kept across the restart for this job only
+                if audio_kept:
+                    try:
+                        os.unlink(job["file_path"])
+                    except OSError as e:
+                        self.logger.warning(f"[{job['id'][:8]}] Failed to remove audio: {e}")
+
+    async def submit(self, file_path: str, filename: Optional[str] = None, **extra) -> Dict:
+        """Queue a new job and return its initial state"""
+        if self.queue is None:
+            await self.start()
+        if self.queue.full():
+            raise JobQueueFullError("Upload queue is full, please retry later")
+
+        job_id = uuid.uuid4().hex
+        job = {
+            "id": job_id,
+            "stage": "queued",
+            "filename": filename,
+            "file_path": file_path,
+            "error": None,
+            "timings": {},
+            "result": None,
+            "created_at": datetime.now().astimezone(),
+            "stage_started": time.time(),
+            **extra,
+        }
+        self.jobs[job_id] = job
+        await self._persist(job)
+        self.queue.put_nowait(job_id)
+        self.broker.publish(job_id, "stage", {"stage": "queued"})
+        self.logger.dual_print(f"[{job_id[:8]}] Job queued - {filename} (depth {self.queue.qsize()})")
+        return self._public(job)
+
+    async def get_job(self, job_id: str) -> Optional[Dict]:
+        """Return the current state of a job, from memory or the database"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            job = await get_upload_job(job_id)
+        return self._public(job) if job else None
+
+    async def _set_stage(self, job: Dict, stage: str, error: Optional[str] = None):
+        now = time.time()
+        # Record how long the job spent in the stage it is leaving
+        job["timings"][job["stage"]] = round(now - job.get("stage_started", now), 3)
+        job["stage"] = stage
+        job["stage_started"] = now
+        if error is not None:
+            job["error"] = error
+        if stage in TERMINAL_STAGES:
+            job["timings"]["total"] = round(sum(v for k, v in job["timings"].items() if k != "total"), 3)
+        await self._persist(job)
+        self.logger.dual_print(f"[{job['id'][:8]}] Stage -> {stage}")
+        
+        self.broker.publish(job["id"], "stage", {"stage": stage, "timings": dict(job["timings"])})
+        if stage == "done":
+            self.broker.publish(job["id"], "done", {"result": job.get("result"), "timings": dict(job["timings"])})
+        elif stage == "failed":
+            self.broker.publish(job["id"], "failed", {"error": job.get("error"), "timings": dict(job["timings"])})
+
+    async def _persist(self, job: Dict):
+        try:
+            await save_upload_job(job)
+        except Exception as e:
+            # Keep going with in-memory state - status polling still works
+            self.logger.warning(f"[{job['id'][:8]}] Failed to persist job state: {e}")
+
+    async def _worker(self, index: int):
+        while True:
+            job_id = await self.queue.get()
+            job = self.jobs.get(job_id)
+            try:
+                if job is None:
+                    continue
+
+                async def set_stage(stage: str):
+                    await self._set_stage(job, stage)
+
+                try:
+                    job["result"] = await self.runner(job, set_stage)
+                    await self._set_stage(job, "done")
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    detail = getattr(e, "detail", None) or str(e)
+                    self.logger.error(f"[{job_id[:8]}] Job failed: {detail}")
+                    await self._set_stage(job, "failed", error=detail)
+            finally:
+                self.queue.task_done()
+                self._prune()
+
+    def _prune(self, keep: int = 200):
+        """Drop old finished jobs from memory; they remain in the database"""
+        finished = [job_id for job_id, job in self.jobs.items() if job["stage"] in TERMINAL_STAGES]
+        for job_id in finished[:-keep] if len(finished) > keep else []:
+            self.jobs.pop(job_id, None)
+
+    def _public(self, job: Dict) -> Dict:
+        return {
+            "job_id": job["id"],
+            "stage": job["stage"],
+            "filename": job.get("filename"),
+            "error": job.get("error"),
+            "timings": dict(job.get("timings") or {}),
+            "result": job.get("result"),
+            "partial": job.get("partial") if job["stage"] not in TERMINAL_STAGES else None,
+            "provisional": job.get("provisional") if job["stage"] not in TERMINAL_STAGES else None,
+            "created_at": job.get("created_at"),
+            "queue_depth": self.queue.qsize() if self.queue else 0,
+        }
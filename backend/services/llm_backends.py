@@ -0,0 +1,234 @@
+import asyncio
+import json
+import os
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+from services.llm_resilience import ResiliencePolicy
+
+
+class LLMBackendError(Exception):
+    """Raised when a backend returns an unusable response"""
+
+
+class LLMBackend:
+    """Async text-generation backend sharing one keep-alive connection pool.
+
+    ``max_concurrency`` bounds the requests in flight at once; callers beyond
+    it wait for a slot instead of opening more connections. Every call goes
+    through the resilience policy (rate limit, retry, circuit breaker).
+    """
+
+    name = "base"
+
+    def __init__(self, model: str, max_concurrency: Optional[int] = None, timeout: Optional[float] = None):
+        self.model = model
+        self.max_concurrency = max_concurrency or int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+        self.timeout = timeout or float(os.getenv("LLM_REQUEST_TIMEOUT_SECONDS", "60"))
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+                keepalive_expiry=float(os.getenv("LLM_KEEPALIVE_SECONDS", "60")),
+            ),
+        )
+        self.policy = ResiliencePolicy()
+        self.requests = 0
+        self.in_flight = 0
+
+    async def generate(self, prompt: str, params: Dict) -> str:
+        """Return the generated text for ``prompt`` using generation ``params``"""
+        async def attempt() -> str:
+            async with self.semaphore:
+                self.in_flight += 1
+                self.requests += 1
+                try:
+                    return await self._generate(prompt, params)
+                finally:
+                    self.in_flight -= 1
+
+        return await self.policy.run(attempt)
+
+    async def stream(self, prompt: str, params: Dict) -> AsyncIterator[str]:
+        """Yield the generated text in pieces as the backend produces it.
+
+        Failures before the first piece are retried like ``generate``; once
+        text has been yielded an error is raised to the caller.
+        """
+        pieces = None
+
+        async def first_piece() -> str:
+            nonlocal pieces
+            await self.semaphore.acquire()
+            self.in_flight += 1
+            self.requests += 1
+            pieces = self._stream(prompt, params).__aiter__()
+            try:
+                return await pieces.__anext__()
+            except StopAsyncIteration:
+                return ""
+            except BaseException:
+                await pieces.aclose()
+                self.in_flight -= 1
+                self.semaphore.release()
+                raise
+
+        first = await self.policy.run(first_piece)
+        try:
+            if first:
+                yield first
+            async for piece in pieces:
+                yield piece
+        except Exception as e:
+            self.policy.record_failure(e)
+            raise
+        finally:
+            await pieces.aclose()
+            self.in_flight -= 1
+            self.semaphore.release()
+
+    async def _generate(self, prompt: str, params: Dict) -> str:
+        raise NotImplementedError
+
+    async def _stream(self, prompt: str, params: Dict) -> AsyncIterator[str]:
+        # Backends without native streaming deliver everything at once
+        yield await self._generate(prompt, params)
+
+    async def close(self):
+        await self.client.aclose()
+
+    def stats(self) -> Dict:
+        return {
+            "backend": self.name,
+            "model": self.model,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            **self.policy.stats(),
+        }
+
+
+class GeminiBackend(LLMBackend):
+    """Gemini ``generateContent`` over the REST API"""
+
+    name = "gemini"
+
+    def __init__(self, api_key: str, model: str = "gemini-2.0-flash", base_url: Optional[str] = None, **kwargs):
+        super().__init__(model, **kwargs)
+        self.api_key = api_key
+        self.base_url = (base_url or os.getenv("GEMINI_BASE_URL", "https://generativelanguage.googleapis.com/v1beta")).rstrip("/")
+
+    def _body(self, prompt: str, params: Dict) -> Dict:
+        return {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "generationConfig": {
+                "temperature": params.get("temperature"),
+                "maxOutputTokens": params.get("max_output_tokens"),
+                "topP": params.get("top_p"),
+                "topK": params.get("top_k"),
+            },
+        }
+
+    @staticmethod
+    def _text(data: Dict) -> str:
+        try:
+            parts = data["candidates"][0]["content"]["parts"]
+        except (KeyError, IndexError, TypeError):
+            raise LLMBackendError(f"Gemini response has no content: {str(data)[:200]}")
+        return "".join(part.get("text", "") for part in parts)
+
+    async def _generate(self, prompt: str, params: Dict) -> str:
+        response = await self.client.post(
+            f"{self.base_url}/models/{self.model}:generateContent",
+            headers={"x-goog-api-key": self.api_key},
+            json=self._body(prompt, params),
+        )
+        response.raise_for_status()
+        return self._text(response.json())
+
+    async def _stream(self, prompt: str, params: Dict) -> AsyncIterator[str]:
+        async with self.client.stream(
+            "POST",
+            f"{self.base_url}/models/{self.model}:streamGenerateContent",
+            params={"alt": "sse"},
+            headers={"x-goog-api-key": self.api_key},
+            json=self._body(prompt, params),
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = json.loads(line[5:])
+                # The final event may carry only finishReason/usage metadata
+                if data.get("candidates") and data["candidates"][0].get("content"):
+                    yield self._text(data)
+
+
+class OpenAICompatibleBackend(LLMBackend):
+    """Chat completions against OpenAI or any server speaking the same API"""
+
+    name = "openai"
+
+    def __init__(self, api_key: str, model: str, base_url: Optional[str] = None, **kwargs):
+        super().__init__(model, **kwargs)
+        self.base_url = base_url
+        self.openai = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=self.client, max_retries=0)
+
+    async def _generate(self, prompt: str, params: Dict) -> str:
+        # OpenAI has no top_k; the remaining parameters map one to one
+        completion = await self.openai.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=params.get("temperature"),
+            max_tokens=params.get("max_output_tokens"),
+            top_p=params.get("top_p"),
+        )
+        if not completion.choices:
+            raise LLMBackendError("Completion has no choices")
+        return completion.choices[0].message.content or ""
+
+    async def _stream(self, prompt: str, params: Dict) -> AsyncIterator[str]:
+        stream = await self.openai.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=params.get("temperature"),
+            max_tokens=params.get("max_output_tokens"),
+            top_p=params.get("top_p"),
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+def create_backend() -> LLMBackend:
+    """Build the backend selected by ``LLM_BACKEND`` (gemini, openai or stub)"""
+    backend = os.getenv("LLM_BACKEND", "gemini").lower()
+    model = os.getenv("LLM_MODEL")
+
+    if backend == "gemini":
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY environment variable is not set")
+        return GeminiBackend(api_key, model=model or "gemini-2.0-flash")
+
+    if backend == "openai":
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY environment variable is not set")
+        return OpenAICompatibleBackend(api_key, model=model or "gpt-4o-mini", base_url=os.getenv("OPENAI_BASE_URL"))
+
+    if backend == "stub":
+        # Local stub_llm_server.py for offline load tests
+        backend_url = os.getenv("LLM_STUB_URL", "http://127.0.0.1:8765/v1")
+        stub = OpenAICompatibleBackend("stub", model=model or "stub", base_url=backend_url)
+        stub.name = "stub"
+        return stub
+
+    raise ValueError(f"Unknown LLM_BACKEND: {backend}")
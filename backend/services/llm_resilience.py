@@ -0,0 +1,238 @@
+import asyncio
+import os
+import random
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+import openai
+
+T = TypeVar("T")
+
+# Statuses worth retrying: rate limiting, timeouts and server-side failures
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the backend while the circuit breaker is open"""
+
+    def __init__(self, retry_in: float):
+        self.retry_in = retry_in
+        super().__init__(f"LLM backend is unavailable, circuit open for another {retry_in:.0f}s")
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code
+    return getattr(error, "status_code", None)
+
+
+def is_retryable(error: Exception) -> bool:
+    """True for transient failures: connection problems, timeouts, 429 and 5xx"""
+    if isinstance(error, (httpx.TransportError, openai.APIConnectionError, asyncio.TimeoutError)):
+        return True
+    status = _status_code(error)
+    return status is not None and status in RETRYABLE_STATUS_CODES
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """The server's Retry-After hint, when it sent one"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Async token bucket: ``rate_per_minute`` sustained, bursts up to ``capacity``"""
+
+    def __init__(self, rate_per_minute: float, capacity: int):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        # The lock keeps waiters in FIFO order
+        async with self.lock:
+            self._refill()
+            if self.tokens < 1:
+                delay = (1 - self.tokens) / self.rate
+                self.waits += 1
+                self.wait_seconds += delay
+                await asyncio.sleep(delay)
+                self._refill()
+            self.tokens -= 1
+
+    def stats(self) -> Dict:
+        if self.rate > 0:
+            self._refill()
+        return {
+            "enabled": self.rate > 0,
+            "rate_per_minute": round(self.rate * 60, 2),
+            "capacity": self.capacity,
+            "tokens": round(self.tokens, 2),
+            "waits": self.waits,
+            "wait_seconds_total": round(self.wait_seconds, 2),
+        }
+
+
+class CircuitBreaker:
+    """Stop calling a failing backend for a while.
+
+    After ``failure_threshold`` consecutive transient failures the circuit
+    opens and calls fail immediately for ``reset_seconds``. Then one trial
+    call is let through (half-open): success closes the circuit, failure
+    opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.state = "closed"  # closed | open | half_open
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.opened_total = 0
+        self.rejected_total = 0
+        self.trial_in_flight = False
+
+    def before_call(self, claim_trial: bool = True) -> bool:
+        """Raise CircuitOpenError if the call may not go ahead; returns whether it is the half-open trial.
+
+        With ``claim_trial=False`` this only checks, so a caller can fail fast
+        before waiting for something else and claim the trial afterwards.
+        """
+        if self.state == "open":
+            remaining = self.opened_at + self.reset_seconds - time.monotonic()
+            if remaining > 0:
+                self.rejected_total += 1
+                raise CircuitOpenError(remaining)
+            self.state = "half_open"
+        if self.state == "half_open":
+            if self.trial_in_flight:
+                self.rejected_total += 1
+                raise CircuitOpenError(self.reset_seconds)
+            if claim_trial:
+                self.trial_in_flight = True
+                return True
+        return False
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.trial_in_flight = False
+        self.state = "closed"
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self.trial_in_flight = False
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                self.opened_total += 1
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict:
+        retry_in = max(0.0, self.opened_at + self.reset_seconds - time.monotonic()) if self.state == "open" else 0.0
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "opened_total": self.opened_total,
+            "rejected_total": self.rejected_total,
+            "retry_in_seconds": round(retry_in, 1),
+        }
+
+
+class ResiliencePolicy:
+    """Rate limiting, jittered exponential retry and a circuit breaker for backend calls"""
+
+    def __init__(self):
+        self.rate_limiter = TokenBucket(
+            rate_per_minute=float(os.getenv("LLM_RATE_LIMIT_RPM", "15")),
+            capacity=int(os.getenv("LLM_RATE_LIMIT_BURST", "5")),
+        )
+        self.breaker = CircuitBreaker(
+            failure_threshold=int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "5")),
+            reset_seconds=float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30")),
+        )
+        self.max_retries = int(os.getenv("LLM_MAX_RETRIES", "3"))
+        self.retry_base_seconds = float(os.getenv("LLM_RETRY_BASE_SECONDS", "1"))
+        self.retry_max_seconds = float(os.getenv("LLM_RETRY_MAX_SECONDS", "20"))
+        self.calls = 0
+        self.retries = 0
+        self.retries_exhausted = 0
+        self.failures_by_status: Dict[str, int] = {}
+
+    def backoff(self, attempt: int, error: Exception) -> float:
+        """Full-jitter exponential delay, never shorter than the server's Retry-After"""
+        delay = random.uniform(0, min(self.retry_max_seconds, self.retry_base_seconds * 2 ** attempt))
+        hint = retry_after_seconds(error)
+        if hint is not None:
+            delay = max(delay, min(hint, self.retry_max_seconds))
+        return delay
+
+    def record_failure(self, error: Exception):
+        status = _status_code(error)
+        label = str(status) if status is not None else type(error).__name__
+        self.failures_by_status[label] = self.failures_by_status.get(label, 0) + 1
+        if is_retryable(error):
+            self.breaker.record_failure()
+        else:
+            # The backend answered; the request itself was bad
+            self.breaker.record_success()
+
+    async def run(self, attempt_call: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        attempt = 0
+        while True:
+            # Fail fast while open, but claim the half-open trial only once a
+            # rate-limit token is in hand: a trial cancelled while queued would
+            # otherwise hold the slot forever
+            self.breaker.before_call(claim_trial=False)
+            await self.rate_limiter.acquire()
+            is_trial = self.breaker.before_call()
+            try:
+                result = await attempt_call()
+            except asyncio.CancelledError:
+                if is_trial:
+                    self.breaker.trial_in_flight = False
+                raise
+            except Exception as e:
+                self.record_failure(e)
+                if not is_retryable(e):
+                    raise
+                if attempt >= self.max_retries:
+                    self.retries_exhausted += 1
+                    raise
+                delay = self.backoff(attempt, e)
+                attempt += 1
+                self.retries += 1
+                await asyncio.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
+
+    def stats(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "retries_exhausted": self.retries_exhausted,
+            "max_retries": self.max_retries,
+            "failures": dict(self.failures_by_status),
+            "rate_limiter": self.rate_limiter.stats(),
+            "circuit_breaker": self.breaker.stats(),
+        }
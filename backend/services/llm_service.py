@@ -1,42 +1,171 @@
 import os
-import json
+import re
+import hashlib
+import unicodedata
 import asyncio
-import google.generativeai as genai
-from typing import Dict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from pydantic import ValidationError
 from dotenv import load_dotenv
 import gc
 import logging
 import sys
 import time
+import copy
+import textwrap
+
+from utils.disk_cache import DiskCache, fingerprint
+from utils.single_flight import SingleFlight
+from utils.micro_batcher import MicroBatcher
+from services.llm_backends import create_backend
+from services.llm_resilience import CircuitOpenError
+from utils.json_stream import IncrementalJSONParser
+from utils.transcript_compressor import compress_transcript
+from utils.json_repair import repair_json, JSONRepairError
+from utils.local_analyzer import analyze_locally
+from models.schemas import ActionItem, Objection
+
+# Receives ("field" | "item", key, value) as parts of the analysis are generated
+PartialCallback = Callable[[str, str, Any], None]
+
+# Expected output of each prompt: "text" is a non-empty string, "text_list" a list of
+# strings, a model class a list of objects validated against that schema
+ANALYSIS_FIELDS = {"title": "text", "summary": "text", "action_items": ActionItem, "objections": Objection, "crm_notes": "text"}
+WINDOW_FIELDS = {"key_points": "text_list", "action_items": ActionItem, "objections": Objection}
+MERGE_FIELDS = {"title": "text", "summary": "text", "crm_notes": "text"}
+
+# JSON structure lines used when re-asking for individual fields
+FIELD_PROMPTS = {
+    "title": '"title": "A concise meeting title (string)"',
+    "summary": '"summary": "A 2-3 sentence summary (string)"',
+    "crm_notes": '"crm_notes": "Sales-ready notes and next steps (string)"',
+    "key_points": '"key_points": ["Important facts, decisions or next steps (string)"]',
+    "action_items": '''"action_items": [
+        {
+            "task": "Task description (string)",
+            "assignee": "Person assigned or null if not mentioned (string or null)",
+            "due_date": "Due date or null if not mentioned (string or null)",
+            "priority": "high, medium, or low (string)"
+        }
+    ]''',
+    "objections": '''"objections": [
+        {
+            "concern": "Client concern (string)",
+            "response": "How it was addressed or null (string or null)"
+        }
+    ]''',
+}
+
+# Specialized passes: one small prompt per section, run concurrently.
+# (name, fields, instruction, default output-token budget, default timeout in seconds)
+ANALYSIS_PASSES = [
+    ("overview", ("title", "summary"), "Give the meeting a concise title and summarize it.", 256, 30),
+    ("action_items", ("action_items",), "List every action item agreed in the meeting: the task, who owns it and when it is due.", 768, 45),
+    ("objections", ("objections",), "List the concerns or objections the client raised and how each one was addressed.", 384, 30),
+    ("crm_notes", ("crm_notes",), "Write sales-ready CRM notes: account context, decisions and next steps.", 384, 30),
+]
 
 class LLMService:
+    # Bump whenever the analysis prompt changes so cached/deduplicated results are not reused
+    PROMPT_VERSION = "2"
+
     def __init__(self):
         # Setup logging
         self.logger = self._setup_logging()
         
-        # Configure the API key for Gemini
+        # Pick the backend (Gemini by default) and its API key from the environment
         load_dotenv()
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            error_msg = "GEMINI_API_KEY environment variable is not set"
-            self.logger.error(error_msg)
-            self.logger.dual_print(error_msg, "ERROR")
-            raise ValueError(error_msg)
-        
-        self.logger.info("Configuring Gemini API...")
         self.logger.dual_print("LLM Service initializing...")
-        
-        genai.configure(api_key=api_key)
-        # Use flash model for memory efficiency
-        self.model = genai.GenerativeModel("gemini-2.0-flash")
+        try:
+            self.backend = create_backend()
+        except ValueError as e:
+            self.logger.error(str(e))
+            self.logger.dual_print(str(e), "ERROR")
+            raise
+        self.model_name = self.backend.model
+        self.logger.info(f"Using {self.backend.name} backend with model {self.model_name}")
         
         # Configure generation for memory efficiency
-        self.generation_config = genai.types.GenerationConfig(
-            temperature=0.1,  # Lower temperature for consistency
-            max_output_tokens=1024,  # Limit output size
-            top_p=0.8,
-            top_k=20
+        self.generation_params = {
+            "temperature": 0.1,  # Lower temperature for consistency
+            "max_output_tokens": 1024,  # Limit output size
+            "top_p": 0.8,
+            "top_k": 20
+        }
+        # Pre-compress transcripts (whitespace, fillers, repeated sentences) before prompting
+        self.precompress = {
+            "enabled": os.getenv("LLM_PRECOMPRESS", "true").lower() == "true",
+            "remove_disfluencies": os.getenv("LLM_PRECOMPRESS_DISFLUENCIES", "true").lower() == "true",
+            "dedupe_similarity": float(os.getenv("LLM_PRECOMPRESS_DEDUPE_SIMILARITY", "0.85"))
+        }
+        self.compression_totals = {"transcripts": 0, "tokens_before": 0, "tokens_after": 0}
+        
+        # Fields that are missing, invalid or cut off are requested again in a small follow-up prompt
+        self.max_reasks = int(os.getenv("LLM_MAX_REASKS", "1"))
+        self.output_totals = {
+            "responses": 0,
+            "clean": 0,
+            "repaired": 0,
+            "truncated": 0,
+            "unparseable": 0,
+            "items_dropped": 0,
+            "invalid_fields": 0,
+            "reasks": 0,
+            "reask_fields": 0,
+            "reask_recovered_fields": 0
+        }
+        
+        # Short transcripts arriving together are analyzed in one prompt
+        self.batching = {
+            "enabled": os.getenv("LLM_BATCH_ENABLED", "false").lower() == "true",
+            "max_size": int(os.getenv("LLM_BATCH_MAX_SIZE", "4")),
+            "max_delay_ms": float(os.getenv("LLM_BATCH_MAX_DELAY_MS", "50")),
+            "max_transcript_tokens": int(os.getenv("LLM_BATCH_MAX_TRANSCRIPT_TOKENS", "800"))
+        }
+        self.batcher = MicroBatcher(self._analyze_batch, self.batching["max_size"], self.batching["max_delay_ms"] / 1000)
+        self.batch_totals = {"batch_calls": 0, "batched_transcripts": 0, "item_fallbacks": 0}
+        
+        # Local extractive analysis (no network) replaces the placeholder fallback and
+        # gives audio jobs a provisional result while the model is working
+        self.local_fallback = os.getenv("LLM_LOCAL_FALLBACK", "true").lower() == "true"
+        self.provisional_results = os.getenv("LLM_PROVISIONAL_RESULTS", "true").lower() == "true"
+        self.local_totals = {"runs": 0, "fallbacks": 0, "seconds": 0.0}
+        
+        # Overall budget for one analysis, covering retries, backoff and rate-limit waits;
+        # past it the caller gets the fallback analysis instead of an error (0 disables)
+        self.analysis_deadline_seconds = float(os.getenv("LLM_ANALYSIS_DEADLINE_SECONDS", "100"))
+        self.deadlines_exceeded = 0
+        
+        # Stream generated tokens and report fields/items as soon as they are complete
+        self.streaming = os.getenv("LLM_STREAMING", "false").lower() == "true"
+        
+        # Long transcripts are analyzed map-reduce style: chunk extraction calls, then one merge call
+        self.map_reduce_threshold_tokens = int(os.getenv("LLM_MAP_REDUCE_THRESHOLD_TOKENS", "6000"))
+        self.chunk_tokens = int(os.getenv("LLM_CHUNK_TOKENS", "3000"))
+        self.chunk_overlap_tokens = int(os.getenv("LLM_CHUNK_OVERLAP_TOKENS", "200"))
+        self.map_concurrency = int(os.getenv("LLM_MAP_CONCURRENCY", "3"))
+        
+        # Optionally split the single prompt into concurrent per-section passes, each with its own budget
+        self.specialized_passes = os.getenv("LLM_SPECIALIZED_PASSES", "false").lower() == "true"
+        self.pass_settings = {
+            name: {
+                "max_output_tokens": int(os.getenv(f"LLM_PASS_{name.upper()}_MAX_TOKENS", str(max_tokens))),
+                "timeout": float(os.getenv(f"LLM_PASS_{name.upper()}_TIMEOUT_SECONDS", str(timeout)))
+            }
+            for name, _, _, max_tokens, timeout in ANALYSIS_PASSES
+        }
+        
+        # Persistent cache of analyses keyed by normalized transcript, model, config and prompt version
+        backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.analysis_cache = DiskCache(
+            directory=os.getenv("LLM_CACHE_DIR", os.path.join(backend_dir, "cache", "analyses")),
+            max_bytes=int(os.getenv("LLM_CACHE_MAX_MB", "50")) * 1024 * 1024,
+            ttl_seconds=float(os.getenv("LLM_CACHE_TTL_HOURS", "168")) * 3600,
+            max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000")),
+            enabled=os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
         )
+        self.cache_bypasses = 0
+        # Identical analyses that overlap in time share one model call
+        self.in_flight = SingleFlight()
         
         self.logger.info("LLM Service initialized successfully")
         self.logger.dual_print("LLM Service ready")
@@ -73,10 +202,200 @@ class LLMService:
         logger.dual_print = dual_print
         return logger
 
-    async def analyze_transcript(self, transcript: str) -> Dict:
-        """Analyze meeting transcript and extract insights using Gemini"""
+    async def analyze_transcript(
+        self,
+        transcript: str,
+        mode: str = "auto",
+        bypass_cache: bool = False,
+        on_partial: Optional[PartialCallback] = None,
+        compute: Optional[Callable[[], Awaitable[Dict]]] = None
+    ) -> Dict:
+        """Analyze meeting transcript and extract insights using the LLM backend.
+
+        ``mode`` is "single" (one prompt), "passes" (concurrent per-section
+        prompts), "map_reduce" (chunked), "local" (extractive analysis without
+        the model, never cached) or "auto", which uses map-reduce once the
+        transcript exceeds the token threshold and otherwise passes or a
+        single prompt depending on ``LLM_SPECIALIZED_PASSES``.
+        Results are served from the analysis cache unless ``bypass_cache`` is
+        set; a bypassed request still refreshes the cached entry. Concurrent
+        requests for the same transcript share a single model call.
+        With streaming enabled, ``on_partial`` is called with each top-level
+        field and each action item/objection as soon as it is generated (only
+        the caller that started a shared call receives them).
+        ``compute`` replaces the model call on a cache miss (pipelined mode
+        passes its window merge), keeping the cache and coalescing; the
+        caller then names its own ``mode`` (e.g. "pipelined:6000") so its
+        results are cached apart from the built-in modes.
+        Past ``LLM_ANALYSIS_DEADLINE_SECONDS`` the result is the (uncached)
+        fallback analysis.
+        """
         request_id = str(hash(transcript[:50]))[:8]  # Short ID for this request
+        if mode == "local":
+            return await asyncio.to_thread(self.analyze_locally, transcript, request_id)
+        
+        cache_key = self._analysis_cache_key(transcript, mode)
+        if self.analysis_cache.enabled:
+            if bypass_cache:
+                self.cache_bypasses += 1
+            else:
+                cached = await asyncio.to_thread(self.analysis_cache.get, cache_key)
+                if cached is not None:
+                    self.logger.info(f"[{request_id}] Analysis cache hit")
+                    self.logger.dual_print(f"[{request_id}] LLM CACHE HIT - {cache_key[:12]}")
+                    return cached
         
+        if self.in_flight.is_running(cache_key):
+            self.logger.dual_print(f"[{request_id}] LLM REQUEST COALESCED - {cache_key[:12]}")
+        result = await self.in_flight.do(
+            cache_key, lambda: self._analyze_and_store(transcript, mode, request_id, cache_key, on_partial, compute)
+        )
+        # Callers share one result object; hand each its own copy
+        return copy.deepcopy(result)
+
+    async def _analyze_and_store(
+        self,
+        transcript: str,
+        mode: str,
+        request_id: str,
+        cache_key: str,
+        on_partial: Optional[PartialCallback],
+        compute: Optional[Callable[[], Awaitable[Dict]]] = None
+    ) -> Dict:
+        work = compute() if compute is not None else self._analyze(transcript, mode, request_id, on_partial)
+        try:
+            result = await asyncio.wait_for(work, timeout=self.analysis_deadline_seconds or None)
+        except asyncio.TimeoutError:
+            self.deadlines_exceeded += 1
+            self.logger.warning(f"[{request_id}] Analysis exceeded {self.analysis_deadline_seconds:g}s deadline, using fallback")
+            self.logger.dual_print(f"[{request_id}] LLM DEADLINE EXCEEDED - using fallback analysis", "WARNING")
+            result = await asyncio.to_thread(self._fallback_analysis, transcript)
+        
+        # Never cache a degraded result - the next request should retry the model
+        if self.analysis_cache.enabled and not self.is_degraded(result):
+            try:
+                await asyncio.to_thread(self.analysis_cache.set, cache_key, result)
+            except Exception as e:
+                self.logger.warning(f"[{request_id}] Failed to write analysis cache entry: {e}")
+        return result
+
+    @staticmethod
+    def is_degraded(result: Dict) -> bool:
+        """Whether any part of the result is a fallback, failed validation or lost a window"""
+        return bool(
+            result.get("is_fallback")
+            or result.get("fallback_sections")
+            or result.get("incomplete_fields")
+            or result.get("failed_windows")
+        )
+
+    def _analysis_cache_key(self, transcript: str, mode: str) -> str:
+        """Fingerprint of everything that determines the analysis output"""
+        normalized = " ".join(unicodedata.normalize("NFC", transcript).split())
+        return fingerprint(
+            hashlib.sha256(normalized.encode("utf-8")).hexdigest(),
+            self.model_name,
+            self.generation_params,
+            self.PROMPT_VERSION,
+            self.precompress,
+            mode,
+            self.specialized_passes,
+            self.pass_settings
+        )
+
+    def cache_stats(self) -> Dict:
+        return {**self.analysis_cache.stats(), "bypasses": self.cache_bypasses, "single_flight": self.in_flight.stats()}
+
+    def backend_stats(self) -> Dict:
+        return {
+            **self.backend.stats(),
+            "analysis_deadline_seconds": self.analysis_deadline_seconds,
+            "deadlines_exceeded": self.deadlines_exceeded
+        }
+
+    def output_stats(self) -> Dict:
+        totals = self.output_totals
+        responses = totals["responses"]
+        return {
+            **totals,
+            "repair_rate": round(totals["repaired"] / responses, 3) if responses else 0.0,
+            "reask_rate": round(totals["reasks"] / responses, 3) if responses else 0.0,
+            "reask_recovery_rate": round(totals["reask_recovered_fields"] / totals["reask_fields"], 3) if totals["reask_fields"] else 0.0
+        }
+
+    def batch_stats(self) -> Dict:
+        return {**self.batching, **self.batcher.stats(), **self.batch_totals}
+
+    def local_stats(self) -> Dict:
+        totals = self.local_totals
+        return {
+            "fallback_enabled": self.local_fallback,
+            "provisional_enabled": self.provisional_results,
+            **totals,
+            "seconds": round(totals["seconds"], 3),
+            "avg_ms": round(totals["seconds"] / totals["runs"] * 1000, 2) if totals["runs"] else 0.0
+        }
+
+    def analyze_locally(self, transcript: str, request_id: str = "local") -> Dict:
+        """Extractive analysis with the same shape as the model's, in milliseconds and without network"""
+        start = time.perf_counter()
+        result = analyze_locally(transcript)
+        elapsed = time.perf_counter() - start
+        self.local_totals["runs"] += 1
+        self.local_totals["seconds"] += elapsed
+        self.logger.dual_print(
+            f"[{request_id}] LOCAL ANALYSIS - {elapsed * 1000:.1f}ms - "
+            f"{len(result['action_items'])} action items, {len(result['objections'])} objections"
+        )
+        return {**result, "analyzer": "local"}
+
+    def compression_stats(self) -> Dict:
+        totals = self.compression_totals
+        before = totals["tokens_before"]
+        return {
+            **self.precompress,
+            **totals,
+            "reduction": round(1 - totals["tokens_after"] / before, 3) if before else 0.0
+        }
+
+    def _prepare_transcript(self, transcript: str, request_id: str) -> str:
+        """Apply the configured pre-compression and record how many tokens it saved"""
+        if not self.precompress["enabled"]:
+            return transcript
+        compressed, stats = compress_transcript(
+            transcript,
+            remove_disfluencies=self.precompress["remove_disfluencies"],
+            dedupe_similarity=self.precompress["dedupe_similarity"]
+        )
+        if not compressed:
+            return transcript
+        self.compression_totals["transcripts"] += 1
+        self.compression_totals["tokens_before"] += stats["tokens_before"]
+        self.compression_totals["tokens_after"] += stats["tokens_after"]
+        self.logger.dual_print(
+            f"[{request_id}] PRECOMPRESS - ~{stats['tokens_before']} -> ~{stats['tokens_after']} tokens "
+            f"({stats['reduction'] * 100:.0f}% saved, {stats['duplicate_sentences_dropped']} repeats dropped)"
+        )
+        return compressed
+
+    async def _analyze(
+        self, transcript: str, mode: str, request_id: str, on_partial: Optional[PartialCallback] = None
+    ) -> Dict:
+        """Run the analysis against the model (no caching)"""
+        original_transcript = transcript
+        transcript = self._prepare_transcript(transcript, request_id)
+        if mode == "map_reduce" or (mode == "auto" and self._estimate_tokens(transcript) > self.map_reduce_threshold_tokens):
+            return await self._analyze_map_reduce(transcript, request_id, on_partial, original_transcript)
+        if mode == "passes" or (mode == "auto" and self.specialized_passes):
+            return await self._analyze_passes(transcript, request_id, on_partial, original_transcript)
+        if self._batchable(transcript, mode):
+            return await self.batcher.submit((transcript, request_id, original_transcript))
+        return await self._analyze_single(transcript, request_id, on_partial, original_transcript)
+
+    async def _analyze_single(
+        self, transcript: str, request_id: str, on_partial: Optional[PartialCallback], original_transcript: str
+    ) -> Dict:
+        """Analyze the whole transcript with one prompt, falling back when the model fails"""
         self.logger.info(f"[{request_id}] Starting LLM analysis - transcript length: {len(transcript)}")
         self.logger.dual_print(f"[{request_id}] LLM ANALYSIS START - {len(transcript)} chars")
 
@@ -113,100 +432,14 @@ class LLMService:
         """
 
         try:
-            self.logger.info(f"[{request_id}] Sending request to Gemini API...")
-            self.logger.dual_print(f"[{request_id}] GEMINI API CALL...")
-            
-            api_start_time = time.time()
-            # Use memory-optimized generation
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                prompt,
-                generation_config=self.generation_config
+            return await self._generate_validated(
+                prompt, request_id, ANALYSIS_FIELDS, f"Meeting Transcript:\n{transcript}", on_partial
             )
-            api_time = time.time() - api_start_time
-            
-            self.logger.info(f"[{request_id}] Gemini API responded in {api_time:.2f}s")
-            self.logger.dual_print(f"[{request_id}] GEMINI RESPONSE - {api_time:.2f}s")
-
-            # Check if response exists and has text
-            if not response:
-                error_msg = "No response from Gemini API"
-                self.logger.error(f"[{request_id}] {error_msg}")
-                self.logger.dual_print(f"[{request_id}] NO RESPONSE", "ERROR")
-                raise ValueError(error_msg)
-            
-            if not hasattr(response, 'text') or not response.text:
-                error_msg = "Gemini response has no text content"
-                self.logger.error(f"[{request_id}] {error_msg}")
-                self.logger.dual_print(f"[{request_id}] NO TEXT CONTENT", "ERROR")
-                raise ValueError(error_msg)
-
-            content = response.text.strip()
-            self.logger.info(f"[{request_id}] Gemini raw output length: {len(content)}")
-            self.logger.dual_print(f"[{request_id}] RAW OUTPUT - {len(content)} chars")
-
-            # Guard: empty output
-            if not content:
-                error_msg = "Gemini response was empty"
-                self.logger.error(f"[{request_id}] {error_msg}")
-                self.logger.dual_print(f"[{request_id}] EMPTY RESPONSE", "ERROR")
-                raise ValueError(error_msg)
-
-            # Try to extract JSON from the text (best-effort)
-            json_start = content.find("{")
-            json_end = content.rfind("}")
-            
-            self.logger.info(f"[{request_id}] JSON extraction: start={json_start}, end={json_end}")
-            self.logger.dual_print(f"[{request_id}] JSON EXTRACT - start={json_start}, end={json_end}")
-            
-            if json_start == -1 or json_end == -1:
-                error_msg = "No JSON structure found in response"
-                self.logger.error(f"[{request_id}] {error_msg}")
-                self.logger.dual_print(f"[{request_id}] NO JSON STRUCTURE", "ERROR")
-                raise ValueError(error_msg)
-
-            json_text = content[json_start:json_end + 1]
-            self.logger.info(f"[{request_id}] Extracted JSON length: {len(json_text)}")
-            self.logger.dual_print(f"[{request_id}] JSON EXTRACTED - {len(json_text)} chars")
-
-            if not json_text or json_text == "{}":
-                error_msg = "Extracted JSON is empty or invalid"
-                self.logger.error(f"[{request_id}] {error_msg}")
-                self.logger.dual_print(f"[{request_id}] EMPTY JSON", "ERROR")
-                raise ValueError(error_msg)
-
-            # Try to parse the JSON
-            try:
-                result = json.loads(json_text)
-                self.logger.info(f"[{request_id}] Successfully parsed JSON result")
-                self.logger.dual_print(f"[{request_id}] JSON PARSE SUCCESS")
-                
-                # Force memory cleanup after successful processing
-                del content, response
-                gc.collect()
-                return result
-                
-            except json.JSONDecodeError as json_error:
-                self.logger.error(f"[{request_id}] JSON decode error: {json_error}")
-                self.logger.dual_print(f"[{request_id}] JSON DECODE ERROR: {json_error}", "ERROR")
-                
-                # Try cleaning the JSON text
-                cleaned_json = json_text.replace("'", '"').replace("True", "true").replace("False", "false").replace("None", "null")
-                try:
-                    result = json.loads(cleaned_json)
-                    self.logger.info(f"[{request_id}] Successfully parsed cleaned JSON")
-                    self.logger.dual_print(f"[{request_id}] CLEANED JSON SUCCESS")
-                    
-                    # Force memory cleanup
-                    del content, response
-                    gc.collect()
-                    return result
-                    
-                except json.JSONDecodeError:
-                    self.logger.error(f"[{request_id}] Even cleaned JSON failed to parse")
-                    self.logger.dual_print(f"[{request_id}] CLEANED JSON FAILED", "ERROR")
-                    raise ValueError(f"Failed to parse JSON: {json_error}")
-
+        except CircuitOpenError as e:
+            # Backend is known to be down - don't wait on it
+            self.logger.warning(f"[{request_id}] {e}")
+            self.logger.dual_print(f"[{request_id}] LLM CIRCUIT OPEN - using fallback", "WARNING")
+            return self._fallback_analysis(original_transcript)
         except Exception as e:
             error_msg = f"Error analyzing transcript: {e}"
             self.logger.error(f"[{request_id}] {error_msg}")
@@ -215,18 +448,629 @@ class LLMService:
             # Force cleanup on error too
             gc.collect()
             
-            # Return a more structured fallback response
+            return self._fallback_analysis(original_transcript)
+
+    def _batchable(self, transcript: str, mode: str) -> bool:
+        # Streaming reports fields per request, which a shared response can't do
+        return (
+            self.batching["enabled"]
+            and mode in ("auto", "single")
+            and not self.streaming
+            and self._estimate_tokens(transcript) <= self.batching["max_transcript_tokens"]
+        )
+
+    async def _analyze_batch(self, entries: List[Tuple[str, str, str]]) -> List[Dict]:
+        """Analyze several short transcripts with one prompt and hand each its own result.
+
+        ``entries`` are (transcript, request ID, original transcript). The
+        model returns one result per transcript ID; an entry that is missing
+        or fails validation is analyzed again on its own.
+        """
+        if len(entries) == 1:
+            transcript, request_id, original_transcript = entries[0]
+            return [await self._analyze_single(transcript, request_id, None, original_transcript)]
+        
+        batch_id = f"batch{self.batcher.batches}"
+        labels = [f"T{index + 1}" for index in range(len(entries))]
+        self.batch_totals["batch_calls"] += 1
+        self.batch_totals["batched_transcripts"] += len(entries)
+        self.logger.info(f"[{batch_id}] Batched analysis of {len(entries)} transcripts: {[entry[1] for entry in entries]}")
+        self.logger.dual_print(f"[{batch_id}] LLM BATCH START - {len(entries)} transcripts")
+        
+        structure = ",\n".join(['"id": "The transcript ID, e.g. T1 (string)"'] + [FIELD_PROMPTS[field] for field in ANALYSIS_FIELDS])
+        transcripts = "\n\n".join(f"Transcript {label}:\n{entry[0]}" for label, entry in zip(labels, entries))
+        prompt = f"""
+You are a meeting analysis assistant. Analyze each of the meeting transcripts below separately.
+
+IMPORTANT: Respond ONLY with valid JSON. Do not include any other text, explanations, or markdown formatting.
+
+Required JSON structure (one entry in "results" per transcript, in the same order):
+{{
+    "results": [
+        {{
+{textwrap.indent(structure, "            ")}
+        }}
+    ]
+}}
+
+{transcripts}
+
+Remember: Return ONLY the JSON object, nothing else.
+"""
+        # Each transcript gets the output budget a single request would have
+        params = {**self.generation_params, "max_output_tokens": self.generation_params["max_output_tokens"] * len(entries)}
+        by_label: Dict[str, Dict] = {}
+        try:
+            data, report = await self._generate_json(prompt, batch_id, params=params)
+            self.output_totals["responses"] += 1
+            self.output_totals["repaired" if report["repaired"] else "clean"] += 1
+            if report["truncated"]:
+                self.output_totals["truncated"] += 1
+            results = data.get("results")
+            for entry in results if isinstance(results, list) else []:
+                if isinstance(entry, dict) and entry.get("id") is not None:
+                    by_label.setdefault(str(entry["id"]).strip().upper(), entry)
+        except Exception as e:
+            self.logger.error(f"[{batch_id}] Batched analysis failed: {e}")
+            self.logger.dual_print(f"[{batch_id}] LLM BATCH FAILED: {e}", "ERROR")
+        
+        outcomes: List[Optional[Dict]] = []
+        for label in labels:
+            result, invalid = self._validate_output(by_label.get(label) or {}, ANALYSIS_FIELDS)
+            outcomes.append(None if invalid else result)
+        retry = [index for index, outcome in enumerate(outcomes) if outcome is None]
+        if retry:
+            self.batch_totals["item_fallbacks"] += len(retry)
+            self.logger.dual_print(f"[{batch_id}] LLM BATCH - {len(retry)}/{len(entries)} entries missing or invalid, analyzing them separately", "WARNING")
+            singles = await asyncio.gather(*(
+                self._analyze_single(entries[index][0], entries[index][1], None, entries[index][2]) for index in retry
+            ))
+            for index, single in zip(retry, singles):
+                outcomes[index] = single
+        return outcomes
+
+    async def _analyze_passes(
+        self, transcript: str, request_id: str, on_partial: Optional[PartialCallback], original_transcript: str
+    ) -> Dict:
+        """Run one small prompt per section concurrently; a failed pass only loses its own section"""
+        self.logger.info(f"[{request_id}] Specialized passes - {len(ANALYSIS_PASSES)} prompts, transcript length: {len(transcript)}")
+        self.logger.dual_print(f"[{request_id}] SPECIALIZED PASSES START - {len(ANALYSIS_PASSES)} prompts, {len(transcript)} chars")
+        source = f"Meeting Transcript:\n{transcript}"
+        
+        async def run_pass(name: str, fields: Tuple[str, ...], instruction: str) -> Dict:
+            settings = self.pass_settings[name]
+            params = {**self.generation_params, "max_output_tokens": settings["max_output_tokens"]}
+            pass_start = time.time()
+            result = await asyncio.wait_for(
+                self._generate_validated(
+                    self._fields_prompt(list(fields), source, instruction),
+                    f"{request_id}-{name}",
+                    {field: ANALYSIS_FIELDS[field] for field in fields},
+                    source,
+                    on_partial,
+                    params
+                ),
+                timeout=settings["timeout"]
+            )
+            self.logger.dual_print(f"[{request_id}] PASS {name} DONE - {time.time() - pass_start:.2f}s")
+            return result
+        
+        outcomes = await asyncio.gather(
+            *(run_pass(name, fields, instruction) for name, fields, instruction, _, _ in ANALYSIS_PASSES),
+            return_exceptions=True
+        )
+        
+        fallback: Optional[Dict] = None
+        analysis: Dict = {}
+        failed: List[str] = []
+        incomplete: List[str] = []
+        for (name, fields, _, _, _), outcome in zip(ANALYSIS_PASSES, outcomes):
+            if isinstance(outcome, BaseException):
+                reason = "timed out" if isinstance(outcome, asyncio.TimeoutError) else str(outcome)
+                self.logger.error(f"[{request_id}] Pass {name} failed: {reason}")
+                self.logger.dual_print(f"[{request_id}] PASS {name} FAILED: {reason}", "ERROR")
+                failed.append(name)
+                outcome = {}
+            else:
+                incomplete += outcome.get("incomplete_fields", [])
+            for field in fields:
+                if field not in outcome and fallback is None:
+                    fallback = self._fallback_analysis(original_transcript)
+                analysis[field] = outcome[field] if field in outcome else fallback[field]
+        
+        if len(failed) == len(ANALYSIS_PASSES):
+            gc.collect()
+            return fallback
+        if failed:
+            analysis["fallback_sections"] = failed
+        if incomplete:
+            analysis["incomplete_fields"] = incomplete
+        return analysis
+
+    async def analyze_window(self, window_text: str, window_index: int, precompress: bool = True) -> Dict:
+        """Extract action items, objections and key points from one part of a transcript.
+
+        Used for partial-window analysis while the rest of the meeting is still
+        being transcribed; ``merge_window_analyses`` combines the results.
+        """
+        request_id = f"win{window_index}"
+        if precompress:
+            window_text = self._prepare_transcript(window_text, request_id)
+        
+        self.logger.info(f"[{request_id}] Window analysis - {len(window_text)} chars")
+        self.logger.dual_print(f"[{request_id}] WINDOW ANALYSIS START - {len(window_text)} chars")
+
+        prompt = f"""
+        You are a meeting analysis assistant. The text below is one consecutive part of a longer meeting transcript.
+        Extract only what is stated in this part.
+
+        IMPORTANT: Respond ONLY with valid JSON. Do not include any other text, explanations, or markdown formatting.
+
+        Required JSON structure:
+        {{
+            "key_points": ["Important facts, decisions or next steps (string)"],
+            "action_items": [
+                {{
+                    "task": "Task description (string)",
+                    "assignee": "Person assigned or null if not mentioned (string or null)",
+                    "due_date": "Due date or null if not mentioned (string or null)",
+                    "priority": "high, medium, or low (string)"
+                }}
+            ],
+            "objections": [
+                {{
+                    "concern": "Client concern (string)",
+                    "response": "How it was addressed or null (string or null)"
+                }}
+            ]
+        }}
+
+        Transcript part {window_index + 1}:
+        {window_text}
+
+        Remember: Return ONLY the JSON object, nothing else.
+        """
+
+        try:
+            # No re-ask here: a window is one of many and the merge tolerates gaps
+            result = await self._generate_validated(prompt, request_id, WINDOW_FIELDS, None)
             return {
-                "title": f"Meeting Summary - {transcript[:30]}..." if len(transcript) > 30 else "Meeting Summary",
-                "summary": "Unable to process transcript automatically. Please review the original content.",
-                "action_items": [
-                    {
-                        "task": "Review meeting transcript manually",
-                        "assignee": None,
-                        "due_date": None,
-                        "priority": "medium"
-                    }
-                ],
-                "objections": [],
-                "crm_notes": f"Transcript processing failed. Original content length: {len(transcript)} characters. Please process manually."
-            }
\ No newline at end of file
+                "key_points": result.get("key_points") or [],
+                "action_items": result.get("action_items") or [],
+                "objections": result.get("objections") or [],
+            }
+        except Exception as e:
+            self.logger.error(f"[{request_id}] Window analysis failed: {e}")
+            self.logger.dual_print(f"[{request_id}] WINDOW ANALYSIS FAILED: {e}", "ERROR")
+            return {"key_points": [], "action_items": [], "objections": [], "failed": True}
+
+    async def _analyze_map_reduce(
+        self,
+        transcript: str,
+        request_id: str,
+        on_partial: Optional[PartialCallback] = None,
+        original_transcript: Optional[str] = None
+    ) -> Dict:
+        """Split a long transcript into overlapping chunks, extract from them concurrently, then merge"""
+        chunks = self._split_transcript(transcript, self.chunk_tokens, self.chunk_overlap_tokens)
+        self.logger.info(f"[{request_id}] Map-reduce analysis - {len(chunks)} chunks of ~{self.chunk_tokens} tokens")
+        self.logger.dual_print(f"[{request_id}] MAP-REDUCE START - {len(chunks)} chunks, concurrency {self.map_concurrency}")
+        
+        semaphore = asyncio.Semaphore(self.map_concurrency)
+        
+        async def map_chunk(index: int, chunk: str) -> Dict:
+            async with semaphore:
+                # Chunks come from an already compressed transcript
+                return await self.analyze_window(chunk, index, precompress=False)
+        
+        map_start = time.time()
+        windows = await asyncio.gather(*(map_chunk(index, chunk) for index, chunk in enumerate(chunks)))
+        failed = sum(1 for window in windows if window.get("failed"))
+        self.logger.dual_print(f"[{request_id}] MAP DONE - {time.time() - map_start:.2f}s - {failed}/{len(chunks)} failed")
+        
+        return await self.merge_window_analyses(list(windows), original_transcript or transcript, on_partial)
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Rough token count (~4 characters per token for English)"""
+        return len(text) // 4
+
+    @classmethod
+    def _split_transcript(cls, transcript: str, chunk_tokens: int, overlap_tokens: int) -> List[str]:
+        """Split at sentence boundaries into chunks of at most ``chunk_tokens``.
+
+        Each chunk repeats the last ~``overlap_tokens`` of the previous one so
+        items spanning a boundary are seen whole by at least one chunk.
+        """
+        sentences = [sentence for sentence in re.split(r"(?<=[.!?])\s+", transcript.strip()) if sentence]
+        # Sentences longer than a whole chunk (e.g. unpunctuated ASR output) are split by words
+        pieces: List[str] = []
+        for sentence in sentences:
+            if cls._estimate_tokens(sentence) <= chunk_tokens:
+                pieces.append(sentence)
+                continue
+            words = sentence.split()
+            words_per_piece = max(1, chunk_tokens * 3 // 4)
+            for start in range(0, len(words), words_per_piece):
+                pieces.append(" ".join(words[start:start + words_per_piece]))
+
+        chunks: List[str] = []
+        current: List[str] = []
+        current_tokens = 0
+        for piece in pieces:
+            piece_tokens = cls._estimate_tokens(piece) + 1
+            if current and current_tokens + piece_tokens > chunk_tokens:
+                chunks.append(" ".join(current))
+                # Carry the tail of this chunk into the next one
+                overlap: List[str] = []
+                overlap_size = 0
+                for previous in reversed(current):
+                    previous_tokens = cls._estimate_tokens(previous) + 1
+                    if overlap_size + previous_tokens > overlap_tokens:
+                        break
+                    overlap.insert(0, previous)
+                    overlap_size += previous_tokens
+                current, current_tokens = overlap, overlap_size
+            current.append(piece)
+            current_tokens += piece_tokens
+        if current:
+            chunks.append(" ".join(current))
+        return chunks
+
+    async def merge_window_analyses(
+        self, windows: List[Dict], transcript: str, on_partial: Optional[PartialCallback] = None
+    ) -> Dict:
+        """Combine per-window results into the final analysis.
+
+        Action items and objections are merged and deduplicated locally; one
+        small request turns the collected key points into title, summary and
+        CRM notes. ``failed_windows`` counts windows that contributed nothing.
+        """
+        request_id = "merge"
+        action_items = self._dedupe_items([item for window in windows for item in window["action_items"]], "task")
+        objections = self._dedupe_items([item for window in windows for item in window["objections"]], "concern")
+        key_points = [point for window in windows for point in window["key_points"]]
+        # Keep the reduce prompt within one chunk's budget
+        while len(key_points) > 1 and self._estimate_tokens("\n".join(key_points)) > self.chunk_tokens:
+            key_points = key_points[::2]
+
+        # Every window failed - there is nothing to merge
+        if windows and all(window.get("failed") for window in windows):
+            self.logger.warning(f"[{request_id}] All window analyses failed, using fallback")
+            return self._fallback_analysis(transcript)
+
+        # The merged items are final already - report them before the merge request
+        if on_partial is not None:
+            for item in action_items:
+                on_partial("item", "action_items", item)
+            for item in objections:
+                on_partial("item", "objections", item)
+
+        points_text = "\n".join(f"- {point}" for point in key_points) or "- (no key points extracted)"
+        tasks_text = "\n".join(f"- {item.get('task')}" for item in action_items) or "- (none)"
+        prompt = f"""
+        You are a meeting analysis assistant. Below are notes extracted from consecutive parts of one meeting.
+
+        IMPORTANT: Respond ONLY with valid JSON. Do not include any other text, explanations, or markdown formatting.
+
+        Required JSON structure:
+        {{
+            "title": "A concise meeting title (string)",
+            "summary": "A 2-3 sentence summary of the whole meeting (string)",
+            "crm_notes": "Sales-ready notes and next steps (string)"
+        }}
+
+        Key points:
+        {points_text}
+
+        Action items:
+        {tasks_text}
+
+        Remember: Return ONLY the JSON object, nothing else.
+        """
+
+        try:
+            result = await self._generate_validated(
+                prompt, request_id, MERGE_FIELDS, f"Key points:\n{points_text}\n\nAction items:\n{tasks_text}", on_partial
+            )
+        except Exception as e:
+            self.logger.error(f"[{request_id}] Merge request failed: {e}")
+            self.logger.dual_print(f"[{request_id}] MERGE FAILED: {e}", "ERROR")
+            fallback = self._fallback_analysis(transcript)
+            # Keep whatever the windows did extract
+            if action_items or objections:
+                fallback["action_items"] = action_items
+                fallback["objections"] = objections
+            return fallback
+
+        merged = {
+            "title": result.get("title") or "Meeting Summary",
+            "summary": result.get("summary") or "",
+            "action_items": action_items,
+            "objections": objections,
+            "crm_notes": result.get("crm_notes") or "",
+        }
+        failed_windows = sum(1 for window in windows if window.get("failed"))
+        if failed_windows:
+            merged["failed_windows"] = failed_windows
+        if result.get("incomplete_fields"):
+            merged["incomplete_fields"] = result["incomplete_fields"]
+        return merged
+
+    @staticmethod
+    def _dedupe_items(items: List[Dict], key: str, similarity: float = 0.8) -> List[Dict]:
+        """Drop items whose ``key`` text repeats an earlier one, filling in missing fields.
+
+        Texts count as duplicates when their word sets overlap by at least
+        ``similarity`` (Jaccard), which catches the same task extracted from
+        two overlapping chunks with slightly different wording.
+        """
+        kept_items: List[Dict] = []
+        kept_words: List[set] = []
+        for item in items:
+            text = str(item.get(key) or "").strip()
+            if not text:
+                continue
+            words = set(re.findall(r"[a-z0-9]+", text.lower()))
+            match = None
+            for index, existing in enumerate(kept_words):
+                union = words | existing
+                if union and len(words & existing) / len(union) >= similarity:
+                    match = index
+                    break
+            if match is None:
+                kept_items.append(dict(item))
+                kept_words.append(words)
+                continue
+            kept = kept_items[match]
+            for field, value in item.items():
+                if kept.get(field) in (None, "") and value not in (None, ""):
+                    kept[field] = value
+        return kept_items
+
+    async def _generate_validated(
+        self,
+        prompt: str,
+        request_id: str,
+        fields: Dict[str, Any],
+        reask_source: Optional[str],
+        on_partial: Optional[PartialCallback] = None,
+        params: Optional[Dict] = None
+    ) -> Dict:
+        """Generate, repair and validate a JSON answer, re-asking only for the fields that failed.
+
+        ``params`` overrides the default generation parameters. Raises
+        ValueError when nothing usable could be recovered.
+        """
+        data, report = await self._generate_json(prompt, request_id, on_partial, params)
+        self.output_totals["responses"] += 1
+        self.output_totals["repaired" if report["repaired"] else "clean"] += 1
+        if report["truncated"]:
+            self.output_totals["truncated"] += 1
+
+        result, invalid = self._validate_output(data, fields)
+        # A cut-off list may be missing items even though what survived is valid
+        invalid += [key for key in report["truncated_keys"] if key in fields and key not in invalid]
+        self.output_totals["invalid_fields"] += len(invalid)
+
+        for _ in range(self.max_reasks if reask_source else 0):
+            if not invalid:
+                break
+            self.output_totals["reasks"] += 1
+            self.output_totals["reask_fields"] += len(invalid)
+            self.logger.dual_print(f"[{request_id}] RE-ASK for {', '.join(invalid)}")
+            try:
+                extra, _ = await self._generate_json(
+                    self._reask_prompt(invalid, reask_source), f"{request_id}-reask", params=params
+                )
+            except Exception as e:
+                self.logger.warning(f"[{request_id}] Re-ask failed: {e}")
+                break
+            recovered, invalid = self._validate_output(extra, {field: fields[field] for field in invalid})
+            # Don't let an unusable answer replace what survived the first response
+            recovered = {field: value for field, value in recovered.items() if field not in invalid}
+            result.update(recovered)
+            self.output_totals["reask_recovered_fields"] += len(recovered)
+
+        if not result:
+            raise ValueError("LLM output had no valid fields")
+        if invalid:
+            self.logger.warning(f"[{request_id}] Fields still missing or invalid: {invalid}")
+            result["incomplete_fields"] = invalid
+        return result
+
+    def _validate_output(self, data: Dict, fields: Dict[str, Any]) -> Tuple[Dict, List[str]]:
+        """Keep the valid fields of ``data``; return them and the names of the missing/invalid ones.
+
+        Invalid entries inside a list are dropped; the list only counts as
+        invalid when it is missing or none of its entries survived.
+        """
+        result: Dict = {}
+        invalid: List[str] = []
+        for field, spec in fields.items():
+            value = data.get(field)
+            if spec == "text":
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    value = str(value)
+                if isinstance(value, str) and value.strip():
+                    result[field] = value.strip()
+                else:
+                    invalid.append(field)
+            elif spec == "text_list":
+                if isinstance(value, list):
+                    result[field] = [str(entry).strip() for entry in value if entry is not None and str(entry).strip()]
+                else:
+                    invalid.append(field)
+            else:
+                if not isinstance(value, list):
+                    invalid.append(field)
+                    continue
+                items = []
+                for entry in value:
+                    try:
+                        items.append(self._validate_item(spec, entry))
+                    except (ValidationError, TypeError, ValueError):
+                        self.output_totals["items_dropped"] += 1
+                result[field] = items
+                if value and not items:
+                    invalid.append(field)
+        return result, invalid
+
+    @staticmethod
+    def _validate_item(model, entry: Any) -> Dict:
+        """Validate one action item/objection after normalizing common model quirks"""
+        if not isinstance(entry, dict):
+            raise TypeError(f"Expected an object, got {type(entry).__name__}")
+        item = {}
+        for key, value in entry.items():
+            if isinstance(value, str):
+                value = value.strip()
+                if value.lower() in ("", "null", "none", "n/a"):
+                    value = None
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                value = str(value)
+            item[key] = value
+        if model is ActionItem:
+            priority = str(item.get("priority") or "medium").lower()
+            item["priority"] = priority if priority in ("high", "medium", "low") else "medium"
+        return model(**item).dict()
+
+    def _reask_prompt(self, fields: List[str], source: str) -> str:
+        return self._fields_prompt(fields, source, "Extract only the fields listed below from the meeting material.")
+
+    def _fields_prompt(self, fields: List[str], source: str, instruction: str) -> str:
+        structure = ",\n".join(FIELD_PROMPTS[field] for field in fields)
+        return f"""
+You are a meeting analysis assistant. {instruction}
+
+IMPORTANT: Respond ONLY with valid JSON. Do not include any other text, explanations, or markdown formatting.
+
+Required JSON structure:
+{{
+{textwrap.indent(structure, "    ")}
+}}
+
+{source}
+
+Remember: Return ONLY the JSON object, nothing else.
+"""
+
+    async def _generate_json(
+        self,
+        prompt: str,
+        request_id: str,
+        on_partial: Optional[PartialCallback] = None,
+        params: Optional[Dict] = None
+    ) -> Tuple[Dict, Dict]:
+        """Send a prompt to the LLM backend and parse the JSON object in its reply (with a repair report)"""
+        # The prompts are indented f-strings - don't pay for the indentation
+        prompt = textwrap.dedent(prompt).strip()
+        self.logger.info(f"[{request_id}] Sending request to {self.backend.name} backend...")
+        self.logger.dual_print(f"[{request_id}] LLM API CALL ({self.backend.name})...")
+        
+        params = params or self.generation_params
+        api_start_time = time.time()
+        if self.streaming:
+            text = await self._stream_text(prompt, request_id, on_partial, params)
+        else:
+            text = await self.backend.generate(prompt, params)
+        api_time = time.time() - api_start_time
+        
+        self.logger.info(f"[{request_id}] LLM backend responded in {api_time:.2f}s")
+        self.logger.dual_print(f"[{request_id}] LLM RESPONSE - {api_time:.2f}s")
+
+        if not text or not text.strip():
+            error_msg = "LLM response has no text content"
+            self.logger.error(f"[{request_id}] {error_msg}")
+            self.logger.dual_print(f"[{request_id}] NO TEXT CONTENT", "ERROR")
+            raise ValueError(error_msg)
+
+        return self._parse_json_response(text.strip(), request_id)
+
+    async def _stream_text(
+        self, prompt: str, request_id: str, on_partial: Optional[PartialCallback], params: Dict
+    ) -> str:
+        """Collect a streamed reply, reporting completed values to ``on_partial`` as they close"""
+        parser = IncrementalJSONParser() if on_partial is not None else None
+        pieces: List[str] = []
+        stream_start = time.time()
+        first_partial = None
+        async for piece in self.backend.stream(prompt, params):
+            pieces.append(piece)
+            if parser is None:
+                continue
+            for kind, key, value in parser.feed(piece):
+                if first_partial is None:
+                    first_partial = time.time() - stream_start
+                    self.logger.dual_print(f"[{request_id}] FIRST PARTIAL ({key}) - {first_partial:.2f}s")
+                try:
+                    on_partial(kind, key, value)
+                except Exception as e:
+                    self.logger.warning(f"[{request_id}] Partial result callback failed: {e}")
+        return "".join(pieces)
+
+    async def close(self):
+        """Close the backend's pooled HTTP connections"""
+        await self.backend.close()
+
+    def _parse_json_response(self, content: str, request_id: str) -> Tuple[Dict, Dict]:
+        """Extract the JSON object from raw model output, repairing it when needed"""
+        self.logger.info(f"[{request_id}] LLM raw output length: {len(content)}")
+        self.logger.dual_print(f"[{request_id}] RAW OUTPUT - {len(content)} chars")
+
+        # Guard: empty output
+        if not content:
+            error_msg = "LLM response was empty"
+            self.logger.error(f"[{request_id}] {error_msg}")
+            self.logger.dual_print(f"[{request_id}] EMPTY RESPONSE", "ERROR")
+            raise ValueError(error_msg)
+
+        try:
+            result, report = repair_json(content)
+        except JSONRepairError as e:
+            self.output_totals["unparseable"] += 1
+            self.logger.error(f"[{request_id}] {e}")
+            self.logger.dual_print(f"[{request_id}] JSON UNRECOVERABLE: {e}", "ERROR")
+            raise ValueError(f"Failed to parse JSON: {e}")
+
+        if report["repaired"]:
+            self.logger.warning(f"[{request_id}] Repaired JSON output - {report['fixes']} fixes, truncated keys: {report['truncated_keys']}")
+            self.logger.dual_print(f"[{request_id}] JSON REPAIRED - {report['fixes']} fixes" + (" (truncated)" if report["truncated"] else ""))
+        else:
+            self.logger.info(f"[{request_id}] Successfully parsed JSON result")
+            self.logger.dual_print(f"[{request_id}] JSON PARSE SUCCESS")
+
+        # Force memory cleanup after processing
+        del content
+        gc.collect()
+        return result, report
+
+    def _fallback_analysis(self, transcript: str) -> Dict:
+        """Result used when the model could not analyze the transcript.
+
+        The local extractive analysis when it is enabled and finds anything,
+        otherwise a structured placeholder.
+        """
+        if self.local_fallback and transcript.strip():
+            try:
+                local = self.analyze_locally(transcript, "fallback")
+                if local["summary"]:
+                    self.local_totals["fallbacks"] += 1
+                    return {**local, "is_fallback": True}
+            except Exception as e:
+                self.logger.warning(f"Local fallback analysis failed: {e}")
+        return {
+            "title": f"Meeting Summary - {transcript[:30]}..." if len(transcript) > 30 else "Meeting Summary",
+            "summary": "Unable to process transcript automatically. Please review the original content.",
+            "action_items": [
+                {
+                    "task": "Review meeting transcript manually",
+                    "assignee": None,
+                    "due_date": None,
+                    "priority": "medium"
+                }
+            ],
+            "objections": [],
+            "crm_notes": f"Transcript processing failed. Original content length: {len(transcript)} characters. Please process manually.",
+            "is_fallback": True
+        }
@@ -0,0 +1,127 @@
+import os
+import queue
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from faster_whisper import WhisperModel
+
+logger = logging.getLogger(__name__)
+
+
+class WhisperModelPool:
+    """Pool of loaded WhisperModel instances that transcriptions check out.
+
+    Instances are created on demand up to ``size``. Loading is single-flight:
+    a lock ensures concurrent first requests wait for one load instead of each
+    loading its own copy. ``preload`` loads every instance up front (e.g.
+    during FastAPI lifespan) and runs a short warm-up inference on each.
+    """
+
+    def __init__(self, model_name: str, size: Optional[int] = None):
+        self.model_name = model_name
+        self.size = max(1, size or int(os.getenv("WHISPER_MODEL_POOL_SIZE", "1")))
+        self._available: "queue.Queue[WhisperModel]" = queue.Queue()
+        self._load_lock = threading.Lock()
+        self._loaded = 0
+        self.state = "not_loaded"  # not_loaded | loading | ready | error
+        self.warmed_up = False
+        self.last_error: Optional[str] = None
+        self.load_times: List[float] = []
+
+    def _load_model(self) -> WhisperModel:
+        """Load one model instance, retrying transient download failures"""
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                model_start_time = time.time()
+                # Ultra-optimized model loading for Render deployment
+                model = WhisperModel(
+                    self.model_name,
+                    device="cpu",
+                    compute_type="int8",  # Fastest compute type
+                    download_root="/tmp",
+                    local_files_only=False,
+                    num_workers=1,  # Single worker to avoid thread overhead
+                )
+                self.load_times.append(round(time.time() - model_start_time, 2))
+                return model
+            except Exception as e:
+                logger.error(f"Attempt {attempt + 1}/{max_retries} failed to load model: {e}")
+                if attempt == max_retries - 1:
+                    raise
+                time.sleep(2)
+
+    def _grow(self, on_event: Callable[[str, Dict], None], only_if_starved: bool = True) -> bool:
+        """Load one more instance if the pool is not full; True if one was added"""
+        with self._load_lock:
+            # Re-check under the lock: another thread may have loaded one meanwhile
+            if self._loaded >= self.size or (only_if_starved and not self._available.empty()):
+                return False
+            self.state = "loading"
+            on_event("model_loading", {"model": self.model_name})
+            try:
+                model = self._load_model()
+            except Exception as e:
+                self.last_error = str(e)
+                self.state = "error" if self._loaded == 0 else "ready"
+                raise
+            self._loaded += 1
+            self.state = "ready"
+            self.last_error = None
+            on_event("model_loaded", {"model": self.model_name, "seconds": self.load_times[-1]})
+            self._available.put(model)
+            return True
+
+    def acquire(self, on_event: Optional[Callable[[str, Dict], None]] = None, timeout: Optional[float] = None) -> WhisperModel:
+        """Check out a model, loading one if the pool has spare capacity"""
+        emit = on_event or (lambda event, data: None)
+        if self._available.empty() and self._loaded < self.size:
+            self._grow(emit)
+        return self._available.get(timeout=timeout)
+
+    def release(self, model: WhisperModel):
+        """Return a checked-out model to the pool"""
+        self._available.put(model)
+
+    @contextmanager
+    def checkout(self, on_event: Optional[Callable[[str, Dict], None]] = None, timeout: Optional[float] = None):
+        model = self.acquire(on_event, timeout)
+        try:
+            yield model
+        finally:
+            self.release(model)
+
+    def preload(self, warmup: bool = True):
+        """Load every pool instance now and optionally run a warm-up inference on each"""
+        emit = lambda event, data: None
+        while self._grow(emit, only_if_starved=False):
+            pass
+        if warmup:
+            import numpy as np
+
+            silence = np.zeros(16000, dtype=np.float32)  # 1s of silence at 16kHz
+            models = [self.acquire() for _ in range(self._loaded)]
+            try:
+                for model in models:
+                    segments, _ = model.transcribe(silence, beam_size=1, language="en")
+                    list(segments)
+                self.warmed_up = True
+            finally:
+                for model in models:
+                    self.release(model)
+
+    def status(self) -> Dict:
+        return {
+            "state": self.state,
+            "model_name": self.model_name,
+            "pool_size": self.size,
+            "loaded": self._loaded,
+            "in_use": self._loaded - self._available.qsize(),
+            "available": self._available.qsize(),
+            "warmed_up": self.warmed_up,
+            "load_seconds": self.load_times,
+            "last_error": self.last_error,
+        }
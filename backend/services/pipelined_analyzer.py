@@ -0,0 +1,92 @@
+import asyncio
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+
+class PipelinedAnalyzer:
+    """Analyze a transcript in windows while it is still being transcribed.
+
+    Transcribed segments are fed in with ``add_segment``. Every time roughly
+    ``window_chars`` of new text has accumulated, a window analysis is
+    started in the background, so LLM work overlaps with Whisper. ``finish``
+    analyzes the remaining tail, waits for all windows and runs the merge
+    step. Transcripts too short to fill a single window are analyzed in one
+    regular request instead.
+    """
+
+    def __init__(self, llm_service, window_chars: Optional[int] = None, max_concurrency: Optional[int] = None):
+        self.llm_service = llm_service
+        self.window_chars = window_chars or int(os.getenv("LLM_PIPELINE_WINDOW_CHARS", "6000"))
+        max_concurrency = max_concurrency or int(os.getenv("LLM_PIPELINE_MAX_CONCURRENCY", "2"))
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.buffer: List[str] = []
+        self.buffer_chars = 0
+        self.tasks: List[asyncio.Task] = []
+
+    def add_segment(self, text: str):
+        """Append a transcribed segment; must be called on the event loop"""
+        text = text.strip()
+        if not text:
+            return
+        self.buffer.append(text)
+        self.buffer_chars += len(text) + 1
+        if self.buffer_chars >= self.window_chars:
+            self._start_window()
+
+    def _start_window(self):
+        window_text = " ".join(self.buffer)
+        self.buffer = []
+        self.buffer_chars = 0
+        self.tasks.append(asyncio.create_task(self._analyze(window_text, len(self.tasks))))
+
+    async def _analyze(self, window_text: str, window_index: int) -> Dict:
+        async with self.semaphore:
+            return await self.llm_service.analyze_window(window_text, window_index)
+
+    @property
+    def windows_started(self) -> int:
+        return len(self.tasks)
+
+    async def finish(self, transcript: str, on_partial: Optional[Callable[[str, str, Any], None]] = None) -> Dict:
+        """Analyze the remaining text and merge all window results.
+
+        The merge goes through ``analyze_transcript``, so it gets the
+        analysis cache and in-flight coalescing. Its cache entry is keyed by
+        the window size, apart from a regular request for the same transcript.
+        On a hit the window analyses are cancelled unused.
+        """
+        if not self.tasks:
+            # Never filled a window - a single regular request is cheaper
+            return await self.llm_service.analyze_transcript(transcript, on_partial=on_partial)
+
+        if self.buffer:
+            self._start_window()
+
+        async def merge() -> Dict:
+            results = await asyncio.gather(*self.tasks, return_exceptions=True)
+            windows = []
+            for result in results:
+                if isinstance(result, BaseException):
+                    # A window that raised contributes nothing, like one whose model call failed
+                    result = {"key_points": [], "action_items": [], "objections": [], "failed": True}
+                windows.append(result)
+            return await self.llm_service.merge_window_analyses(windows, transcript, on_partial)
+
+        try:
+            return await self.llm_service.analyze_transcript(
+                transcript, mode=f"pipelined:{self.window_chars}", on_partial=on_partial, compute=merge
+            )
+        finally:
+            # Windows nobody awaited (cache hit, joined call) must not keep running or leak errors
+            self.cancel()
+
+    def cancel(self):
+        """Cancel outstanding window analyses (e.g. when transcription fails)"""
+        for task in self.tasks:
+            task.cancel()
+            task.add_done_callback(_retrieve_exception)
+
+
+def _retrieve_exception(task: asyncio.Task):
+    if not task.cancelled():
+        task.exception()  # Mark retrieved so an unawaited failure is not logged
@@ -0,0 +1,97 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, List, Optional
+
+# Terminal events close a job's stream
+TERMINAL_EVENTS = ("done", "failed")
+
+
+class _JobChannel:
+    def __init__(self):
+        self.history: List[Dict] = []
+        self.subscribers: List[asyncio.Queue] = []
+        self.closed = False
+
+
+class ProgressBroker:
+    """In-process fan-out of job progress events to streaming clients.
+
+    Each job keeps a bounded history so a client that connects late first
+    receives what it missed and then live events. ``publish`` must run on the
+    event loop; worker threads use ``publish_threadsafe``.
+    """
+
+    def __init__(self, history_limit: int = 5000, max_channels: int = 200):
+        self.history_limit = history_limit
+        self.max_channels = max_channels
+        self.channels: "OrderedDict[str, _JobChannel]" = OrderedDict()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _channel(self, job_id: str) -> _JobChannel:
+        channel = self.channels.get(job_id)
+        if channel is None:
+            channel = self.channels[job_id] = _JobChannel()
+            # Forget the oldest finished jobs; live ones are never dropped
+            while len(self.channels) > self.max_channels:
+                oldest_id = next((key for key, value in self.channels.items() if value.closed), None)
+                if oldest_id is None:
+                    break
+                del self.channels[oldest_id]
+        return channel
+
+    def publish(self, job_id: str, event: str, data: Dict):
+        """Record an event for a job and push it to connected clients"""
+        self.loop = self.loop or asyncio.get_running_loop()
+        channel = self._channel(job_id)
+        if channel.closed:
+            return
+        message = {"event": event, "data": data, "time": round(time.time(), 3)}
+        channel.history.append(message)
+        if len(channel.history) > self.history_limit:
+            del channel.history[0]
+        for queue in channel.subscribers:
+            queue.put_nowait(message)
+        if event in TERMINAL_EVENTS:
+            channel.closed = True
+
+    def publish_threadsafe(self, job_id: str, event: str, data: Dict):
+        """Publish from a worker thread (e.g. the transcription executor)"""
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.publish, job_id, event, data)
+
+    def has_job(self, job_id: str) -> bool:
+        return job_id in self.channels
+
+    async def subscribe(self, job_id: str, keepalive: float = 15.0) -> AsyncIterator[Optional[Dict]]:
+        """Yield past then live events for a job; yields None as a keepalive tick"""
+        channel = self._channel(job_id)
+        queue: asyncio.Queue = asyncio.Queue()
+        for message in channel.history:
+            queue.put_nowait(message)
+        if not channel.closed:
+            channel.subscribers.append(queue)
+        try:
+            while True:
+                if channel.closed and queue.empty():
+                    return
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                yield message
+                if message["event"] in TERMINAL_EVENTS:
+                    return
+        finally:
+            if queue in channel.subscribers:
+                channel.subscribers.remove(queue)
+
+
+def format_sse(message: Optional[Dict]) -> str:
+    """Encode a broker message as a Server-Sent Events frame"""
+    if message is None:
+        return ": keepalive\n\n"
+    payload = json.dumps({**message["data"], "time": message["time"]}, default=str)
+    return f"event: {message['event']}\ndata: {payload}\n\n"
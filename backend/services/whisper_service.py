@@ -1,14 +1,19 @@
-from faster_whisper import WhisperModel
 import asyncio
 import os
 import subprocess
 import shutil
-from typing import Optional
+import hashlib
+import threading
+from typing import Callable, Dict, Optional
 import gc
 import logging
 import sys
 import time
 
+from services.chunked_transcriber import ChunkedTranscriber, TranscriptionCancelled, probe_duration
+from services.model_manager import WhisperModelPool
+from utils.disk_cache import DiskCache, fingerprint
+
 
 class WhisperService:
     def __init__(self, model_name: str = "tiny.en"):
@@ -26,11 +31,33 @@ class WhisperService:
         
         self.logger.info(f"Loading faster-whisper model: {model_name}")
         
-        # Initialize model with error handling and memory optimization
-        self.model = None
-        # Don't load model in __init__ to save memory - load on demand
+        # Don't load model in __init__ to save memory - load on demand or via preload()
         self.model_name = model_name
-        self.logger.info("Model will be loaded on first transcription request")
+        self.model_pool = WhisperModelPool(model_name)
+        self.logger.info(f"Model pool of {self.model_pool.size} will be loaded on first transcription request or at startup")
+        
+        # Decoding parameters tuned for speed on CPU
+        self.transcribe_params = {
+            "beam_size": 1,  # Minimum beam size for maximum speed
+            "language": "en",  # Specify language to avoid detection overhead
+            "condition_on_previous_text": False,  # Faster processing
+            "vad_filter": True,  # Enable VAD to skip silence - helps with speed
+            "word_timestamps": False,  # Disable word timestamps for speed
+            "temperature": 0.0,  # Deterministic output for speed
+            "suppress_blank": True,  # Skip blank segments
+            "no_speech_threshold": 0.6  # Skip segments with low speech probability
+        }
+        
+        # Long recordings can be split at silences and transcribed in parallel processes
+        self.chunked_transcriber = ChunkedTranscriber(model_name)
+        
+        # On-disk cache of segments keyed by audio content hash + decoding parameters
+        backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.transcript_cache = DiskCache(
+            directory=os.getenv("WHISPER_CACHE_DIR", os.path.join(backend_dir, "cache", "transcripts")),
+            max_bytes=int(os.getenv("WHISPER_CACHE_MAX_MB", "100")) * 1024 * 1024,
+            enabled=os.getenv("WHISPER_CACHE_ENABLED", "true").lower() == "true"
+        )
         
         self._verify_ffmpeg()
         
@@ -69,35 +96,6 @@ class WhisperService:
         logger.dual_print = dual_print
         return logger
         
-    def _initialize_model(self, model_name: str):
-        """Initialize Whisper model with robust error handling"""
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                self.logger.info(f"Attempt {attempt + 1}/{max_retries} to load model")
-                # Use CPU and optimize for memory
-                self.model = WhisperModel(
-                    model_name, 
-                    device="cpu",
-                    compute_type="int8",  # Use int8 for lower memory usage
-                    download_root="/tmp",  # Use /tmp for model cache
-                    local_files_only=False
-                )
-                self.logger.info(f"Faster-whisper model '{model_name}' loaded successfully")
-                self.logger.dual_print(f"Model {model_name} loaded successfully")
-                return
-            except Exception as e:
-                self.logger.error(f"Attempt {attempt + 1}/{max_retries} failed to load model: {e}")
-                self.logger.dual_print(f"Model load attempt {attempt + 1} failed: {e}", "ERROR")
-                if attempt == max_retries - 1:
-                    self.logger.warning("Falling back to runtime model loading")
-                    self.logger.dual_print("Falling back to runtime model loading", "WARNING")
-                    # Don't raise error, handle at transcription time
-                    self.model = None
-                    return
-                # Wait a bit before retry
-                time.sleep(2)
-    
     def _setup_ffmpeg_path(self):
         """Setup FFmpeg path in environment"""
         local_ffmpeg_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../bin"))
@@ -154,8 +152,23 @@ class WhisperService:
         self.logger.dual_print("FFmpeg not found - this will cause transcription to fail", "ERROR")
         return False
 
-    async def transcribe(self, audio_file_path: str) -> str:
-        """Asynchronously transcribe audio using open-source Whisper."""
+    async def transcribe(
+        self,
+        audio_file_path: str,
+        on_event: Optional[Callable[[str, Dict], None]] = None,
+        audio_hash: Optional[str] = None
+    ) -> str:
+        """Asynchronously transcribe audio using open-source Whisper.
+
+        ``on_event(event, data)`` is called from the executor thread for model
+        loading and for every transcribed segment as it is produced.
+        ``audio_hash`` (SHA-256 of the file) avoids re-hashing the file for the
+        transcript cache when the caller already knows it.
+
+        Cancelling the call (e.g. a timeout) stops the transcription at the
+        next segment or chunk and returns only once the executor work has
+        ended, so resources held around this call are not released early.
+        """
         try:
             self.logger.info(f"Starting transcription process for: {audio_file_path}")
             self.logger.dual_print(f"TRANSCRIPTION START: {audio_file_path}")
@@ -206,9 +219,21 @@ class WhisperService:
             self.logger.dual_print("TRANSCRIPTION PROCESSING...")
             
             start_time = time.time()
-            result = await loop.run_in_executor(
-                None, self._transcribe_sync_safe, audio_file_path
+            cancel_event = threading.Event()
+            future = loop.run_in_executor(
+                None, self._transcribe_sync_safe, audio_file_path, on_event, audio_hash, cancel_event
             )
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The executor thread keeps running unless told to stop - wait for it to wind down
+                cancel_event.set()
+                self.logger.dual_print("TRANSCRIPTION CANCELLED - waiting for the worker to stop", "WARNING")
+                try:
+                    await future
+                except Exception:
+                    pass
+                raise
             end_time = time.time()
             
             processing_time = end_time - start_time
@@ -221,8 +246,20 @@ class WhisperService:
             self.logger.dual_print(f"TRANSCRIPTION FAILED: {e}", "ERROR")
             raise Exception(f"Failed to transcribe: {str(e)}")
 
-    def _transcribe_sync_safe(self, audio_file_path: str) -> str:
-        """Memory-optimized transcription method using faster-whisper."""
+    def _transcribe_sync_safe(
+        self,
+        audio_file_path: str,
+        on_event: Optional[Callable[[str, Dict], None]] = None,
+        audio_hash: Optional[str] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> str:
+        """Memory-optimized transcription method using faster-whisper.
+
+        Raises TranscriptionCancelled between segments once ``cancel_event`` is set.
+        """
+        emit = on_event or (lambda event, data: None)
+        cancel_event = cancel_event or threading.Event()
+
         # Final check before transcription
         if not os.path.exists(audio_file_path):
             error_msg = f"File not found at transcription time: {audio_file_path}"
@@ -230,29 +267,40 @@ class WhisperService:
             self.logger.dual_print(error_msg, "ERROR")
             raise FileNotFoundError(error_msg)
         
-        # Lazy load model if not initialized
-        if self.model is None:
-            self.logger.info("Loading model on demand to save memory...")
-            self.logger.dual_print("MODEL LOADING...")
-            try:
-                model_start_time = time.time()
-                # Ultra-optimized model loading for Render deployment
-                self.model = WhisperModel(
-                    self.model_name, 
-                    device="cpu",
-                    compute_type="int8",  # Fastest compute type
-                    download_root="/tmp",
-                    local_files_only=False,
-                    num_workers=1,  # Single worker to avoid thread overhead
-                )
-                model_load_time = time.time() - model_start_time
-                self.logger.info(f"Model {self.model_name} loaded successfully in {model_load_time:.2f}s")
-                self.logger.dual_print(f"MODEL LOADED in {model_load_time:.2f}s")
-            except Exception as e:
-                error_msg = f"Failed to load model: {e}"
-                self.logger.error(error_msg)
-                self.logger.dual_print(f"MODEL LOAD FAILED: {e}", "ERROR")
-                raise Exception(f"Failed to load Whisper model: {str(e)}")
+        # Identical audio decoded with identical parameters - reuse the stored segments
+        cache_key = None
+        if self.transcript_cache.enabled:
+            cache_key = self._transcript_cache_key(audio_hash or self._hash_file(audio_file_path))
+            cached = self.transcript_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Transcript cache hit - {len(cached['segments'])} segments")
+                self.logger.dual_print(f"TRANSCRIPT CACHE HIT - {cache_key[:12]}")
+                for segment in cached["segments"]:
+                    emit("segment", segment)
+                return cached["text"]
+        
+        # Long-audio mode: parallel chunks in worker processes, each with its own model
+        if self.chunked_transcriber.enabled:
+            duration = probe_duration(audio_file_path)
+            if self.chunked_transcriber.should_use(duration):
+                return self._transcribe_chunked(audio_file_path, duration, emit, cache_key, cancel_event)
+        
+        # Check out a model from the pool - loaded once on first use, shared across requests
+        def on_pool_event(event, data):
+            if event == "model_loading":
+                self.logger.dual_print("MODEL LOADING...")
+            elif event == "model_loaded":
+                self.logger.info(f"Model {self.model_name} loaded successfully in {data['seconds']:.2f}s")
+                self.logger.dual_print(f"MODEL LOADED in {data['seconds']:.2f}s")
+            emit(event, data)
+        
+        try:
+            model = self.model_pool.acquire(on_event=on_pool_event)
+        except Exception as e:
+            error_msg = f"Failed to load model: {e}"
+            self.logger.error(error_msg)
+            self.logger.dual_print(f"MODEL LOAD FAILED: {e}", "ERROR")
+            raise Exception(f"Failed to load Whisper model: {str(e)}")
         
         try:
             self.logger.info("Starting faster-whisper transcription")
@@ -264,22 +312,16 @@ class WhisperService:
             # Start with basic parameters and add optimizations that are supported
             try:
                 # Try optimized parameters first
-                segments, info = self.model.transcribe(
+                segments, info = model.transcribe(
                     audio_file_path,
-                    beam_size=1,  # Minimum beam size for maximum speed
-                    language="en",  # Specify language to avoid detection overhead
-                    condition_on_previous_text=False,  # Faster processing
-                    vad_filter=True,  # Enable VAD to skip silence - helps with speed
-                    word_timestamps=False,  # Disable word timestamps for speed
-                    temperature=0.0,  # Deterministic output for speed
-                    suppress_blank=True,  # Skip blank segments
-                    no_speech_threshold=0.6  # Skip segments with low speech probability
+                    **self.transcribe_params
                 )
                 self.logger.dual_print("Using optimized transcription parameters")
             except TypeError as param_error:
                 # Fallback to basic parameters if some aren't supported
                 self.logger.dual_print(f"Parameter error, using basic transcription: {param_error}", "WARNING")
-                segments, info = self.model.transcribe(
+                cache_key = None  # Different parameters than the cache key describes
+                segments, info = model.transcribe(
                     audio_file_path,
                     beam_size=1,
                     language="en",
@@ -293,14 +335,21 @@ class WhisperService:
             # Extract text from segments efficiently (avoid converting to list)
             transcript_text = ""
             segment_count = 0
+            cache_segments = []
             
             # Process segments directly from generator for better performance
             self.logger.dual_print("Processing segments directly...")
             processing_start = time.time()
             
             for segment in segments:
+                if cancel_event.is_set():
+                    raise TranscriptionCancelled("Transcription cancelled")
                 transcript_text += segment.text + " "
                 segment_count += 1
+                segment_data = {"text": segment.text, "start": round(segment.start, 3), "end": round(segment.end, 3)}
+                emit("segment", segment_data)
+                if cache_key:
+                    cache_segments.append(segment_data)
                 
                 # Log progress every 5 segments for monitoring without performance hit
                 if segment_count % 5 == 0:
@@ -316,17 +365,14 @@ class WhisperService:
             del segments, info
             gc.collect()
             
-            # Optional: Unload model after transcription to free memory
-            # Comment out if you want to keep model loaded for subsequent requests
-            # print("🗑️ Unloading model to free memory...")
-            # del self.model
-            # self.model = None
-            # gc.collect()
-            
             final_text = transcript_text.strip()
             self.logger.info(f"Final transcript length: {len(final_text)} characters")
+            self._store_transcript(cache_key, cache_segments, final_text)
             return final_text
             
+        except TranscriptionCancelled:
+            gc.collect()
+            raise
         except Exception as e:
             error_msg = f"Faster-whisper transcription failed: {e}"
             self.logger.error(error_msg)
@@ -334,6 +380,84 @@ class WhisperService:
             # Force cleanup on error
             gc.collect()
             raise Exception(f"Transcription failed: {str(e)}")
+        finally:
+            self.model_pool.release(model)
+
+    def _transcript_cache_key(self, audio_hash: str) -> str:
+        """Cache key from the audio content hash and a canonical fingerprint of decoding parameters"""
+        return fingerprint(
+            audio_hash,
+            {"model": self.model_name, "compute_type": "int8", **self.transcribe_params}
+        )
+
+    @staticmethod
+    def _hash_file(audio_file_path: str, chunk_size: int = 1024 * 1024) -> str:
+        """SHA-256 of a file, read in chunks"""
+        sha256 = hashlib.sha256()
+        with open(audio_file_path, "rb") as audio_file:
+            for chunk in iter(lambda: audio_file.read(chunk_size), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def _store_transcript(self, cache_key: Optional[str], segments: list, text: str):
+        """Write segments to the transcript cache; failures never fail the transcription"""
+        if not cache_key:
+            return
+        try:
+            self.transcript_cache.set(cache_key, {"segments": segments, "text": text})
+        except Exception as e:
+            self.logger.warning(f"Failed to write transcript cache entry: {e}")
+
+    def preload(self, warmup: bool = True):
+        """Load the model pool ahead of the first request (blocking - run in a thread)."""
+        try:
+            self.logger.dual_print(f"MODEL PRELOAD - {self.model_pool.size} instance(s) of {self.model_name}")
+            preload_start = time.time()
+            self.model_pool.preload(warmup=warmup)
+            self.logger.dual_print(f"MODEL PRELOAD DONE - {time.time() - preload_start:.2f}s")
+        except Exception as e:
+            # Not fatal - requests fall back to loading on demand
+            self.logger.error(f"Model preload failed: {e}")
+            self.logger.dual_print(f"MODEL PRELOAD FAILED: {e}", "ERROR")
+
+    def _transcribe_chunked(
+        self,
+        audio_file_path: str,
+        duration: float,
+        emit: Callable[[str, Dict], None],
+        cache_key: Optional[str] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> str:
+        """Transcribe a long recording as silence-delimited chunks across a process pool."""
+        try:
+            self.logger.info(f"Long-audio mode for {duration:.0f}s recording")
+            self.logger.dual_print(f"LONG AUDIO MODE - {duration:.0f}s")
+            
+            transcription_start = time.time()
+            segments, chunk_count, worker_count = self.chunked_transcriber.transcribe(
+                audio_file_path, duration, self.transcribe_params,
+                on_segment=lambda segment: emit("segment", segment),
+                cancel_event=cancel_event
+            )
+            transcription_time = time.time() - transcription_start
+            
+            self.logger.info(f"Chunked transcription completed in {transcription_time:.2f}s - {chunk_count} chunks, {worker_count} workers, {len(segments)} segments")
+            self.logger.dual_print(f"WHISPER COMPLETE - {transcription_time:.2f}s - {chunk_count} chunks on {worker_count} workers")
+            
+            final_text = " ".join(segment["text"].strip() for segment in segments).strip()
+            self._store_transcript(cache_key, segments, final_text)
+            del segments
+            gc.collect()
+            return final_text
+        except TranscriptionCancelled:
+            gc.collect()
+            raise
+        except Exception as e:
+            error_msg = f"Chunked transcription failed: {e}"
+            self.logger.error(error_msg)
+            self.logger.dual_print(f"CHUNKED WHISPER FAILED: {e}", "ERROR")
+            gc.collect()
+            raise Exception(f"Transcription failed: {str(e)}")
 
     def _transcribe_sync(self, audio_file_path: str) -> str:
         """Legacy method - now calls the optimized version."""
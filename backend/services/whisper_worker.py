@@ -0,0 +1,52 @@
+import subprocess
+from typing import Dict, List
+
+SAMPLE_RATE = 16000
+
+# Long-audio worker processes unpickle their tasks from this module, so it
+# imports only the standard library, NumPy and faster-whisper, no app services
+
+# Model held by each worker process, loaded once by init_worker
+_worker_model = None
+
+
+def init_worker(model_name: str, cpu_threads: int):
+    """Load a private WhisperModel in each pool process"""
+    global _worker_model
+    from faster_whisper import WhisperModel
+
+    _worker_model = WhisperModel(
+        model_name,
+        device="cpu",
+        compute_type="int8",
+        download_root="/tmp",
+        cpu_threads=cpu_threads,
+        num_workers=1,
+    )
+
+
+def _decode_slice(audio_file_path: str, start: float, end: float):
+    """Decode [start, end) of the file to 16kHz mono float32 with FFmpeg"""
+    import numpy as np
+
+    result = subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-v", "error",
+            "-ss", f"{start:.3f}", "-t", f"{end - start:.3f}",
+            "-i", audio_file_path,
+            "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "-",
+        ],
+        capture_output=True,
+        check=True,
+    )
+    return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
+
+
+def transcribe_chunk(audio_file_path: str, start: float, end: float, params: Dict) -> List[Dict]:
+    """Transcribe one chunk in a worker process; timestamps are shifted to file time"""
+    audio = _decode_slice(audio_file_path, start, end)
+    segments, _ = _worker_model.transcribe(audio, **params)
+    return [
+        {"start": round(segment.start + start, 3), "end": round(segment.end + start, 3), "text": segment.text}
+        for segment in segments
+    ]
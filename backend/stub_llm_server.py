@@ -0,0 +1,180 @@
+"""Local stand-in for the LLM API, for load-testing the upload pipeline offline.
+
+Speaks both the OpenAI chat completions API and Gemini ``generateContent``
+(each with its streaming variant) and answers every prompt with deterministic JSON shaped like the analysis
+the app asks for. Responses are delayed by a configurable latency, plus
+time per 1k prompt tokens, plus a jitter derived from the prompt hash, so
+runs are repeatable.
+
+    python stub_llm_server.py --port 8765 --latency-ms 800 --jitter-ms 200 --ms-per-1k-tokens 300
+
+Then start the backend with ``LLM_BACKEND=stub`` (and ``LLM_STUB_URL`` if the
+port differs), or point ``GEMINI_BASE_URL`` at ``http://127.0.0.1:8765/v1beta``.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+LATENCY_MS = float(os.getenv("STUB_LLM_LATENCY_MS", "500"))
+JITTER_MS = float(os.getenv("STUB_LLM_JITTER_MS", "0"))
+# Prompt processing cost, so prompt size shows up in latency
+MS_PER_1K_TOKENS = float(os.getenv("STUB_LLM_MS_PER_1K_TOKENS", "0"))
+
+app = FastAPI(title="Stub LLM Server")
+stats = {"requests": 0, "in_flight": 0, "max_in_flight": 0}
+
+
+def _sentences(prompt: str, limit: int):
+    """Pull a few sentences out of the text the prompt carries"""
+    body = prompt.split("Transcript", 1)[-1] if "Transcript" in prompt else prompt
+    body = body.split("Remember:", 1)[0]
+    sentences = [s.strip(" -:\n") for s in re.split(r"(?<=[.!?])\s+|\n", body)]
+    return [s for s in sentences if len(s.split()) >= 3][:limit]
+
+
+def build_response(prompt: str) -> dict:
+    """Deterministic JSON matching whichever analysis prompt was sent"""
+    if '"results":' in prompt:
+        # Micro-batched prompt: one result per "Transcript T<n>:" section
+        sections = re.findall(r"Transcript (T\d+):\n(.*?)(?=\n+Transcript T\d+:|\n+Remember:|\Z)", prompt, re.DOTALL)
+        return {
+            "results": [
+                {"id": label, **{key: value for key, value in _analysis(text).items() if key != "key_points"}}
+                for label, text in sections
+            ]
+        }
+    full = _analysis(prompt)
+    # Answer only the fields the prompt's JSON structure asks for
+    requested = {key: value for key, value in full.items() if f'"{key}":' in prompt}
+    return requested or {key: full[key] for key in ("title", "summary", "crm_notes")}
+
+
+def _analysis(text: str) -> dict:
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    sentences = _sentences(text, 3) or ["Discussed the next steps."]
+    action_items = [
+        {"task": f"Follow up on: {sentence[:80]}", "assignee": None, "due_date": None, "priority": ("high", "medium", "low")[i % 3]}
+        for i, sentence in enumerate(sentences[:2])
+    ]
+
+    return {
+        "title": f"Meeting {digest[:6]}",
+        "summary": " ".join(sentences)[:300],
+        "key_points": sentences,
+        "action_items": action_items,
+        "objections": [{"concern": "Pricing", "response": None}] if int(digest[0], 16) % 2 else [],
+        "crm_notes": f"Stub analysis {digest[:12]}.",
+    }
+
+
+def _delay_seconds(prompt: str) -> float:
+    jitter = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:4], 16) / 0xFFFF * JITTER_MS
+    prompt_ms = len(prompt) / 4 / 1000 * MS_PER_1K_TOKENS
+    return (LATENCY_MS + jitter + prompt_ms) / 1000
+
+
+async def _respond(prompt: str) -> str:
+    stats["requests"] += 1
+    stats["in_flight"] += 1
+    stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+    try:
+        await asyncio.sleep(_delay_seconds(prompt))
+        return json.dumps(build_response(prompt), indent=2)
+    finally:
+        stats["in_flight"] -= 1
+
+
+async def _respond_stream(prompt: str, chunk_chars: int = 24):
+    """Yield the response in small pieces spread over the configured latency"""
+    stats["requests"] += 1
+    stats["in_flight"] += 1
+    stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+    try:
+        content = json.dumps(build_response(prompt), indent=2)
+        pieces = [content[i:i + chunk_chars] for i in range(0, len(content), chunk_chars)]
+        delay = _delay_seconds(prompt) / max(1, len(pieces))
+        for piece in pieces:
+            await asyncio.sleep(delay)
+            yield piece
+    finally:
+        stats["in_flight"] -= 1
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    payload = await request.json()
+    prompt = "\n".join(str(message.get("content", "")) for message in payload.get("messages", []))
+    completion_id = f"chatcmpl-{hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:12]}"
+    if payload.get("stream"):
+        async def events():
+            async for piece in _respond_stream(prompt):
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": payload.get("model", "stub"),
+                    "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    content = await _respond(prompt)
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": payload.get("model", "stub"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4, "total_tokens": (len(prompt) + len(content)) // 4},
+    }
+
+
+@app.post("/v1beta/models/{model}:generateContent")
+async def generate_content(model: str, request: Request):
+    payload = await request.json()
+    prompt = "\n".join(
+        part.get("text", "") for content in payload.get("contents", []) for part in content.get("parts", [])
+    )
+    content = await _respond(prompt)
+    return {"candidates": [{"content": {"role": "model", "parts": [{"text": content}]}, "finishReason": "STOP"}]}
+
+
+@app.post("/v1beta/models/{model}:streamGenerateContent")
+async def stream_generate_content(model: str, request: Request):
+    payload = await request.json()
+    prompt = "\n".join(
+        part.get("text", "") for content in payload.get("contents", []) for part in content.get("parts", [])
+    )
+
+    async def events():
+        async for piece in _respond_stream(prompt):
+            chunk = {"candidates": [{"content": {"role": "model", "parts": [{"text": piece}]}}]}
+            yield f"data: {json.dumps(chunk)}\r\n\r\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.get("/stats")
+async def get_stats():
+    return {**stats, "latency_ms": LATENCY_MS, "jitter_ms": JITTER_MS, "ms_per_1k_tokens": MS_PER_1K_TOKENS}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Deterministic stub LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=LATENCY_MS)
+    parser.add_argument("--jitter-ms", type=float, default=JITTER_MS)
+    parser.add_argument("--ms-per-1k-tokens", type=float, default=MS_PER_1K_TOKENS)
+    args = parser.parse_args()
+    LATENCY_MS, JITTER_MS, MS_PER_1K_TOKENS = args.latency_ms, args.jitter_ms, args.ms_per_1k_tokens
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
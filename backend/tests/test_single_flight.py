@@ -0,0 +1,89 @@
+"""Tests for utils.single_flight.
+
+    cd backend
+    python -m unittest discover tests
+"""
+import asyncio
+import os
+import sys
+import unittest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from utils.single_flight import SingleFlight  # noqa: E402
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_callers_share_one_execution(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"calls": calls}
+
+        callers = [asyncio.create_task(flight.do("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.assertTrue(flight.is_running("key"))
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        self.assertEqual(calls, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(flight.stats(), {"executions": 1, "coalesced": 2, "in_flight": 0})
+
+    async def test_cancelling_one_caller_keeps_work_for_the_others(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flight.do("key", work))
+        second = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        release.set()
+
+        self.assertEqual(await second, "done")
+        self.assertEqual(flight.executions, 1)
+
+    async def test_caller_after_last_waiter_cancels_starts_fresh_work(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.Event().wait()  # Never finishes; only cancellation ends it
+            await release.wait()
+            return calls
+
+        abandoned = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+        # One loop iteration: the caller unwinds and cancels the work, but the
+        # work itself has not finished and been forgotten yet. Rejoin in that window.
+        await asyncio.sleep(0)
+        self.assertTrue(abandoned.done())
+        rejoined = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertTrue(abandoned.cancelled())
+        self.assertEqual(await rejoined, 2)
+        self.assertEqual(flight.executions, 2)
+        self.assertEqual(flight.in_flight(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable SHA-256 over JSON-serializable parts (dict keys are sorted)"""
+    canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """Small JSON-file cache with size-bounded LRU eviction and optional TTL.
+
+    Each entry is one file named after its key. Writes go to a temp file in
+    the same directory and are moved into place with ``os.replace`` so a
+    reader never sees a partial entry. Reads bump the file's mtime, which is
+    what eviction orders by. Safe to use from worker threads.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        enabled: bool = True,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self._entry_count = 0
+        if enabled:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None when missing, expired or unreadable"""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as cache_file:
+                entry = json.load(cache_file)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        if self.ttl_seconds is not None and time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self.delete(key)
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+        self.hits += 1
+        return entry.get("value")
+
+    def set(self, key: str, value: Any):
+        """Atomically write an entry, then evict old entries if over the limits"""
+        if not self.enabled:
+            return
+        data = json.dumps({"created_at": time.time(), "value": value}, default=str).encode("utf-8")
+        path = self._path(key)
+        with self._lock:
+            self._ensure_totals()
+            previous_size = os.path.getsize(path) if os.path.exists(path) else None
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as temp_file:
+                    temp_file.write(data)
+                os.replace(temp_path, path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+            if previous_size is None:
+                self._entry_count += 1
+            self._total_bytes += len(data) - (previous_size or 0)
+            self._evict_locked()
+
+    def delete(self, key: str):
+        with self._lock:
+            path = self._path(key)
+            try:
+                size = os.path.getsize(path)
+                os.unlink(path)
+            except OSError:
+                return
+            if self._total_bytes is not None:
+                self._total_bytes -= size
+                self._entry_count -= 1
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        return entries
+
+    def _ensure_totals(self):
+        if self._total_bytes is None:
+            entries = self._entries()
+            self._total_bytes = sum(size for _, size, _ in entries)
+            self._entry_count = len(entries)
+
+    def _over_limit(self) -> bool:
+        return self._total_bytes > self.max_bytes or (
+            self.max_entries is not None and self._entry_count > self.max_entries
+        )
+
+    def _evict_locked(self):
+        if not self._over_limit():
+            return
+        # Least recently used first
+        for _, size, name in sorted(self._entries()):
+            if not self._over_limit():
+                break
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            self._total_bytes -= size
+            self._entry_count -= 1
+            self.evictions += 1
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": self._entry_count if self._total_bytes is not None else None,
+            "size_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+        }
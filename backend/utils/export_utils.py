@@ -3,8 +3,8 @@ import json
 from typing import List, Dict
 from io import StringIO
 
-def format_meetings_for_csv(meetings: List[Dict]) -> str:
-    """Format meetings data for CSV export"""
+def format_meetings_for_csv(meetings: List[Dict], include_header: bool = True) -> str:
+    """Format meetings data for CSV export; pages after the first omit the header"""
     output = StringIO()
     
     if not meetings:
@@ -17,7 +17,8 @@ def format_meetings_for_csv(meetings: List[Dict]) -> str:
     ]
     
     writer = csv.DictWriter(output, fieldnames=headers)
-    writer.writeheader()
+    if include_header:
+        writer.writeheader()
     
     for meeting in meetings:
         # Format action items count
@@ -40,8 +41,8 @@ def format_meetings_for_csv(meetings: List[Dict]) -> str:
     
     return output.getvalue()
 
-def format_action_items_for_csv(action_items: List[Dict]) -> str:
-    """Format action items data for CSV export"""
+def format_action_items_for_csv(action_items: List[Dict], include_header: bool = True) -> str:
+    """Format action items data for CSV export; pages after the first omit the header"""
     output = StringIO()
     
     if not action_items:
@@ -54,7 +55,8 @@ def format_action_items_for_csv(action_items: List[Dict]) -> str:
     ]
     
     writer = csv.DictWriter(output, fieldnames=headers)
-    writer.writeheader()
+    if include_header:
+        writer.writeheader()
     
     for item in action_items:
         row = {
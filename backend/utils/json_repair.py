@@ -0,0 +1,244 @@
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+NUMBER_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+BAREWORD_RE = re.compile(r"[A-Za-z_][\w\-]*")
+LITERALS = {"true": True, "false": False, "null": None, "none": None}
+ESCAPES = {'"': '"', "'": "'", "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class JSONRepairError(ValueError):
+    """Raised when no JSON object can be recovered from the text"""
+
+
+class _Truncated(Exception):
+    """The text ended inside a value; ``partial`` is what was complete at that level"""
+
+    def __init__(self, partial: Any = None):
+        self.partial = partial
+
+
+class _LenientParser:
+    """Recursive-descent JSON parser that accepts common LLM mistakes.
+
+    Single quotes, Python literals, bare keys, trailing or missing commas,
+    raw newlines and unescaped quotes inside strings are accepted and
+    counted as fixes. Text that ends mid-value raises ``_Truncated`` with
+    the complete part of the innermost container.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+        self.fixes = 0
+
+    def _skip_ws(self):
+        while self.pos < len(self.text) and self.text[self.pos] in " \t\r\n":
+            self.pos += 1
+
+    def _eof(self) -> bool:
+        return self.pos >= len(self.text)
+
+    def value(self) -> Any:
+        self._skip_ws()
+        if self._eof():
+            raise _Truncated()
+        char = self.text[self.pos]
+        if char == "{":
+            return self.object()
+        if char == "[":
+            return self.array()
+        if char in "\"'":
+            return self.string()
+        number = NUMBER_RE.match(self.text, self.pos)
+        if number:
+            self.pos = number.end()
+            if self._eof():
+                raise _Truncated()
+            raw = number.group()
+            return float(raw) if any(c in raw for c in ".eE") else int(raw)
+        word = BAREWORD_RE.match(self.text, self.pos)
+        if word:
+            self.pos = word.end()
+            if self._eof():
+                raise _Truncated()
+            lowered = word.group().lower()
+            if lowered in LITERALS:
+                if word.group() not in ("true", "false", "null"):
+                    self.fixes += 1
+                return LITERALS[lowered]
+            self.fixes += 1
+            return word.group()
+        # Unknown character - skip it
+        self.fixes += 1
+        self.pos += 1
+        return self.value()
+
+    def string(self) -> str:
+        quote = self.text[self.pos]
+        if quote == "'":
+            self.fixes += 1
+        self.pos += 1
+        chars: List[str] = []
+        while True:
+            if self._eof():
+                raise _Truncated()
+            char = self.text[self.pos]
+            if char == "\\":
+                if self.pos + 1 >= len(self.text):
+                    raise _Truncated()
+                escaped = self.text[self.pos + 1]
+                if escaped == "u" and re.match(r"[0-9a-fA-F]{4}", self.text[self.pos + 2:self.pos + 6]):
+                    chars.append(chr(int(self.text[self.pos + 2:self.pos + 6], 16)))
+                    self.pos += 6
+                    continue
+                chars.append(ESCAPES.get(escaped, escaped))
+                self.pos += 2
+                continue
+            if char == quote:
+                # A quote only closes the string when a delimiter follows it
+                rest = self.text[self.pos + 1:self.pos + 200].lstrip(" \t\r\n")
+                # ...or when the next key starts right after it (missing comma)
+                if not rest or rest[0] in ",:}]" or (quote == '"' and re.match(r'"[^"\n]{1,60}"\s*:', rest)):
+                    self.pos += 1
+                    return "".join(chars)
+                self.fixes += 1
+            elif char in "\r\n":
+                self.fixes += 1
+            chars.append(char)
+            self.pos += 1
+
+    def array(self) -> List:
+        self.pos += 1
+        items: List = []
+        while True:
+            self._skip_ws()
+            if self._eof():
+                raise _Truncated(items)
+            char = self.text[self.pos]
+            if char == "]":
+                self.pos += 1
+                return items
+            if char == ",":
+                self.fixes += 1 if not items else 0
+                self.pos += 1
+                continue
+            if char == "}":
+                # Missing closing bracket
+                self.fixes += 1
+                return items
+            try:
+                items.append(self.value())
+            except _Truncated:
+                # Drop the incomplete element, keep the ones before it
+                raise _Truncated(items)
+            self._skip_ws()
+            if not self._eof() and self.text[self.pos] not in ",]}":
+                self.fixes += 1  # Missing comma
+
+    def object(self) -> Dict:
+        self.pos += 1
+        result: Dict = {}
+        while True:
+            self._skip_ws()
+            if self._eof():
+                raise _Truncated(result)
+            char = self.text[self.pos]
+            if char == "}":
+                self.pos += 1
+                return result
+            if char == ",":
+                self.fixes += 1 if not result else 0
+                self.pos += 1
+                continue
+            if char == "]":
+                self.fixes += 1
+                self.pos += 1
+                continue
+            if char in "\"'":
+                try:
+                    key = self.string()
+                except _Truncated:
+                    raise _Truncated(result)
+            else:
+                word = BAREWORD_RE.match(self.text, self.pos)
+                if not word:
+                    self.fixes += 1
+                    self.pos += 1
+                    continue
+                self.fixes += 1
+                key = word.group()
+                self.pos = word.end()
+            self._skip_ws()
+            if self._eof():
+                raise _Truncated(result)
+            if self.text[self.pos] == ":":
+                self.pos += 1
+            else:
+                self.fixes += 1
+            try:
+                result[key] = self.value()
+            except _Truncated as truncated:
+                self.truncated_key = key
+                raise _Truncated(result) from truncated
+            self._skip_ws()
+            if not self._eof() and self.text[self.pos] not in ",}":
+                self.fixes += 1  # Missing comma
+
+
+def _strip_fences(text: str) -> str:
+    fenced = re.search(r"```(?:json)?\s*(.*?)(?:```|$)", text, re.DOTALL | re.IGNORECASE)
+    return fenced.group(1) if fenced else text
+
+
+def repair_json(text: str) -> Tuple[Dict, Dict]:
+    """Recover the JSON object in model output, repairing it if needed.
+
+    Returns the object and a report: ``repaired`` (anything had to be
+    fixed), ``fixes`` (how many), ``truncated`` (the text ended before the
+    object closed) and ``truncated_keys`` (top-level keys whose value was
+    cut off). A cut-off array keeps its complete elements; any other
+    cut-off value is dropped.
+    """
+    text = _strip_fences(text)
+    start = text.find("{")
+    if start == -1:
+        raise JSONRepairError("No JSON object found in response")
+
+    end = text.rfind("}")
+    if end > start:
+        try:
+            result = json.loads(text[start:end + 1])
+            if isinstance(result, dict):
+                return result, {"repaired": False, "fixes": 0, "truncated": False, "truncated_keys": []}
+        except ValueError:
+            pass
+
+    parser = _LenientParser(text[start:])
+    truncated_keys: List[str] = []
+    try:
+        result = parser.object()
+        truncated = False
+    except _Truncated as truncation:
+        result = truncation.partial if isinstance(truncation.partial, dict) else {}
+        truncated = True
+        key: Optional[str] = getattr(parser, "truncated_key", None)
+        if key is not None:
+            inner = truncation.__cause__
+            # Keep the complete elements of a cut-off top-level list
+            if isinstance(inner, _Truncated) and isinstance(inner.partial, list):
+                result[key] = inner.partial
+            else:
+                result.pop(key, None)
+            truncated_keys.append(key)
+
+    if not result:
+        raise JSONRepairError("Could not recover any fields from the response")
+    return result, {
+        "repaired": True,
+        "fixes": parser.fixes,
+        "truncated": truncated,
+        "truncated_keys": truncated_keys,
+    }
+
@@ -0,0 +1,155 @@
+import json
+from typing import Any, List, Optional, Tuple
+
+WHITESPACE = " \t\r\n"
+
+
+class IncrementalJSONParser:
+    """Pick completed values out of a JSON object while it is still being generated.
+
+    Feed text as it arrives; ``feed`` returns the events completed by that
+    text, in order:
+
+    - ``("field", key, value)`` when a top-level value that is not an array
+      is closed (e.g. ``title`` or ``summary``)
+    - ``("item", key, value)`` for each element of a top-level array as soon
+      as that element is closed (e.g. one action item)
+
+    Anything before the first ``{`` (such as a Markdown fence) is skipped.
+    The scanner only tracks nesting and string state, so a value is parsed
+    once, when it closes. Malformed values are skipped; the caller still
+    parses the full text at the end.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.pos = 0
+        self.depth = 0
+        self.started = False
+        self.finished = False
+        self.in_string = False
+        self.escape = False
+        # Top-level (depth 1) state
+        self.expect = "key"  # key | colon | value | comma
+        self.key: Optional[str] = None
+        self.key_start: Optional[int] = None
+        self.value_start: Optional[int] = None
+        self.value_kind: Optional[str] = None  # string | primitive | object | array
+        # Array element (depth 2) state
+        self.element_start: Optional[int] = None
+        self.element_kind: Optional[str] = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, str, Any]]:
+        events: List[Tuple[str, str, Any]] = []
+        self.text += chunk
+        text = self.text
+        for i in range(self.pos, len(text)):
+            if self.finished:
+                break
+            char = text[i]
+
+            if not self.started:
+                if char == "{":
+                    self.started = True
+                    self.depth = 1
+                continue
+
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == "\\":
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+                    self._close_string(i, events)
+                continue
+
+            if char == '"':
+                self.in_string = True
+                if self.depth == 1:
+                    if self.expect == "key":
+                        self.key_start = i
+                    elif self.expect == "value":
+                        self._start_value(i, "string")
+                elif self._in_array() and self.element_start is None:
+                    self.element_start, self.element_kind = i, "string"
+                continue
+
+            if char in WHITESPACE:
+                self._close_primitive(i, events)
+                continue
+
+            if char == ":" and self.depth == 1:
+                self.expect = "value"
+            elif char == ",":
+                self._close_primitive(i, events)
+                if self.depth == 1:
+                    self.expect = "key"
+            elif char in "{[":
+                if self.depth == 1 and self.expect == "value":
+                    self._start_value(i, "object" if char == "{" else "array")
+                elif self._in_array() and self.element_start is None:
+                    self.element_start, self.element_kind = i, "container"
+                self.depth += 1
+            elif char in "}]":
+                self._close_primitive(i, events)
+                self.depth -= 1
+                if self.depth == 2 and self._in_array() and self.element_kind == "container":
+                    self._emit(events, "item", text[self.element_start:i + 1])
+                    self.element_start = self.element_kind = None
+                elif self.depth == 1 and self.value_start is not None:
+                    if self.value_kind == "object":
+                        self._emit(events, "field", text[self.value_start:i + 1])
+                    self._end_value()
+                elif self.depth == 0:
+                    self.finished = True
+            elif self.depth == 1 and self.expect == "value" and self.value_start is None:
+                self._start_value(i, "primitive")
+            elif self._in_array() and self.element_start is None:
+                self.element_start, self.element_kind = i, "primitive"
+
+        self.pos = len(text)
+        return events
+
+    def _in_array(self) -> bool:
+        return self.depth >= 2 and self.value_kind == "array"
+
+    def _start_value(self, index: int, kind: str):
+        self.value_start, self.value_kind = index, kind
+
+    def _end_value(self):
+        self.value_start = self.value_kind = None
+        self.expect = "comma"
+
+    def _close_string(self, index: int, events: List):
+        if self.depth == 1 and self.expect == "key" and self.key_start is not None:
+            try:
+                self.key = json.loads(self.text[self.key_start:index + 1])
+            except ValueError:
+                self.key = None
+            self.key_start = None
+            self.expect = "colon"
+        elif self.depth == 1 and self.value_kind == "string":
+            self._emit(events, "field", self.text[self.value_start:index + 1])
+            self._end_value()
+        elif self.depth == 2 and self._in_array() and self.element_kind == "string":
+            self._emit(events, "item", self.text[self.element_start:index + 1])
+            self.element_start = self.element_kind = None
+
+    def _close_primitive(self, index: int, events: List):
+        """End a number/true/false/null at the delimiter that follows it"""
+        if self.depth == 1 and self.value_kind == "primitive":
+            self._emit(events, "field", self.text[self.value_start:index])
+            self._end_value()
+        elif self.depth == 2 and self._in_array() and self.element_kind == "primitive":
+            self._emit(events, "item", self.text[self.element_start:index])
+            self.element_start = self.element_kind = None
+
+    def _emit(self, events: List, kind: str, raw: str):
+        if self.key is None:
+            return
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return
+        events.append((kind, self.key, value))
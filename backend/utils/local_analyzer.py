@@ -0,0 +1,323 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.transcript_compressor import compress_transcript
+
+SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+TOKEN_RE = re.compile(r"[a-z][a-z0-9']+")
+STOPWORDS = frozenset("""
+a about above after again all also am an and any are aren't as at be because been before being below between both
+but by can can't could couldn't did didn't do does doesn't doing don't down during each few for from further get got
+had hadn't has hasn't have haven't having he he'd he'll he's her here here's hers herself him himself his how how's i
+i'd i'll i'm i've if in into is isn't it it's its itself just let let's like me more most much must mustn't my myself
+need no nor not now of off on once only or other ought our ours ourselves out over own really right same shan't she
+she'd she'll she's should shouldn't so some such than that that's the their theirs them themselves then there there's
+these they they'd they'll they're they've think this those through to too under until up us very was wasn't we we'd
+we'll we're we've were weren't what what's when when's where where's which while who who's whom why why's will with
+won't would wouldn't yeah yes you you'd you'll you're you've your yours yourself yourselves okay ok great thanks thank
+going want wanted go know sure well actually basically maybe one two also said say everyone anything something today
+""".split())
+
+# A sentence commits someone to something: "I'll send...", "Jordan will draft...", "can you...", "let's..."
+COMMITMENT_RE = re.compile(
+    r"\b(?:i|we|you|he|she|they)(?:'ll|'m going to|'re going to| will| shall| need to| have to| must| should| am going to| are going to)\s+"
+    r"|\b(?:can|could|would) you\s+(?:please\s+)?"
+    r"|\blet'?s\s+"
+    r"|\b(?:please|make sure to|remember to)\s+",
+    re.IGNORECASE,
+)
+# Named owner: "Jordan will draft the brief", "Sarah needs to..."
+NAMED_COMMITMENT_RE = re.compile(r"\b([A-Z][a-z]+) (?:will|should|needs to|has to|is going to|is to)\s+")
+# Vocative request: "Sarah, can you send..."
+VOCATIVE_RE = re.compile(r"\b([A-Z][a-z]+),\s+(?:can|could|would|will) you\b")
+AFFIRMATION_RE = re.compile(r"^(?:yes|yeah|yep|sure|absolutely|definitely|will do|ok|okay|of course)\b[,.!]?\s*", re.IGNORECASE)
+LEAD_IN_RE = re.compile(r"^(?:(?:and|so|okay|ok|alright|right|great|also|then|now|yeah|yes|well|basically)\b[,]?\s+)+|^(?:do|does) is\s+", re.IGNORECASE)
+# Running the meeting, not work to track: "let's start with...", "can you walk us through..."
+MEETING_TALK_RE = re.compile(
+    r"\b(?:let'?s (?:start|begin|get started|go over|kick off|move on|wrap up)|walk us through|go over|anything else)\b",
+    re.IGNORECASE,
+)
+
+WEEKDAYS = r"monday|tuesday|wednesday|thursday|friday|saturday|sunday"
+MONTHS = r"jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?"
+DUE_DATE_RE = re.compile(
+    r"\b(?:(?:by|before|until|on|due)\s+)?(?:the\s+)?("
+    r"end of (?:the )?(?:day|week|month|quarter|year)|eod|eow|today|tonight|tomorrow"
+    r"|this (?:morning|afternoon|evening|week|month)"
+    rf"|next (?:week|month|quarter|{WEEKDAYS})|{WEEKDAYS}"
+    rf"|(?:{MONTHS})\.? \d{{1,2}}(?:st|nd|rd|th)?|\d{{1,2}}/\d{{1,2}}(?:/\d{{2,4}})?"
+    r")\b",
+    re.IGNORECASE,
+)
+HIGH_PRIORITY_RE = re.compile(r"\b(?:urgent|urgently|asap|as soon as possible|critical|immediately|top priority|blocker|right away)\b", re.IGNORECASE)
+LOW_PRIORITY_RE = re.compile(r"\b(?:when you get a chance|eventually|nice to have|no rush|low priority|at some point)\b", re.IGNORECASE)
+SOON_RE = re.compile(r"^(?:today|tonight|tomorrow|eod|end of (?:the )?day|this (?:morning|afternoon|evening))$", re.IGNORECASE)
+
+OBJECTION_RE = re.compile(
+    r"\b(?:worried|worry|concern(?:s|ed)?|too (?:expensive|long|slow|complex|complicated|much|risky)|expensive|price increase"
+    r"|can't afford|over budget|hesitant|skeptical|risk(?:y|s)?|issue with|problem with|unhappy|frustrat\w*"
+    r"|did(?:n't| not) (?:work|convert|deliver)|does(?:n't| not) work|not convinced|competitor\w*|push ?back)\b",
+    re.IGNORECASE,
+)
+RESPONSE_RE = re.compile(
+    r"^(?:(?:right|sure|okay|ok|yes|yeah|well|understood)[,.]?\s+)?"
+    r"(?:but|however|we can|we could|we'll|we will|i understand|good point|that's fair|fair point|to address|this time)\b",
+    re.IGNORECASE,
+)
+
+# Time words carry no topic for the title
+TITLE_EXCLUDE = frozenset(
+    f"{WEEKDAYS}|yesterday|tomorrow|morning|afternoon|evening|week|month|year|last|next|time|day|call|meeting".split("|")
+)
+
+# Keeps the dense sentence x term matrix within a few MB for long meetings
+MAX_VOCABULARY = 2000
+
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence.strip() for sentence in SENTENCE_RE.split(text) if sentence.strip()]
+
+
+def _content_tokens(sentence: str) -> List[str]:
+    return [token for token in TOKEN_RE.findall(sentence.lower()) if token not in STOPWORDS]
+
+
+def tfidf_matrix(token_lists: List[List[str]]) -> Tuple[np.ndarray, List[str]]:
+    """L2-normalized sentence x term TF-IDF matrix over the most frequent terms"""
+    frequency: Dict[str, int] = {}
+    for tokens in token_lists:
+        for token in tokens:
+            frequency[token] = frequency.get(token, 0) + 1
+    vocabulary = sorted(frequency, key=lambda token: (-frequency[token], token))[:MAX_VOCABULARY]
+    index = {token: column for column, token in enumerate(vocabulary)}
+
+    rows = [row for row, tokens in enumerate(token_lists) for token in tokens if token in index]
+    columns = [index[token] for tokens in token_lists for token in tokens if token in index]
+    counts = np.zeros((len(token_lists), len(vocabulary)), dtype=np.float32)
+    np.add.at(counts, (np.array(rows, dtype=np.intp), np.array(columns, dtype=np.intp)), 1.0)
+
+    document_frequency = (counts > 0).sum(axis=0)
+    idf = np.log((1 + len(token_lists)) / (1 + document_frequency)).astype(np.float32) + 1.0
+    weights = counts * idf
+    norms = np.linalg.norm(weights, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return weights / norms, vocabulary
+
+
+def textrank(matrix: np.ndarray, damping: float = 0.85, iterations: int = 100, tolerance: float = 1e-5) -> np.ndarray:
+    """PageRank over the cosine-similarity graph of the rows of ``matrix``.
+
+    The similarity matrix is never built: ``S @ x`` is computed as
+    ``M @ (M.T @ x)`` minus the self-similarity, so memory stays O(rows x terms).
+    """
+    count = matrix.shape[0]
+    if count == 0:
+        return np.zeros(0, dtype=np.float32)
+    self_similarity = (matrix * matrix).sum(axis=1)
+
+    def similarity_times(vector: np.ndarray) -> np.ndarray:
+        return matrix @ (matrix.T @ vector) - self_similarity * vector
+
+    out_weight = similarity_times(np.ones(count, dtype=np.float32))
+    connected = out_weight > 1e-9
+    scores = np.full(count, 1.0 / count, dtype=np.float32)
+    for _ in range(iterations):
+        flow = np.where(connected, scores / np.where(connected, out_weight, 1.0), 0.0).astype(np.float32)
+        # Isolated sentences spread their score evenly
+        dangling = scores[~connected].sum() / count
+        updated = (1 - damping) / count + damping * (similarity_times(flow) + dangling)
+        if np.abs(updated - scores).sum() < tolerance:
+            return updated
+        scores = updated
+    return scores
+
+
+def summarize(
+    sentences: List[str], max_sentences: int = 3, redundancy: float = 0.6
+) -> Tuple[List[str], List[str]]:
+    """Top TextRank sentences in their original order, and the top keywords.
+
+    A sentence whose cosine similarity to an already chosen one is at least
+    ``redundancy`` is skipped, so a point repeated in the meeting is not
+    repeated in the summary.
+    """
+    candidates = [index for index, sentence in enumerate(sentences) if len(_content_tokens(sentence)) >= 3]
+    if not candidates:
+        return sentences[:max_sentences], []
+    token_lists = [_content_tokens(sentences[index]) for index in candidates]
+    matrix, vocabulary = tfidf_matrix(token_lists)
+    scores = textrank(matrix)
+    chosen: List[int] = []
+    for index in np.argsort(-scores, kind="stable"):
+        if len(chosen) == max_sentences:
+            break
+        if chosen and float((matrix[chosen] @ matrix[index]).max()) >= redundancy:
+            continue
+        chosen.append(int(index))
+    keyword_weights = matrix.sum(axis=0)
+    keywords = [
+        vocabulary[column] for column in np.argsort(-keyword_weights, kind="stable")
+        if vocabulary[column] not in TITLE_EXCLUDE
+    ][:5]
+    return [sentences[candidates[index]] for index in sorted(chosen)], keywords
+
+
+def _clean_clause(text: str) -> str:
+    text = LEAD_IN_RE.sub("", text.strip()).strip(" ,")
+    text = re.sub(r"[.!?]+$", "", text).strip()
+    return text[:1].upper() + text[1:] if text else text
+
+
+def _possible_name(word: Optional[str], sentence_start: bool) -> Optional[str]:
+    if not word or word.lower() in STOPWORDS or word.lower() in {"i", "we", "you", "they", "he", "she"}:
+        return None
+    return None if sentence_start and word.lower() in {"so", "then", "also", "now"} else word
+
+
+def _due_date(sentence: str) -> Optional[str]:
+    match = DUE_DATE_RE.search(sentence)
+    return match.group(1) if match else None
+
+
+def _priority(sentence: str, due_date: Optional[str]) -> str:
+    if HIGH_PRIORITY_RE.search(sentence) or (due_date and SOON_RE.match(due_date)):
+        return "high"
+    if LOW_PRIORITY_RE.search(sentence):
+        return "low"
+    return "medium"
+
+
+def extract_action_items(sentences: List[str]) -> List[Dict]:
+    """Commitments and requests, with owner, due date and priority where the wording gives them"""
+    items: List[Dict] = []
+    previous_request: Optional[Dict] = None
+    for sentence in sentences:
+        named = NAMED_COMMITMENT_RE.search(sentence)
+        if named is not None and _possible_name(named.group(1), named.start() == 0) is None:
+            named = None  # "That should help"
+        commitment = COMMITMENT_RE.search(sentence)
+        if (named is None and commitment is None) or MEETING_TALK_RE.search(sentence):
+            previous_request = None
+            continue
+        if "?" in sentence and not VOCATIVE_RE.search(sentence) and not re.search(r"\b(?:can|could|would) you\b", sentence, re.IGNORECASE):
+            previous_request = None
+            continue
+
+        due_date = _due_date(sentence)
+        # "Yes, I'll send it by Friday" confirms the request just before it
+        if previous_request is not None and AFFIRMATION_RE.match(sentence):
+            previous_request["due_date"] = previous_request["due_date"] or due_date
+            # The reply often names what "that" was
+            if commitment is not None:
+                confirmed = _clean_clause(sentence[commitment.end():])
+                if len(_content_tokens(confirmed)) > len(_content_tokens(previous_request["task"])):
+                    previous_request["task"] = confirmed[:200]
+            previous_request = None
+            continue
+
+        assignee = None
+        if named is not None and (commitment is None or named.start() <= commitment.start()):
+            assignee = named.group(1)
+            task = sentence[named.end():]
+        else:
+            vocative = VOCATIVE_RE.search(sentence)
+            if vocative is not None:
+                assignee = _possible_name(vocative.group(1), vocative.start() == 0)
+            task = sentence[commitment.end():]
+        task = _clean_clause(task)
+        if len(task.split()) < 2:
+            continue
+
+        item = {
+            "task": task[:200],
+            "assignee": assignee,
+            "due_date": due_date,
+            "priority": _priority(sentence, due_date),
+        }
+        items.append(item)
+        previous_request = item if "?" in sentence or assignee else None
+    return dedupe(items, "task")
+
+
+def extract_objections(sentences: List[str]) -> List[Dict]:
+    """Concerns raised in the meeting, with the reply that follows when it answers them"""
+    objections: List[Dict] = []
+    for index, sentence in enumerate(sentences):
+        if not OBJECTION_RE.search(sentence):
+            continue
+        following = sentences[index + 1] if index + 1 < len(sentences) else ""
+        response = _clean_clause(following) if following and RESPONSE_RE.match(following) else None
+        objections.append({"concern": _clean_clause(sentence)[:200], "response": response[:200] if response else None})
+    return dedupe(objections, "concern")
+
+
+def dedupe(items: List[Dict], key: str, overlap: float = 0.75) -> List[Dict]:
+    """Merge items whose ``key`` texts mostly overlap, keeping the fuller wording and filling in missing fields.
+
+    Overlap is the share of the smaller item's content words found in the
+    other, so "write the tests" and "write the tests for the login page"
+    count as the same item.
+    """
+    kept: List[Dict] = []
+    kept_words: List[set] = []
+    for item in items:
+        words = set(_content_tokens(item[key])) or set(item[key].lower().split())
+        for index, existing in enumerate(kept_words):
+            smaller = min(len(words), len(existing))
+            if smaller and len(words & existing) / smaller >= overlap:
+                merged = kept[index]
+                if len(item[key]) > len(merged[key]):
+                    merged[key] = item[key]
+                    kept_words[index] = words
+                for field, value in item.items():
+                    if merged.get(field) is None and value is not None:
+                        merged[field] = value
+                break
+        else:
+            kept.append(item)
+            kept_words.append(words)
+    return kept
+
+
+def _title(keywords: List[str]) -> str:
+    words = [keyword.capitalize() for keyword in keywords[:3]]
+    if not words:
+        return "Meeting Summary"
+    return words[0] if len(words) == 1 else f"{', '.join(words[:-1])} and {words[-1]}"
+
+
+def _crm_notes(summary: str, action_items: List[Dict], objections: List[Dict]) -> str:
+    notes = [summary] if summary else []
+    if action_items:
+        steps = "; ".join(
+            item["task"] + (f" ({item['assignee']})" if item["assignee"] else "") + (f", due {item['due_date']}" if item["due_date"] else "")
+            for item in action_items[:5]
+        )
+        notes.append(f"Next steps: {steps}.")
+    if objections:
+        notes.append("Concerns raised: " + "; ".join(objection["concern"] for objection in objections[:3]) + ".")
+    return " ".join(notes)
+
+
+def analyze_locally(transcript: str, max_summary_sentences: int = 3) -> Dict:
+    """Analysis in the LLM result's shape, computed without any network call.
+
+    Extractive: the summary is the top TextRank sentences, the title the top
+    TF-IDF keywords, and action items/objections are matched by rules
+    (commitment phrasing, names, due-date expressions, concern wording).
+    """
+    text, _ = compress_transcript(transcript)
+    sentences = split_sentences(text or transcript)
+    summary_sentences, keywords = summarize(sentences, max_summary_sentences)
+    summary = " ".join(summary_sentences)
+    action_items = extract_action_items(sentences)
+    objections = extract_objections(sentences)
+    return {
+        "title": _title(keywords),
+        "summary": summary,
+        "action_items": action_items,
+        "objections": objections,
+        "crm_notes": _crm_notes(summary, action_items, objections),
+    }
@@ -0,0 +1,84 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+
+class MicroBatcher:
+    """Group async submissions that arrive close together into one batch call.
+
+    A batch is processed when ``max_size`` items are waiting or
+    ``max_delay`` seconds after its first item arrived, whichever comes
+    first. ``process`` receives the items and returns one result per item,
+    in order; a result that is an exception is raised to that item's
+    caller only. A caller that is cancelled leaves its batch running for
+    the others.
+    """
+
+    def __init__(self, process: Callable[[List[Any]], Awaitable[List[Any]]], max_size: int, max_delay: float):
+        self.process = process
+        self.max_size = max(1, max_size)
+        self.max_delay = max(0.0, max_delay)
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.items = 0
+        self.size_flushes = 0
+        self.delay_flushes = 0
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_size:
+            self._flush("size")
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush, "delay")
+        return await future
+
+    def _flush(self, reason: str):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self.batches += 1
+        self.items += len(batch)
+        if reason == "size":
+            self.size_flushes += 1
+        else:
+            self.delay_flushes += 1
+        task = asyncio.create_task(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]):
+        try:
+            try:
+                results = await self.process([item for item, _ in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError(f"Batch returned {len(results)} results for {len(batch)} items")
+            except Exception as e:
+                results = [e] * len(batch)
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue  # The caller gave up
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            # Cancelled (e.g. at shutdown) before resolving - don't leave callers waiting forever
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    def stats(self) -> Dict:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "size_flushes": self.size_flushes,
+            "delay_flushes": self.delay_flushes,
+            "pending": len(self._pending),
+        }
@@ -0,0 +1,38 @@
+import base64
+import json
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# A keyset position: the (created_at, id) of the last row already returned
+Cursor = Tuple[datetime, int]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor token was not issued by this API or is corrupted"""
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Opaque URL-safe token for the position after this row"""
+    payload = json.dumps({"c": created_at.isoformat(), "i": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+def next_page(rows: List[Dict], limit: int) -> Tuple[List[Dict], Optional[str]]:
+    """Trim rows fetched with ``limit + 1`` to the page, with the cursor for the following page.
+
+    The extra row only signals that there is more; no cursor is returned
+    on the last page.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(page[-1]["created_at"], page[-1]["id"])
@@ -0,0 +1,59 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """Coalesce concurrent async calls that share a key into one execution.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it runs await the same task. Each caller waits through
+    ``asyncio.shield`` so cancelling one of them does not cancel the shared
+    work for the others. When every caller has gone away before the work
+    finishes, the task is cancelled.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, Dict] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        call = self._calls.get(key)
+        if call is None:
+            task = asyncio.create_task(factory())
+            call = {"task": task, "waiters": 0}
+            self._calls[key] = call
+            task.add_done_callback(lambda _, key=key, call=call: self._forget(key, call))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+
+        call["waiters"] += 1
+        try:
+            return await asyncio.shield(call["task"])
+        finally:
+            call["waiters"] -= 1
+            if call["waiters"] == 0 and not call["task"].done():
+                # Nobody is waiting for the result anymore. Unregister before
+                # cancelling: the task only finishes (and _forget runs) on a
+                # later loop iteration, and a caller arriving in between must
+                # start fresh work rather than join the cancelled task.
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                call["task"].cancel()
+
+    def _forget(self, key: str, call: Dict):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        task = call["task"]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved so an unawaited failure is not logged
+
+    def is_running(self, key: str) -> bool:
+        return key in self._calls
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> Dict:
+        return {"executions": self.executions, "coalesced": self.coalesced, "in_flight": self.in_flight()}
@@ -0,0 +1,122 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Hesitation sounds Whisper transcribes verbatim
+FILLER_RE = re.compile(r",?\s*\b(?:mm-hmm|uh-huh|u+h+|u+m+|e+r+m*|a+h+|h+m+|m+h*m+)\b[,.]?", re.IGNORECASE)
+# Discourse markers, only where commas set them off as asides: "it was, you know, fine"
+ASIDE_RE = re.compile(r",\s*(?:you know|i mean|like|basically|sort of|kind of)\s*,\s*", re.IGNORECASE)
+# ...or where they open a sentence: "So, you know, we should..."
+OPENER_RE = re.compile(
+    r"(^|[.!?]\s+)(?:(?:so|well|okay|ok|like|you know|i mean|basically|anyway)\s*,\s*)+",
+    re.IGNORECASE,
+)
+# Non-speech tags and hallucinations from silent stretches
+ARTIFACT_RE = re.compile(
+    r"\[[^\]]{0,40}\]|\((?:music|silence|inaudible|laughter|laughs|noise|applause|crosstalk)\)",
+    re.IGNORECASE,
+)
+SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for English)"""
+    return len(text) // 4
+
+
+def _capitalize_first(text: str) -> str:
+    for index, char in enumerate(text):
+        if char.isalpha():
+            return text[:index] + char.upper() + text[index + 1:]
+    return text
+
+
+def _drop_repeats(text: str, max_ngram: int = 4) -> str:
+    """Remove immediate repeats of 1-4 word phrases ("the the", "I think I think")"""
+    tokens = text.split()
+    keys = [token.lower().strip(",.!?;:") for token in tokens]
+    kept: List[str] = []
+    i = 0
+    while i < len(tokens):
+        for n in range(max_ngram, 0, -1):
+            if keys[i:i + n] == keys[i + n:i + 2 * n] and len(keys[i:i + n]) == n and all(keys[i:i + n]):
+                # Skip the first copy, but keep its spelling if the second only differs in punctuation
+                j = i + n
+                while keys[j:j + n] == keys[i:i + n] and j + n <= len(tokens):
+                    j += n
+                tokens[j - n:j - 1] = tokens[i:i + n - 1]
+                i = j - n
+                break
+        kept.append(tokens[i])
+        i += 1
+    return " ".join(kept)
+
+
+def _words(sentence: str) -> set:
+    return set(WORD_RE.findall(sentence.lower()))
+
+
+def _collapse_near_duplicates(sentences: List[str], similarity: float) -> Tuple[List[str], int]:
+    """Drop a sentence that repeats the one before it (word-set Jaccard >= ``similarity``)"""
+    kept: List[str] = []
+    kept_words: Optional[set] = None
+    dropped = 0
+    for sentence in sentences:
+        words = _words(sentence)
+        if kept and kept_words is not None and words:
+            union = words | kept_words
+            if len(words & kept_words) / len(union) >= similarity:
+                # Keep whichever wording carries more
+                if len(sentence) > len(kept[-1]):
+                    kept[-1] = sentence
+                    kept_words = words
+                dropped += 1
+                continue
+        kept.append(sentence)
+        kept_words = words
+    return kept, dropped
+
+
+def compress_transcript(
+    transcript: str,
+    remove_disfluencies: bool = True,
+    dedupe_similarity: float = 0.85,
+) -> Tuple[str, Dict]:
+    """Shrink an ASR transcript before it goes into a prompt.
+
+    Normalizes whitespace, strips non-speech artifacts and (optionally)
+    fillers, asides and stutters, then collapses consecutive near-duplicate
+    sentences. Returns the compressed text and before/after token counts.
+    """
+    text = ARTIFACT_RE.sub(" ", transcript)
+    text = " ".join(text.split())
+
+    if remove_disfluencies:
+        opener = lambda match: match.group(1)
+        text = OPENER_RE.sub(opener, text)
+        text = FILLER_RE.sub(" ", text)
+        text = ASIDE_RE.sub(" ", text)
+        # Removing fillers can expose another opener ("Uh, so, ...")
+        text = OPENER_RE.sub(opener, " ".join(text.split()))
+        text = _drop_repeats(text)
+
+    # Tidy what the removals left behind
+    text = re.sub(r"\s+([,.!?;:])", r"\1", text)
+    text = re.sub(r"([,;:])(?:\s*[,;:])+", r"\1", text)
+    text = re.sub(r"(^|[.!?]\s+),\s*", r"\1", text)
+    text = " ".join(text.split())
+
+    sentences = [_capitalize_first(sentence) for sentence in SENTENCE_RE.split(text) if sentence.strip(" ,")]
+    dropped = 0
+    if dedupe_similarity < 1.0:
+        sentences, dropped = _collapse_near_duplicates(sentences, dedupe_similarity)
+    compressed = " ".join(sentences)
+
+    tokens_before = estimate_tokens(transcript)
+    tokens_after = estimate_tokens(compressed)
+    return compressed, {
+        "tokens_before": tokens_before,
+        "tokens_after": tokens_after,
+        "reduction": round(1 - tokens_after / tokens_before, 3) if tokens_before else 0.0,
+        "duplicate_sentences_dropped": dropped,
+    }
@@ -0,0 +1,58 @@
+import os
+import hashlib
+from typing import Dict, Optional
+
+import aiofiles
+from fastapi import UploadFile
+
+# Read/write uploads in fixed-size chunks so memory stays flat for any file size
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))  # 1MB
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_MB", "200")) * 1024 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload exceeds the configured size limit"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        super().__init__(f"File exceeds the {max_bytes // (1024 * 1024)}MB upload limit")
+
+
+async def spool_upload(
+    file: UploadFile,
+    dest_path: str,
+    max_bytes: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> Dict:
+    """Stream an uploaded file to disk chunk by chunk.
+
+    The size limit is enforced while streaming and the SHA-256 of the
+    content is computed on the fly. A partially written file is removed
+    if the limit is hit or the copy fails.
+    """
+    max_bytes = max_bytes or MAX_UPLOAD_BYTES
+    chunk_size = chunk_size or UPLOAD_CHUNK_SIZE
+
+    # Reject early when the client already told us the size
+    if file.size is not None and file.size > max_bytes:
+        raise UploadTooLargeError(max_bytes)
+
+    sha256 = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(dest_path, "wb") as out_file:
+            while True:
+                chunk = await file.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(max_bytes)
+                sha256.update(chunk)
+                await out_file.write(chunk)
+    except BaseException:
+        if os.path.exists(dest_path):
+            os.unlink(dest_path)
+        raise
+
+    return {"size": size, "sha256": sha256.hexdigest()}
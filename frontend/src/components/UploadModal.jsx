@@ -13,6 +13,7 @@ const UploadModal = ({ isOpen, onClose }) => {
   const [uploadProgress, setUploadProgress] = useState(0)
   const [uploadStatus, setUploadStatus] = useState("idle") // idle, uploading, processing, success, error
   const [processingStage, setProcessingStage] = useState("") // For detailed progress during processing
+  const [partialTranscript, setPartialTranscript] = useState("") // Live transcript from the job event stream
   const [estimatedTimeRemaining, setEstimatedTimeRemaining] = useState(null)
   const [validationError, setValidationError] = useState("")
   const [startTime, setStartTime] = useState(null)
@@ -76,19 +77,49 @@ const UploadModal = ({ isOpen, onClose }) => {
     return `${mins}:${secs.toString().padStart(2, '0')}`
   }
 
+  // Real progress from the audio job event stream
+  const jobStageLabels = {
+    queued: "Waiting in queue...",
+    transcribing: "Transcribing audio...",
+    analyzing: "Analyzing transcript content...",
+    saving: "Saving meeting...",
+  }
+
+  const handleJobEvent = useCallback((eventName, data) => {
+    if (eventName === "stage" && jobStageLabels[data.stage]) {
+      setProcessingStage(jobStageLabels[data.stage])
+    } else if (eventName === "model_loading") {
+      setProcessingStage("Loading audio processing models...")
+    } else if (eventName === "segment") {
+      setPartialTranscript((previous) => `${previous} ${data.text}`.trim())
+    } else if (eventName === "provisional") {
+      // Quick local analysis - replaced by the model's result when it arrives
+      setProcessingStage(`Analyzing: ${data.title} (preliminary)`)
+    } else if (eventName === "partial") {
+      // Streamed analysis - show what has been extracted so far
+      if (data.key === "title") {
+        setProcessingStage(`Analyzing: ${data.value}`)
+      } else if (data.kind === "item" && data.key === "action_items") {
+        setProcessingStage(`Analyzing... found action item: ${data.value.task}`)
+      }
+    }
+  }, [])
+
   const uploadMutation = useMutation({
-    mutationFn: ({ data, onProgress }) => uploadTranscript(data, onProgress),
-    onMutate: () => {
+    mutationFn: ({ data, onProgress }) => uploadTranscript(data, onProgress, handleJobEvent),
+    onMutate: ({ data }) => {
       setUploadProgress(5)
       setProcessingStage("Uploading file...")
       setEstimatedTimeRemaining(180)
       const timer = startTimer()
       setTimerRef(timer)
       
-      // Start realistic progress simulation after initial upload
-      setTimeout(() => {
-        simulateProcessingProgress()
-      }, 2000)
+      // Audio jobs report real stages; text uploads still use the simulated progress
+      if (data.type === "text") {
+        setTimeout(() => {
+          simulateProcessingProgress()
+        }, 2000)
+      }
     },
     onSuccess: (data) => {
       console.log("Upload successful:", data)
@@ -136,6 +167,7 @@ const UploadModal = ({ isOpen, onClose }) => {
     setStartTime(null)
     setIsDragOver(false)
     setProcessingStage("")
+    setPartialTranscript("")
     setEstimatedTimeRemaining(0)
     
     if (timerRef) {
@@ -306,6 +338,12 @@ const UploadModal = ({ isOpen, onClose }) => {
                     </div>
                   )}
                   
+                  {partialTranscript && (
+                    <p className="max-h-24 overflow-y-auto rounded bg-gray-50 p-2 text-xs text-gray-700">
+                      {partialTranscript.slice(-600)}
+                    </p>
+                  )}
+                  
                   <div className="flex justify-between items-center">
                     <span>Progress: {uploadProgress.toFixed(0)}%</span>
                     {estimatedTimeRemaining > 0 && (
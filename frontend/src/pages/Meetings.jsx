@@ -1,33 +1,46 @@
 "use client"
 
-import { useState } from "react"
-import { useQuery } from "@tanstack/react-query"
+import { useEffect, useState } from "react"
+import { keepPreviousData, useQuery } from "@tanstack/react-query"
 import { Search, Download } from "lucide-react"
 import MeetingCard from "../components/MeetingCard"
-import { fetchAllMeetings } from "../services/api"
+import { exportMeetings, fetchAllMeetings, fetchMeetingById } from "../services/api"
 import { exportToJSON } from "../utils/exportUtils"
 
 const Meetings = () => {
   const [searchTerm, setSearchTerm] = useState("")
+  const [debouncedSearch, setDebouncedSearch] = useState("")
   const [filterBy, setFilterBy] = useState("all")
 
+  // Search on the server once typing pauses
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(searchTerm.trim()), 300)
+    return () => clearTimeout(timer)
+  }, [searchTerm])
+
   const { data: meetings = [], isLoading, error } = useQuery({
-    queryKey: ["allMeetings"],
-    queryFn: fetchAllMeetings,
+    queryKey: ["allMeetings", debouncedSearch],
+    queryFn: () => fetchAllMeetings(debouncedSearch),
+    placeholderData: keepPreviousData,
   })
 
-  const filteredMeetings = meetings.filter((meeting) => {
-    const matchesSearch =
-      meeting.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      meeting.summary.toLowerCase().includes(searchTerm.toLowerCase())
-
-    if (filterBy === "all") return matchesSearch
+  const filteredMeetings = meetings.filter(() => {
+    if (filterBy === "all") return true
     // Add more filter logic here
-    return matchesSearch
+    return true
   })
 
-  const handleExport = () => {
-    exportToJSON(filteredMeetings, "meetings-export.json")
+  // The list only holds the fields the cards render - export full records
+  const handleExport = async () => {
+    try {
+      const fullMeetings = debouncedSearch
+        ? await Promise.all(filteredMeetings.map((meeting) => fetchMeetingById(meeting.id)))
+        : await exportMeetings("json")
+      exportToJSON(fullMeetings, "meetings-export.json")
+    } catch (error) {
+      console.error("Export failed:", error)
+      alert("Export failed. Please try again.")
+    }
   }
 
   return (
@@ -80,7 +93,12 @@ const Meetings = () => {
       ) : (
         <div className="grid gap-4 sm:gap-6">
           {filteredMeetings.length > 0 ? (
-            filteredMeetings.map((meeting) => <MeetingCard key={meeting.id} meeting={meeting} />)
+            filteredMeetings.map((meeting) => (
+              <div key={meeting.id}>
+                <MeetingCard meeting={meeting} />
+                {meeting.snippet && <SearchSnippet snippet={meeting.snippet} />}
+              </div>
+            ))
           ) : (
             <div className="bg-white border border-gray-200 rounded-lg p-6 sm:p-8 text-center">
               <p className="text-gray-500 text-sm sm:text-base">
@@ -94,4 +112,19 @@ const Meetings = () => {
   )
 }
 
+// Render the server's <mark> highlights without injecting HTML
+const SearchSnippet = ({ snippet }) => (
+  <p className="mt-2 px-4 text-sm text-gray-600">
+    {snippet.split(/(<mark>.*?<\/mark>)/g).map((part, index) =>
+      part.startsWith("<mark>") ? (
+        <mark key={index} className="bg-yellow-100 rounded px-0.5">
+          {part.slice(6, -7)}
+        </mark>
+      ) : (
+        part
+      ),
+    )}
+  </p>
+)
+
 export default Meetings
@@ -17,7 +17,7 @@ const api = axios.create({
 });
 
 // ✅ This function handles uploading a transcript as plain text
-export const uploadTranscript = async (data, onProgress = null) => {
+export const uploadTranscript = async (data, onProgress = null, onJobEvent = null) => {
   try {
     const endpoint = data.type === "text" ? "/upload/transcript" : "/upload/audio";
     let payload;
@@ -43,6 +43,11 @@ export const uploadTranscript = async (data, onProgress = null) => {
     }
     
     const response = await api.post(endpoint, payload, config);
+    
+    // Audio uploads are processed in the background - wait for the job result
+    if (data.type !== "text") {
+      return await waitForUploadJob(response.data.job_id, onJobEvent);
+    }
     return response.data;
   } catch (error) {
     console.error("Upload error:", error);
@@ -64,9 +69,67 @@ export const uploadTranscript = async (data, onProgress = null) => {
   }
 }
 
+export const fetchUploadJob = async (jobId) => {
+  const response = await api.get(`/upload/jobs/${jobId}`)
+  return response.data
+}
+
+// Follow an audio upload job over Server-Sent Events and resolve with its UploadResponse.
+// onJobEvent receives ("stage" | "segment" | "provisional" | "partial" | "model_loading" | ..., data) as they happen.
+const waitForUploadJob = (jobId, onJobEvent = null) => {
+  if (typeof EventSource === "undefined") {
+    return pollUploadJob(jobId)
+  }
+  
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(`${API_BASE_URL}/upload/jobs/${jobId}/events`)
+    let finished = false
+    const forward = (eventName) => (event) => {
+      if (onJobEvent) onJobEvent(eventName, JSON.parse(event.data))
+    }
+    
+    ;["stage", "segment", "model_loading", "model_loaded", "provisional", "partial"].forEach((eventName) => {
+      source.addEventListener(eventName, forward(eventName))
+    })
+    source.addEventListener("done", (event) => {
+      finished = true
+      source.close()
+      resolve(JSON.parse(event.data).result)
+    })
+    source.addEventListener("failed", (event) => {
+      finished = true
+      source.close()
+      reject(new Error(JSON.parse(event.data).error || "Audio processing failed"))
+    })
+    source.onerror = () => {
+      if (finished) return
+      // Stream dropped (proxy, restart) - fall back to polling the job status
+      source.close()
+      pollUploadJob(jobId).then(resolve, reject)
+    }
+  })
+}
+
+// Poll an audio upload job until it finishes and return its UploadResponse
+const pollUploadJob = async (jobId, intervalMs = 2000) => {
+  while (true) {
+    const job = await fetchUploadJob(jobId)
+    if (job.stage === "done") {
+      return job.result
+    }
+    if (job.stage === "failed") {
+      throw new Error(job.error || "Audio processing failed")
+    }
+    await new Promise((resolve) => setTimeout(resolve, intervalMs))
+  }
+}
+
+// Only what MeetingCard and the search results render; transcripts come from /meetings/:id
+const MEETING_CARD_FIELDS = "title,summary,action_items,participants,duration"
+
 export const fetchRecentMeetings = async () => {
   try {
-    const response = await api.get("/meetings/recent")
+    const response = await api.get("/meetings/recent", { params: { fields: MEETING_CARD_FIELDS } })
     return response.data
   } catch (error) {
     console.error("Error fetching recent meetings:", error)
@@ -74,9 +137,13 @@ export const fetchRecentMeetings = async () => {
   }
 }
 
-export const fetchAllMeetings = async () => {
+// With a search term the server ranks matches across title, summary, notes and transcript
+export const fetchAllMeetings = async (search = "") => {
   try {
-    const response = await api.get("/meetings")
+    const params = search
+      ? { search, search_mode: "ranked", fields: `${MEETING_CARD_FIELDS},snippet` }
+      : { fields: MEETING_CARD_FIELDS }
+    const response = await api.get("/meetings", { params })
     return response.data
   } catch (error) {
     console.error("Error fetching all meetings:", error)